@@ -3,33 +3,69 @@
 ---OVERVIEW OF RESULT SCRIPT---
 
 This script contain the Beam class that takes inn all other classes, makes instances of them and then control the relevant attributes regarding ULS and SLS.
-First the script import all classes from their respective scripts. Then the the beam class is made with the input from the Input script. This class give out instances based on how the beam is reinforced.
+First the script import the classes that apply for all reinforcement patterns, the rest are imported when the beam needs them. Then the the beam class is made with the input from the Input script. This class give out instances based on how the beam is reinforced.
 The script use if-else sentences to differentiate between ordinary reinforced, prestressed, or both.
-At the end of the script, the results of the ULS and SLS checks are printed based on the results from the Beam class.
+The script can be imported without calculating anything. When the script is run, the main function reads a command:
+    python -m A0_Results run     - the results of the ULS and SLS checks for the beam in the Input script are printed,
+                                   with --cache PATH the beam is kept in a cache file and not calculated again
+    python -m A0_Results sweep   - the Beam class is evaluated for many heights and widths in parallel, and the results printed as CSV,
+                                   or with --store PATH all results are written to a memory-mapped results file
+    python -m A0_Results bench   - the time for the Beam class and the Beam batch class is measured, or with --cubic
+                                   the time for the third degree equation solver for alpha compared with np.roots, or with
+                                   --suite the benchmark suite is run, saved as JSON and compared with a baseline, or
+                                   with --memory the memory for Beam instances and Beam records is measured
+    python -m A0_Results reliability - the failure probability and reliability index for the moment capacity, or with
+                                       --capacity shear for the shear capacity, are found with Monte Carlo simulation
+                                       in parallel, or with --form with FORM and SORM
+    python -m A0_Results batch INPUT OUTPUT - beams are read from a CSV or JSON lines file, evaluated with the Beam batch
+                                              class a chunk at a time, and the results written to another CSV or JSON lines file
+    python -m A0_Results sensitivity - the derivatives of the utilization degrees with respect to the inputs are printed
+                                       as a table, found with dual numbers (ordinary reinforcement)
+    python -m A0_Results serve   - a local HTTP service answers beams sent as JSON, where requests that arrive close in
+                                   time are evaluated together as one batch in a pool of worker processes
 
 '''
 
+from importlib import import_module
+
 from A0_Input import Input # From the Input script, import the Input class (for all reinforcement patterns)
-from B0_Material import Material # From the Material script, import the Material Class (for all reinforcement patterns)
+from B0_Material import get_material # From the Material script, import the function that gives shared Material records (for all reinforcement patterns)
 from B0_Cross_section import Cross_section # From the Cross section script, import the Cross section class (for all reinforcement patterns)
 from B0_Load import Load_properties # From the Load script, import the Load properties class (for all reinforcement patterns)
-from C1_ULS import ULS # From the ULS script, import the ULS class (for ordinary reinforcement)
-from D1_Reinforcement import Reinforcement_control # From the Reinforcement script import the Reinforcement control class(for ordinary reinforcement)
-from E1_SLS_Crack import Crack_control # From the SLS Crack script, import the Crack Control class (for ordinary reinforcement)
-from F1_SLS_Deflection import Deflection # From the SLS Deflection script, import the Deflection class (for ordinary reinforcement)
 from B0_Creep_number import Creep_number # From the Creep Number script, import the Creep Number CLass (for all reinforcment patterns)
-from D2_Reinforcement import Reinforcement_control_prestressed # From the Reinforcemnt script, import the Reinforcement control prestressed class (for prestressed reinforcement)
-from E2_SLS_Crack import Crack_control_prestressed # From the SLS Crack script, import the Crack Control prestressed class (for prestressed reinforcement)
-from F2_SLS_Deflection import Deflection_prestressed # From the SLS Deflection script, import the Deflection prestressed class (for prestressed reinforcement)
-from H2_SLS_Uncracked import Uncracked_stress # From the SLS Uncracked script, import the Uncracked stress class (for prestressed reinforcement)
-from H3_SLS_Uncracked import Uncracked_stress_prestress_and_ordinary # From the SLS Uncracked script, import the Uncracked stress class (for prestressed and ordinary reinforcement)
-from G2_SLS_Cracked import Cracked_Stress # From the SLS Cracked script, import the Cracked stress class (for prestressed reinforcement)
-from I2_SLS_Stress import Stress # Fromt the SLS Stress script, import the Stress class (for prestressed reinforcement)
-from J2_Time_effects import time_effects # From the Time effects script, import the Time effects class (for prestressed reinforcement)
-from C2_ULS import ULS_prestressed # From the ULS script, import the ULS prestressed class (for prestressed reinforcement)
-from C3_ULS import ULS_prestress_and_ordinary # From the ULS script, import the ULS prestressed and ordinary class (for prestressed with ordinary reinforcement)
+from F1_SLS_Deflection import Deflection # From the SLS Deflection script, import the Deflection class (for all reinforcement patterns)
+
+# The classes that only apply for one reinforcement pattern are imported when the Beam class needs them, so a beam
+# only imports the scripts for its own reinforcement. The dictionary gives the script for each class.
+lazy_classes = {'ULS': 'C1_ULS', # ULS class (for ordinary reinforcement)
+                'Reinforcement_control': 'D1_Reinforcement', # Reinforcement control class (for ordinary reinforcement)
+                'Crack_control': 'E1_SLS_Crack', # Crack Control class (for ordinary reinforcement)
+                'Reinforcement_control_prestressed': 'D2_Reinforcement', # Reinforcement control prestressed class (for prestressed reinforcement)
+                'Crack_control_prestressed': 'E2_SLS_Crack', # Crack Control prestressed class (for prestressed reinforcement)
+                'Deflection_prestressed': 'F2_SLS_Deflection', # Deflection prestressed class (for prestressed reinforcement)
+                'Uncracked_stress': 'H2_SLS_Uncracked', # Uncracked stress class (for prestressed reinforcement)
+                'Uncracked_stress_prestress_and_ordinary': 'H3_SLS_Uncracked', # Uncracked stress class (for prestressed and ordinary reinforcement)
+                'Cracked_Stress': 'G2_SLS_Cracked', # Cracked stress class (for prestressed reinforcement)
+                'Stress': 'I2_SLS_Stress', # Stress class (for prestressed reinforcement)
+                'time_effects': 'J2_Time_effects', # Time effects class (for prestressed reinforcement)
+                'ULS_prestressed': 'C2_ULS', # ULS prestressed class (for prestressed reinforcement)
+                'ULS_prestress_and_ordinary': 'C3_ULS'} # ULS prestressed and ordinary class (for prestressed with ordinary reinforcement)
 
 
+def __getattr__(name: str):
+    ''' Function that imports a class from lazy_classes the first time it is used from this script, so
+    "from A0_Results import ULS" still works.
+    Args:
+        name(str):  name of the class
+    Returns:
+        the class
+    Raises:
+        AttributeError:  if the name is not a class in lazy_classes
+    '''
+    if name in lazy_classes:
+        return getattr(import_module(lazy_classes[name]), name)
+    raise AttributeError(f'module {__name__} has no attribute {name}')
+
 class Beam:
     ''' Class to contain all beam checks related to ULS and SLS.
     '''
@@ -72,7 +108,7 @@ class Beam:
         '''
         # Defines the instances that is common for all cases of reinforcement
 
-        self.material_instance = Material(input.concrete_class, (float(input.steel_class[1:4])), input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter)
+        self.material_instance = get_material(input.concrete_class, (float(input.steel_class[1:4])), input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter)
         self.cross_section_instance = Cross_section(input.width, input.height, input.nr_ordinary_reinforcement_bars, input.ordinary_reinforcement_diameter, input.stirrup_diameter,
                                                     input.exposure_class, input.prestressed_reinforcment_diameter, input.nr_prestressed_bars, self.material_instance)
         self.load_instance = Load_properties(input.distributed_selfload, input.distributed_liveload, input.beam_length, self.material_instance, self.cross_section_instance)
@@ -83,59 +119,51 @@ class Beam:
         # If the beam is prestressed, the following inctances and attribute apply to all prestressed beams 
 
         if input.is_the_beam_prestressed == True:
-            
-            self.concrete_emission = self.calculate_emissinos_concrete(input)
 
             # If the beam is NOT prestressed with ordinary reinforcement in top, the following inctances and attributes apply to the beam
 
             if input.prestressed_and_ordinary_in_top == False:
-                
+                from H2_SLS_Uncracked import Uncracked_stress
+                from J2_Time_effects import time_effects
+                from F2_SLS_Deflection import Deflection_prestressed
+                from G2_SLS_Cracked import Cracked_Stress
+                from I2_SLS_Stress import Stress
+                from C2_ULS import ULS_prestressed
+                from E2_SLS_Crack import Crack_control_prestressed
+                from D2_Reinforcement import Reinforcement_control_prestressed
+
                 self.prestressed_and_ordinary_in_top = False
                 self.is_the_beam_prestressed = True
+                self.stress_uncracked_instance = Uncracked_stress(self.material_instance, self.cross_section_instance, self.load_instance)
+                self.time_effect_instance = time_effects(self.material_instance, self.cross_section_instance, self.creep_instance, self.stress_uncracked_instance, self.deflection_instance_1, self.load_instance)
                 self.deflection_instance = Deflection_prestressed(self.cross_section_instance, self.material_instance, self.load_instance, self.creep_instance, input.percent_longlasting_liveload,
                                                                   input.beam_length, input.relative_humidity, input.cement_class, self.time_effect_instance)
                 self.stress_cracked_instance = Cracked_Stress(self.material_instance, self.cross_section_instance, self.load_instance, self.deflection_instance, self.time_effect_instance, self.creep_instance)
-                self.stress_uncracked_instance = Uncracked_stress(self.material_instance, self.cross_section_instance, self.load_instance)
-                self.time_effect_instance = time_effects(self.material_instance, self.cross_section_instance, self.creep_instance, self.stress_uncracked_instance, self.deflection_instance_1, self.load_instance)
                 self.stress_instance = Stress(self.material_instance, self.deflection_instance, self.stress_uncracked_instance, self.stress_cracked_instance, self.load_instance, self.time_effect_instance)
                 self.ULS_instance = ULS_prestressed(self.material_instance, self.load_instance, self.cross_section_instance, self.time_effect_instance, input.shear_reinforcement)
                 self.crack_instance = Crack_control_prestressed(self.cross_section_instance, self.load_instance, self.material_instance, input.exposure_class, self.stress_instance, input.ordinary_reinforcement_diameter)
                 self.reinforcement_instance = Reinforcement_control_prestressed(self.cross_section_instance, self.material_instance, self.load_instance, self.ULS_instance, input.shear_reinforcement)
-        
-
-                self.M_control = self.control_M(self.ULS_instance)
-                self.V_control = self.control_V(self.ULS_instance)
-                self.As_control = self.control_As(self.reinforcement_instance)
-                self.Asw_control = self.control_Asw(self.reinforcement_instance)
-                self.crack_control = self.control_crack(self.crack_instance)
-                self.deflection_control = self.control_deflection(self.deflection_instance)
-                self.stress_control = self.control_stress(self.stress_instance)
-                self.ordinary_reinforcement_emission = self.calculate_emissions_ordinary_reinforcement(self.reinforcement_instance, 7700, input)
-                self.prestressed_reinforcement_emission = self.calculate_emissions_prestressed_reinforcement(7810, self.cross_section_instance, input)
-                self.total_emission = round(self.ordinary_reinforcement_emission + self.prestressed_reinforcement_emission + self.concrete_emission, 1)
-                self.printed_emission = f'Total emission is {self.total_emission} kg CO2 eq.'
-                self.cost_concrete = self.get_cost_concrete(input)
 
             # If the beam is prestressed with ordinary reinforcement in top, the following inctances and attributes apply to the beam
                 
             elif input.prestressed_and_ordinary_in_top == True:
-                
+                from H3_SLS_Uncracked import Uncracked_stress_prestress_and_ordinary
+                from J2_Time_effects import time_effects
+                from C3_ULS import ULS_prestress_and_ordinary
+
                 self.is_the_beam_prestressed = True
                 self.prestressed_and_ordinary_in_top = True
                 self.stress_uncracked_instance = Uncracked_stress_prestress_and_ordinary(self.material_instance, self.cross_section_instance, self.load_instance,input.stirrup_diameter,input.ordinary_reinforcement_diameter)
                 self.time_effect_instance = time_effects(self.material_instance, self.cross_section_instance, self.creep_instance, self.stress_uncracked_instance, self.deflection_instance_1, self.load_instance)
                 self.ULS_instance = ULS_prestress_and_ordinary(self.material_instance, self.load_instance, self.cross_section_instance, self.time_effect_instance, input.shear_reinforcement)
-                self.M_control = self.control_M(self.ULS_instance)
-                self.V_control = self.control_V(self.ULS_instance)
-                self.ordinary_reinforcement_emission = self.calculate_emissions_ordinary_reinforcement(self.cross_section_instance, 7700, input)
-                self.prestressed_reinforcement_emission = self.calculate_emissions_prestressed_reinforcement(7810, self.cross_section_instance, input)
-                self.total_emission = round(self.ordinary_reinforcement_emission + self.prestressed_reinforcement_emission + self.concrete_emission, 1)
-                self.printed_emission = f'Total emission is {self.total_emission} kg CO2 eq.'
-                self.cost_concrete = self.get_cost_concrete(input)
     
         # If the beam is NOT prestressed, the following inctances and attributes apply to all ordinary reinforced beams 
                   
         else:
+            from C1_ULS import ULS
+            from D1_Reinforcement import Reinforcement_control
+            from E1_SLS_Crack import Crack_control
+
             self.is_the_beam_prestressed = False
             self.prestressed_and_ordinary_in_top = False
             self.ULS_instance = ULS(self.cross_section_instance, self.material_instance, self.load_instance, input.shear_reinforcement)
@@ -143,21 +171,65 @@ class Beam:
             self.crack_instance= Crack_control(self.cross_section_instance, self.load_instance, self.material_instance, input.exposure_class, self.creep_instance, input.ordinary_reinforcement_diameter)
             self.deflection_instance = self.deflection_instance_1
 
-            self.M_control = self.control_M(self.ULS_instance)
-            self.V_control = self.control_V(self.ULS_instance)
+        self.calculate_results(input)
+
+    def calculate_results(self, input):
+        ''' Function that makes the controls, emissions and costs of the beam from the instances. It is called at the end
+        of __init__, and by the Beam graph class when some of the instances are made again.
+        Args:
+            input:  Instance with all input defined by the user in the Input script
+        '''
+        self.concrete_emission = self.calculate_emissinos_concrete(input)
+        self.cost_concrete = self.get_cost_concrete(input)
+        self.M_control = self.control_M(self.ULS_instance)
+        self.V_control = self.control_V(self.ULS_instance)
+
+        if self.is_the_beam_prestressed == True and self.prestressed_and_ordinary_in_top == False:
+            self.As_control = self.control_As(self.reinforcement_instance)
+            self.Asw_control = self.control_Asw(self.reinforcement_instance)
+            self.crack_control = self.control_crack(self.crack_instance)
+            self.deflection_control = self.control_deflection(self.deflection_instance)
+            self.stress_control = self.control_stress(self.stress_instance)
+            self.ordinary_reinforcement_emission = self.calculate_emissions_ordinary_reinforcement(self.reinforcement_instance, 7700, input)
+            self.prestressed_reinforcement_emission = self.calculate_emissions_prestressed_reinforcement(7810, self.cross_section_instance, input)
+            self.total_emission = round(self.ordinary_reinforcement_emission + self.prestressed_reinforcement_emission + self.concrete_emission, 1)
+
+        elif self.is_the_beam_prestressed == True:
+            self.ordinary_reinforcement_emission = self.calculate_emissions_ordinary_reinforcement(self.cross_section_instance, 7700, input)
+            self.prestressed_reinforcement_emission = self.calculate_emissions_prestressed_reinforcement(7810, self.cross_section_instance, input)
+            self.total_emission = round(self.ordinary_reinforcement_emission + self.prestressed_reinforcement_emission + self.concrete_emission, 1)
+
+        else:
             self.As_control = self.control_As(self.reinforcement_instance)
             self.Asw_control = self.control_Asw(self.reinforcement_instance)
             self.crack_control = self.control_crack(self.crack_instance)
             self.deflection_control = self.control_deflection(self.deflection_instance)
-            self.concrete_emission = self.calculate_emissinos_concrete(input)
             self.ordinary_reinforcement_emission = self.calculate_emissions_ordinary_reinforcement(self.cross_section_instance, 7700, input)
             self.total_emission = round(self.ordinary_reinforcement_emission + self.concrete_emission, 1)
-            self.printed_emission = f'Total emission is {self.total_emission} kg CO2 eq.'
-            self.cost_concrete = self.get_cost_concrete(input)
             self.cost_reinforcement = self.get_cost_ordinary_reinforcement(input, self.cross_section_instance, 7700)
             self.total_cost = round(self.cost_concrete + self.cost_reinforcement, 1)
             self.printed_cost = f'Total cost is {self.total_cost} NOK'
 
+        self.printed_emission = f'Total emission is {self.total_emission} kg CO2 eq.'
+
+    def get_record(self):
+        ''' Function that collects the results of the beam in a Beam record, without the instances
+        Returns:
+            record:  instance for the Beam record class
+        '''
+        from Z0_Record import make_record
+        return make_record(self)
+
+    @classmethod
+    def calculate_record(cls, input):
+        ''' Function that calculates the beam and only keeps the results, so the instances for material, cross section,
+        load etc. are dropped as soon as the results are found. Use this when many beams are kept in memory.
+        Args:
+            input:  Instance with all input defined by the user in the Input script
+        Returns:
+            record:  instance for the Beam record class
+        '''
+        return cls(input).get_record()
 
     def control_M(self, ULS):
         '''Control of moment capacity for the beam
@@ -342,41 +414,240 @@ class Beam:
             return 0
 
 
-# Define the input instance from the Input class
-my_input = Input()
-
-# Define the beam instance from the Beam class
-my_beam = Beam(my_input)
+def print_results(beam: Beam):
+    ''' Function that prints the results of the ULS and SLS checks for a beam
+    Args:
+        beam:  Instance for the Beam class
+    '''
+    # If the beam is prestressed the following will run:
+    if beam.is_the_beam_prestressed == True:
 
-# If the beam is prestressed the following will run:
-if my_beam.is_the_beam_prestressed == True:
+        # If the beam also contain ordinary reinforcment, the next three lines will be printed
+        if beam.prestressed_and_ordinary_in_top == True:
 
-    # If the beam also contain ordinary reinforcment, the next three lines will be printed
-    if my_beam.prestressed_and_ordinary_in_top == True:
+            print(beam.M_control)
+            print(beam.V_control)
+            print(beam.printed_emission)
+        # If the beam do not contain ordinary reinforcement, only prestressed, the next lines will be printed
+        else:
+            print(beam.M_control)
+            print(beam.V_control)
+            print(beam.As_control)
+            print(beam.Asw_control)
+            print(beam.crack_control)
+            print(beam.deflection_control)
+            print(beam.stress_control)
+            print(beam.printed_emission)
 
-        print(my_beam.M_control)
-        print(my_beam.V_control)
-        print(my_beam.printed_emission)
-    # If the beam do not contain ordinary reinforcement, only prestressed, the next lines will be printed
+    # If the beam is NOT prestressed, the follwing lines will be printed
     else:
-        print(my_beam.M_control)
-        print(my_beam.V_control)
-        print(my_beam.As_control)
-        print(my_beam.Asw_control)
-        print(my_beam.crack_control)
-        print(my_beam.deflection_control)
-        print(my_beam.stress_control)
-        print(my_beam.printed_emission)
-
-# If the beam is NOT prestressed, the follwing lines will be printed
-else:
-    print(my_beam.M_control)
-    print(my_beam.V_control)
-    print(my_beam.As_control)
-    print(my_beam.Asw_control)
-    print(my_beam.crack_control)
-    print(my_beam.deflection_control)
-    print(my_beam.printed_emission)
-    print(my_beam.printed_cost)
+        print(beam.M_control)
+        print(beam.V_control)
+        print(beam.As_control)
+        print(beam.Asw_control)
+        print(beam.crack_control)
+        print(beam.deflection_control)
+        print(beam.printed_emission)
+        print(beam.printed_cost)
+
+
+def set_input_fields(input: Input, fields: list) -> Input:
+    ''' Function that changes fields in an Input instance from text on the form name=value
+    Args:
+        input:  Instance for the Input class
+        fields(list):  text on the form name=value, for instance height=600
+    Returns:
+        input:  the same instance with the changed fields
+    Raises:
+        ValueError:  if the text is not on the form name=value, or the field do not exist in the Input class
+    '''
+    for field in fields:
+        name, separator, value = field.partition('=')
+        if not separator or not hasattr(input, name):
+            raise ValueError(f'{field} is not on the form name=value for a field in the Input class')
+        default = getattr(input, name)
+        if isinstance(default, bool):
+            value = value in ('True', 'true', '1')
+        elif isinstance(default, (int, float)):
+            value = float(value)
+        elif value == 'None':
+            value = None
+        setattr(input, name, value)
+    return input
+
+
+def main(argv: list = None):
+    ''' Function that reads the command from the terminal and runs it
+    Args:
+        argv(list):  command and options, as default read from the terminal
+    '''
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='A0_Results', description='ULS and SLS checks for the beam in the Input script')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='print the results for one beam')
+    run.add_argument('--set', nargs='*', default=[], metavar='NAME=VALUE', help='change fields in the Input class')
+    run.add_argument('--cache', default=None, metavar='PATH', help='keep the beam in an SQLite cache file, and use the beam from the file if the input is the same')
+
+    sweep = commands.add_parser('sweep', help='evaluate many heights and widths in parallel, and print the results as CSV')
+    sweep.add_argument('--set', nargs='*', default=[], metavar='NAME=VALUE', help='change fields in the Input class')
+    sweep.add_argument('--heights', nargs=3, type=float, default=[300, 1200, 50], metavar=('START', 'STOP', 'STEP'), help='heights [mm]')
+    sweep.add_argument('--widths', nargs=3, type=float, default=[200, 400, 50], metavar=('START', 'STOP', 'STEP'), help='widths [mm]')
+    sweep.add_argument('--workers', type=int, default=None, help='number of processes, as default one for each core')
+    sweep.add_argument('--chunk-size', type=int, default=64, help='number of beams sent to a process at once')
+    sweep.add_argument('--profile', action='store_true', help='measure the time for each stage of the Beam class, and print the report to stderr after the CSV')
+    sweep.add_argument('--profile-memory', action='store_true', help='also measure the memory allocated in each stage with tracemalloc, which makes the sweep slower. Implies --profile')
+    sweep.add_argument('--store', default=None, metavar='PATH', help='write all results to a .npy results file with the Beam batch class instead of printing CSV')
+    sweep.add_argument('--batch-size', type=int, default=10 ** 5, help='number of beams calculated at once when the results are written to a file')
+
+    bench = commands.add_parser('bench', help='measure the time for the Beam class and the Beam batch class')
+    bench.add_argument('--size', type=int, default=1000, help='number of beams')
+    bench.add_argument('--cubic', action='store_true', help='measure the third degree equation solver for alpha instead, size is the number of equations')
+    bench.add_argument('--memory', action='store_true', help='measure the memory used to keep the results of size beams as Beam instances, Beam records and a structured array')
+    bench.add_argument('--suite', action='store_true', help='run the benchmark suite with micro benchmarks for each class and macro benchmarks for each reinforcement case')
+    bench.add_argument('--sizes', nargs='*', type=int, default=[1, 10 ** 3, 10 ** 6], help='batch sizes in the macro benchmarks of the suite')
+    bench.add_argument('--repeat', type=int, default=5, help='number of runs of each benchmark in the suite')
+    bench.add_argument('--output', default=None, metavar='PATH', help='save the results of the suite as JSON')
+    bench.add_argument('--baseline', default=None, metavar='PATH', help='compare the suite with results saved as JSON, and exit with code 1 if a benchmark is slower')
+    bench.add_argument('--threshold', type=float, default=0.1, help='allowed relative increase of the time before a benchmark is a regression')
+
+    reliability = commands.add_parser('reliability', help='find the reliability index for the moment or shear capacity with Monte Carlo simulation, or with FORM and SORM')
+    reliability.add_argument('--set', nargs='*', default=[], metavar='NAME=VALUE', help='change fields in the Input class')
+    reliability.add_argument('--samples', type=int, default=10 ** 6, help='number of samples')
+    reliability.add_argument('--chunk-size', type=int, default=10 ** 5, help='number of samples evaluated at once')
+    reliability.add_argument('--workers', type=int, default=None, help='number of processes, as default one for each core')
+    reliability.add_argument('--seed', type=int, default=None, help='seed for the random numbers')
+    reliability.add_argument('--capacity', choices=('moment', 'shear'), default='moment', help='capacity in the limit state')
+    reliability.add_argument('--form', action='store_true', help='use FORM and SORM instead of Monte Carlo simulation')
+    batch = commands.add_parser('batch', help='evaluate the beams in a CSV or JSON lines file and write the results to another file')
+    batch.add_argument('input_path', metavar='INPUT', help='CSV or JSON lines file with one beam on each row, the columns are fields in the Input class')
+    batch.add_argument('output_path', metavar='OUTPUT', help='CSV or JSON lines file for the inputs and results')
+    batch.add_argument('--chunk-size', type=int, default=10 ** 4, help='number of beams read and evaluated at once')
+    sensitivity = commands.add_parser('sensitivity', help='print the derivatives of the utilization degrees with respect to the inputs')
+    sensitivity.add_argument('--set', nargs='*', default=[], metavar='NAME=VALUE', help='change fields in the Input class')
+    serve = commands.add_parser('serve', help='answer beams sent as JSON with a local HTTP service')
+    serve.add_argument('--host', default='127.0.0.1', help='address to listen on, as default only this machine')
+    serve.add_argument('--port', type=int, default=8765, help='port to listen on')
+    serve.add_argument('--workers', type=int, default=1, help='number of worker processes')
+    serve.add_argument('--max-delay', type=float, default=5, help='longest time a beam waits for more beams before the batch is evaluated [ms]')
+    serve.add_argument('--max-batch-size', type=int, default=1024, help='largest number of beams in one batch')
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == 'run' and arguments.cache:
+        from Y0_Cache import Beam_cache
+
+        with Beam_cache(arguments.cache) as cache:
+            print_results(cache.evaluate(set_input_fields(Input(), arguments.set)))
+
+    elif arguments.command == 'run':
+        print_results(Beam(set_input_fields(Input(), arguments.set)))
+
+    elif arguments.command == 'sweep':
+        import copy
+        import numpy as np
+        from N0_Sweep import run_sweep
+
+        base = set_input_fields(Input(), arguments.set)
+        heights = np.arange(arguments.heights[0], arguments.heights[1] + arguments.heights[2] / 2, arguments.heights[2])
+        widths = np.arange(arguments.widths[0], arguments.widths[1] + arguments.widths[2] / 2, arguments.widths[2])
+
+        def inputs():
+            for width in widths:
+                for height in heights:
+                    input = copy.copy(base)
+                    input.width, input.height = float(width), float(height)
+                    yield input
+
+        if arguments.store:
+            from U0_Results_store import write_sweep
+
+            grid_widths, grid_heights = (grid.ravel() for grid in np.meshgrid(widths, heights, indexing='ij'))
+            base_columns = vars(base)
+
+            def batches():
+                for start in range(0, len(grid_widths), arguments.batch_size):
+                    yield {**base_columns, 'width': grid_widths[start:start + arguments.batch_size], 'height': grid_heights[start:start + arguments.batch_size]}
+
+            store = write_sweep(arguments.store, batches(), len(grid_widths))
+            print(f'Wrote {store.size} beams to {store.path} in {store.wall_time:.2f} s')
+            return
+
+        print('width,height,M_utilization,V_utilization,total_emission')
+        sweep = run_sweep(inputs(), arguments.workers, arguments.chunk_size, profile=arguments.profile or arguments.profile_memory,
+                          records=True, profile_memory=arguments.profile_memory)
+        for input, record in zip(inputs(), sweep):
+            print(f'{input.width},{input.height},{record.M_utilization},{record.V_utilization},{record.total_emission}')
+        if sweep.profile is not None:
+            import sys
+            from contextlib import redirect_stdout
+            with redirect_stdout(sys.stderr):
+                sweep.profile.print_report()
+
+    elif arguments.command == 'bench':
+        from O0_Benchmark import run_benchmark, run_cubic_benchmark, run_memory_benchmark, run_suite, save_suite, load_suite, compare_suites, print_suite
+        if arguments.memory:
+            run_memory_benchmark(arguments.size)
+        elif arguments.suite:
+            baseline = load_suite(arguments.baseline) if arguments.baseline else None
+            suite = run_suite(tuple(arguments.sizes), arguments.repeat)
+            comparison = compare_suites(suite, baseline, arguments.threshold) if baseline else None
+            print_suite(suite, comparison)
+            if arguments.output:
+                save_suite(suite, arguments.output)
+            if comparison:
+                regressions = [name for name, result in comparison.items() if result['status'] == 'regression']
+                print(f'{len(regressions)} of {len(comparison)} benchmarks are more than {arguments.threshold:.0%} slower than the baseline')
+                if regressions:
+                    raise SystemExit(1)
+        elif arguments.cubic:
+            run_cubic_benchmark(arguments.size)
+        else:
+            run_benchmark(arguments.size)
+
+    elif arguments.command == 'reliability' and arguments.form:
+        from R0_FORM import run_form
+
+        result = run_form(set_input_fields(Input(), arguments.set), capacity=arguments.capacity)
+        print(f'Iterations: {result.iterations}, converged: {bool(result.converged[0])}, time: {result.wall_time:.3f} s')
+        print(f'FORM: reliability index {result.beta[0]:.3f}, failure probability {result.p_f[0]:.3e}')
+        print(f'SORM: reliability index {result.beta_sorm[0]:.3f}, failure probability {result.p_f_sorm[0]:.3e}')
+        print('Design point: ' + ', '.join(f'{name}={value[0]:.4g}' for name, value in result.design_point.items()))
+
+    elif arguments.command == 'reliability':
+        from P0_Reliability import run_reliability
+
+        result = run_reliability(set_input_fields(Input(), arguments.set), arguments.samples, arguments.chunk_size, arguments.workers,
+                                 arguments.seed, capacity=arguments.capacity)
+        print(f'Samples: {result.samples}, failures: {result.failures}, time: {result.wall_time:.2f} s')
+        print(f'Failure probability: {result.p_f:.3e}, {result.confidence:.0%} interval [{result.p_f_interval[0]:.3e}, {result.p_f_interval[1]:.3e}]')
+        print(f'Reliability index: {result.beta:.3f}, {result.confidence:.0%} interval [{result.beta_interval[0]:.3f}, {result.beta_interval[1]:.3f}]')
+
+    elif arguments.command == 'batch':
+        import sys
+        from V0_Input_reader import evaluate_file
+
+        try:
+            summary = evaluate_file(arguments.input_path, arguments.output_path, arguments.chunk_size)
+        except ValueError as error: # a wrong row in the file, the message starts with the line number
+            print(error, file=sys.stderr)
+            raise SystemExit(1)
+        print(f'Evaluated {summary["beams"]} beams, {summary["passed"]} passed all checks, time: {summary["wall_time"]:.2f} s')
+
+    elif arguments.command == 'sensitivity':
+        from S0_Sensitivity import run_sensitivity, variables
+
+        result = run_sensitivity(set_input_fields(Input(), arguments.set))
+        print('utilization,value,' + ','.join(variables))
+        for name, gradient in result.gradient.items():
+            print(f'{name},{result.utilization[name]},' + ','.join(f'{derivative:.6g}' for derivative in gradient.values()))
+
+    elif arguments.command == 'serve':
+        from X0_Service import run_service
+
+        run_service(arguments.host, arguments.port, arguments.workers, arguments.max_delay / 10 ** 3, arguments.max_batch_size)
 
 
+if __name__ == '__main__':
+    main()
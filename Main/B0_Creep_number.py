@@ -1,7 +1,134 @@
+# Import module numpy as np
+import numpy as np
+from functools import lru_cache
 
-''' This script contain the Creep number class that apply for all reinforcement cases.
+''' This script contain the Creep number class that apply for all reinforcement cases, and the Creep curve class
+that gives creep number phi(t, t0) for arrays of concrete ages.
 '''
 
+# The formulas from EC2 annex B that the Creep number class, the Creep curve class and the Beam batch class use.
+# They take one cross section, or arrays with one value for each cross section.
+
+def calculate_beta_fcm(fcm: int) -> float:
+    ''' Function that calculates the factor beta_cm that takes into account concrete strength on the
+    standardized creepnumer
+    Args: 
+        fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
+    Returns:
+        beta_fcm(float):  factor that takes into account concrete strength 
+    '''
+    beta_fcm = 16.8 / np.sqrt(fcm) # From (B.4)
+    return beta_fcm
+
+
+def calculate_phi_RH(h0: float, fcm: int, RH: int) -> float: 
+    ''' Function that calculates phi_RH which takes into account the effect of relative humidity on the 
+    standardized creepnumer
+    Args:
+        h0(float): effective cross section thickness [mm]
+        fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
+        RH(in):  relative humidity, defined by user [%]
+    Returns:
+        phi_RH(float):  factor that takes into account the effect of relative humidity 
+    '''
+    alpha_1 = (35 / fcm) ** 0.7 # From (B.8c)
+    alpha_2 = (35 / fcm) ** 0.2 # From (B.8c)
+
+    phi_RH = np.where(fcm <= 35, 1 + (1 - RH / 100) / (0.1 * h0 ** (1 / 3)), # From (B.3a)
+                      (1 + ((1 - RH / 100) / (0.1 * h0 ** (1/3))) * alpha_1) * alpha_2) # From (B.3b)
+
+    return phi_RH[()] # [()] gives a number instead of an array for a single cross section
+
+
+def calculate_t0_adjusted(t0: int, cement_class: str) -> float:
+    ''' Function that calcualtes the adjusted t0 because of effect from cement type
+    Args:
+        t0(int):  concrete age at load application, defined by user [days]
+        cement_class(str):  cement class 'N','S' or 'R', defined by user
+    Returns:
+        t0_adjusted(float):  adjusted application age because of effect from cement type [days]
+    Raises:
+        ValueError:  if cement class is not R,N or S
+    '''
+    alpha_cement = get_alpha_cement(cement_class)
+
+    t0_adjusted = np.maximum(t0 * (9 / (2 + t0 ** 1.2) + 1) ** alpha_cement, 0.5) # From (B.9)
+    return t0_adjusted
+
+
+def get_alpha_cement(cement_class: str) -> int:
+    ''' Function that gives the exponent alpha that depends on the cement class, from (B.9)
+    Args:
+        cement_class(str or array):  cement class 'N','S' or 'R', defined by user
+    Returns:
+        alpha_cement(int or array):  exponent that depends on the cement class
+    Raises:
+        ValueError:  if cement class is not R,N or S
+    '''
+    if not isinstance(cement_class, str):
+        cement_class = np.asarray(cement_class)
+        alpha_cement = np.empty(cement_class.shape)
+        for value in set(cement_class.ravel().tolist()):
+            alpha_cement[cement_class == value] = get_alpha_cement(value)
+        return alpha_cement
+
+    if cement_class == 'S':
+        alpha_cement = -1
+    elif cement_class == 'N':
+        alpha_cement = 0
+    elif cement_class == 'R':
+        alpha_cement = 1
+    else: 
+        raise ValueError(f'cement_class={cement_class}, expected R, N or S')
+    return alpha_cement
+
+
+def calculate_beta_t0(t0_adjusted: float) -> float: 
+    ''' Function that calculates the factor beta_t0 that take into acount the effect of concrete age 
+    when load is applied
+    Args:
+        t0_adjusted(float):  adjusted application age because of effect from cement type [days]
+    Returns:
+        beta_t0(float):  factor that take into acount the effect of concrete age when load is applied 
+    '''
+    beta_t0 = 1 / (0.1 + t0_adjusted ** 0.20) # From (B.5)
+    return beta_t0
+
+
+def calculate_beta_H(RH: int, h0: float, fcm: int) -> float:
+    ''' Function that calculates the factor beta_H that depends on relative humidity and effective thickness
+    Args:
+        RH(int):  relative humidity, defined by user [%]
+        h0(float): effective cross section thickness [mm]
+        fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
+    Returns:
+        beta_H(float):  factor that depends on relative humidity and effective thickness
+    '''
+    alpha_3 = (35 / fcm) ** 0.5  # From (B.8c)
+
+    beta_H = np.where(fcm <= 35, np.minimum(1.5 * (1 + (0.012 * RH) ** 18) * h0 + 250, 1500), # From (B.8a)
+                      np.minimum(1.5 * (1 + (0.012 * RH) ** 18) * h0 + 250 * alpha_3, 1500 * alpha_3)) # From (B.8b)
+    return beta_H[()]
+
+
+def calculate_beta_c(t0: int, t: int, RH: int, h0: float, fcm: int) -> float:
+    ''' Function that calculates the factor beta_c that describes creep development compared to time after
+    applied load
+    Args:
+        t0(int):  concrete age at load application, defined by user [days]
+        t(int):  concrete age at the considered time [days]
+        RH(int):  relative humidity, defined by user [%]
+        h0(float): effective cross section thickness [mm]
+        fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
+    Returns:
+        beta_c(float):  factor to describe creep development compared to time after applied load
+    '''
+    beta_H = calculate_beta_H(RH, h0, fcm)
+
+    beta_c = ((t - t0) / (beta_H + t - t0)) ** 0.3  # From (B.7)
+    return beta_c
+
+
 class Creep_number:
     ''' Class that contain creep number calculation from EC2, annex B.
     '''
@@ -29,6 +156,10 @@ class Creep_number:
             phi_self(float):  creep number for selfload
             phi_live(float):  creep number for liveload
         '''
+        self.fcm = material.fcm
+        self.RH = RH
+        self.cement_class = cement_class
+        self.t0_self = t0_self
         self.h0 = self.calculate_h0(cross_section.Ac, cross_section.width, cross_section.height)
         self.beta_fcm = self.calculate_beta_fcm(material.fcm)
         self.phi_RH = self.calculate_phi_RH(self.h0, material.fcm, RH)
@@ -42,6 +173,18 @@ class Creep_number:
         self.phi_selfload = self.calcualte_phi(self.phi_0_self, self.beta_c)
         self.phi_liveload = self.calcualte_phi(self.phi_0_live, self.beta_c)
 
+    def calculate_phi_matrix(self, t, t0) -> np.ndarray:
+        ''' Function that calculates creep number phi(t, t0) for arrays of concrete ages, with the factors that do not
+        depend on time from the Creep curve class
+        Args:
+            t(float or array):  concrete ages at the considered times [days]
+            t0(float or array):  concrete ages at load application [days]
+        Returns:
+            phi(array):  creep number, shape (len(t0), len(t)), 0 before the load is applied
+        '''
+        creep_curve = get_creep_curve(float(self.h0), float(self.fcm), float(self.RH), self.cement_class)
+        return creep_curve.calculate_phi_matrix(t, t0)
+
     def calculate_h0(self, Ac: float, width: float, height: float) -> float: 
         ''' Function that calculates effective cross section thickness 
         Args:
@@ -53,40 +196,29 @@ class Creep_number:
         '''
         h0 = (2 * Ac) / (2 * (width + height)) # From (B.6)
         return h0
-    
+
     def calculate_beta_fcm(self, fcm: int) -> float:
-        ''' Function that calculates the factor beta_cm that takes into account concrete strength on the
-        standardized creepnumer
-        Args: 
+        ''' Function that calculates the factor beta_fcm that takes into account concrete strength, from (B.4)
+        Args:
             fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
         Returns:
-            beta_fcm(float):  factor that takes into account concrete strength 
+            beta_fcm(float):  factor that takes into account concrete strength
         '''
-        beta_fcm = 16.8 / fcm ** 0.5 # From (B.4)
-        return beta_fcm
-   
-    def calculate_phi_RH(self, h0: float, fcm: int, RH: int) -> float: 
-        ''' Function that calculates phi_RH which takes into account the effect of relative humidity on the 
-        standardized creepnumer
+        return calculate_beta_fcm(fcm)
+
+    def calculate_phi_RH(self, h0: float, fcm: int, RH: int) -> float:
+        ''' Function that calculates phi_RH which takes into account the effect of relative humidity, from (B.3)
         Args:
             h0(float): effective cross section thickness [mm]
             fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
-            RH(in):  relative humidity, defined by user [%]
+            RH(int):  relative humidity, defined by user [%]
         Returns:
-            phi_RH(float):  factor that takes into account the effect of relative humidity 
+            phi_RH(float):  factor that takes into account the effect of relative humidity
         '''
-        alpha_1 = (35 / fcm) ** 0.7 # From (B.8c)
-        alpha_2 = (35 / fcm) ** 0.2 # From (B.8c)
-
-        if fcm <= 35:
-            phi_RH = 1 + (1 - RH / 100) / (0.1 * h0 ** (1 / 3)) # From (B.3a)
-        else:
-            phi_RH = (1 + ((1 - RH / 100) / (0.1 * h0 ** (1/3))) * alpha_1) * alpha_2 # From (B.3b)
-
-        return phi_RH
+        return calculate_phi_RH(h0, fcm, RH)
 
     def calculate_t0_adjusted(self, t0: int, cement_class: str) -> float:
-        ''' Function that calcualtes the adjusted t0 because of effect from cement type
+        ''' Function that calcualtes the adjusted t0 because of effect from cement type, from (B.9)
         Args:
             t0(int):  concrete age at load application, defined by user [days]
             cement_class(str):  cement class 'N','S' or 'R', defined by user
@@ -95,29 +227,29 @@ class Creep_number:
         Raises:
             ValueError:  if cement class is not R,N or S
         '''
-        if cement_class == 'S':
-            alpha_cement = -1
-        elif cement_class == 'N':
-            alpha_cement = 0
-        elif cement_class == 'R':
-            alpha_cement = 1
-        else: 
-            raise ValueError(f'cement_class={cement_class}, expected R, N or S')
-        
-        t0_adjusted = max (t0 * (9 / (2 + t0 ** 1.2) + 1) ** alpha_cement, 0.5) # From (B.9)
-        return t0_adjusted
-    
-    def calculate_beta_t0(self, t0_adjusted: float) -> float: 
-        ''' Function that calculates the factor beta_t0 that take into acount the effect of concrete age 
-        when load is applied
+        return calculate_t0_adjusted(t0, cement_class)
+
+    def get_alpha_cement(self, cement_class: str) -> int:
+        ''' Function that gives the exponent alpha that depends on the cement class, from (B.9)
+        Args:
+            cement_class(str):  cement class 'N','S' or 'R', defined by user
+        Returns:
+            alpha_cement(int):  exponent that depends on the cement class
+        Raises:
+            ValueError:  if cement class is not R,N or S
+        '''
+        return get_alpha_cement(cement_class)
+
+    def calculate_beta_t0(self, t0_adjusted: float) -> float:
+        ''' Function that calculates the factor beta_t0 that take into acount the effect of concrete age
+        when load is applied, from (B.5)
         Args:
             t0_adjusted(float):  adjusted application age because of effect from cement type [days]
         Returns:
-            beta_t0(float):  factor that take into acount the effect of concrete age when load is applied 
+            beta_t0(float):  factor that take into acount the effect of concrete age when load is applied
         '''
-        beta_t0 = 1 / (0.1 + t0_adjusted ** 0.20) # From (B.5)
-        return beta_t0
-    
+        return calculate_beta_t0(t0_adjusted)
+
     def calculate_phi_0(self, phi_RH: float, beta_fcm: float, beta_t0: float) -> float: 
         ''' Function that calculates the standardized creep number 
         Args:
@@ -131,27 +263,30 @@ class Creep_number:
         return phi_0
 
     
-    def calculate_beta_c(self, t0: int, t: int, RH: int, h0: int, fcm: int) -> float: 
-        ''' Function that calculates the factor beta:c that describes creep development compared to time after 
-        applied load
+    def calculate_beta_c(self, t0: int, t: int, RH: int, h0: int, fcm: int) -> float:
+        ''' Function that calculates the factor beta_c that describes creep development compared to time after
+        applied load, from (B.7)
         Args:
             t0(int):  concrete age at load application, defined by user [days]
             t(int):  concrete age at the considered time [days]
             RH(int):  relative humidity, defined by user [%]
             h0(float): effective cross section thickness [mm]
             fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
-        Returns:    
+        Returns:
             beta_c(float):  factor to describe creep development compared to time after applied load
         '''
-        alpha_3 = (35 / fcm) ** 0.5  # From (B.8c)
-
-        if fcm <= 35:
-            beta_H = min(1.5 * (1 + (0.012 * RH) ** 18) * h0 + 250, 1500) # From (B.8a)
-        else:
-            beta_H = min(1.5 * (1 + (0.012 * RH) ** 18) * h0 + 250 * alpha_3, 1500 * alpha_3) # From (B.8b)
+        return calculate_beta_c(t0, t, RH, h0, fcm)
 
-        beta_c = ((t - t0) / (beta_H + t - t0)) ** 0.3  # From (B.7)
-        return beta_c
+    def calculate_beta_H(self, RH: int, h0: float, fcm: int) -> float:
+        ''' Function that calculates the factor beta_H that depends on relative humidity and effective thickness, from (B.8)
+        Args:
+            RH(int):  relative humidity, defined by user [%]
+            h0(float): effective cross section thickness [mm]
+            fcm(int):  middlevalue of cylinder compressive strength, from material class [N/mm2]
+        Returns:
+            beta_H(float):  factor that depends on relative humidity and effective thickness
+        '''
+        return calculate_beta_H(RH, h0, fcm)
 
     def calcualte_phi(self, phi_0: float, beta_c: float) -> float: 
         ''' Function that calculate creep number phi
@@ -163,4 +298,60 @@ class Creep_number:
         '''
         phi = phi_0 * beta_c # From (B.1)
         return phi
-    
+
+
+class Creep_curve:
+    ''' Class to calculate creep number phi(t, t0) for arrays of concrete ages, with the same functions as the Creep
+    number class. The factors that do not depend on the ages are calculated once, so each new age only costs
+    beta_t0 and beta_c.
+    '''
+    def __init__(self, h0: float, fcm: float, RH: float, cement_class: str):
+        '''Args:
+            h0(float): effective cross section thickness [mm]
+            fcm(float):  middlevalue of cylinder compressive strength, from material class [N/mm2]
+            RH(float):  relative humidity, from Input class [%]
+            cement_class(string):  cement class 'N','S' or 'R', from Input class
+        Returns:
+            phi_RH_beta_fcm(float):  factor phi_RH * beta_fcm, for the standardized creep number
+            beta_H(float):  factor that depends on relative humidity and effective thickness
+            alpha_cement(int):  exponent that depends on the cement class
+        Raises:
+            ValueError:  if cement class is not R,N or S
+        '''
+        self.h0, self.fcm, self.RH, self.cement_class = h0, fcm, RH, cement_class
+        self.phi_RH_beta_fcm = calculate_phi_RH(h0, fcm, RH) * calculate_beta_fcm(fcm)
+        self.beta_H = calculate_beta_H(RH, h0, fcm)
+        self.alpha_cement = get_alpha_cement(cement_class)
+
+    def calculate_phi_matrix(self, t, t0) -> np.ndarray:
+        ''' Function that calculates creep number phi(t, t0) for all combinations of t and t0 in one evaluation
+        Args:
+            t(float or array):  concrete ages at the considered times [days]
+            t0(float or array):  concrete ages at load application [days]
+        Returns:
+            phi(array):  creep number, shape (len(t0), len(t)), 0 before the load is applied
+        '''
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        t0 = np.atleast_1d(np.asarray(t0, dtype=float))[:, None]
+
+        t0_adjusted = calculate_t0_adjusted(t0, self.cement_class)
+        phi_0 = self.phi_RH_beta_fcm * calculate_beta_t0(t0_adjusted) # From (B.2)
+
+        loaded = np.maximum(t - t0, 0) # Time after applied load
+        beta_c = (loaded / (self.beta_H + loaded)) ** 0.3  # From (B.7)
+        return phi_0 * beta_c # From (B.1)
+
+
+@lru_cache(maxsize=1024)
+def get_creep_curve(h0: float, fcm: float, RH: float, cement_class: str) -> Creep_curve:
+    ''' Function that gives a shared Creep curve for each effective thickness, concrete strength, relative humidity
+    and cement class, so the factors that do not depend on the ages are only calculated once
+    Args:
+        h0(float): effective cross section thickness [mm]
+        fcm(float):  middlevalue of cylinder compressive strength [N/mm2]
+        RH(float):  relative humidity [%]
+        cement_class(string):  cement class 'N','S' or 'R'
+    Returns:
+        creep_curve:  instance of the Creep curve class
+    '''
+    return Creep_curve(h0, fcm, RH, cement_class)
@@ -1,7 +1,104 @@
+# Import module numpy as np
+import numpy as np
+from functools import lru_cache
 
 ''' This script contain the Material class that apply for all reinforcement cases.
+The function get_material gives a shared, read-only record of the Material class, so beams with the same
+materials use the same record instead of making a new Material instance each.
+Table 3.1 in EC2 and table 2 in EN10138-3 are made once as structured arrays, with dictionaries from concrete class
+and prestress name to row, so both one value and whole arrays of classes can be looked up.
 '''
 
+# Table 3.1 in EC2. Ecm is given in GPa and the strains in per mille, as in the table
+concrete_table = np.array([
+    # class, fck, fck_cube, fcm, fctm, fctk_005, fctk_095, Ecm, eps_c1, eps_cu1, eps_c2, eps_cu2, n, eps_c3, eps_cu3
+    ('C12', 12, 15, 20, 1.6, 1.1, 2.0, 27, 1.8, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C16', 16, 20, 24, 1.9, 1.3, 2.5, 29, 1.9, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C20', 20, 25, 28, 2.2, 1.5, 2.9, 30, 2.0, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C25', 25, 30, 33, 2.6, 1.8, 3.3, 31, 2.1, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C30', 30, 37, 38, 2.9, 2.0, 3.8, 33, 2.2, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C35', 35, 45, 43, 3.2, 2.2, 4.2, 34, 2.25, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C40', 40, 50, 48, 3.5, 2.5, 4.6, 35, 2.3, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C45', 45, 55, 53, 3.8, 2.7, 4.9, 36, 2.4, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C50', 50, 60, 58, 4.1, 2.9, 5.3, 37, 2.45, 3.5, 2.0, 3.5, 2.0, 1.75, 3.5),
+    ('C55', 55, 67, 63, 4.2, 3.0, 5.5, 38, 2.5, 3.2, 2.2, 3.1, 1.75, 1.8, 3.1),
+    ('C60', 60, 75, 68, 4.4, 3.1, 5.7, 39, 2.6, 3.0, 2.3, 2.9, 1.6, 1.9, 2.9),
+    ('C70', 70, 85, 78, 4.6, 3.2, 6.0, 41, 2.7, 2.8, 2.4, 2.7, 1.45, 2.0, 2.7),
+    ('C80', 80, 95, 88, 4.8, 3.4, 6.3, 42, 2.8, 2.8, 2.5, 2.6, 1.4, 2.2, 2.6),
+    ('C90', 90, 105, 98, 5.0, 3.5, 6.6, 44, 2.8, 2.8, 2.6, 2.6, 1.4, 2.3, 2.6)],
+    dtype=[('concrete_class', 'U3'), ('fck', 'i8'), ('fck_cube', 'i8'), ('fcm', 'i8'), ('fctm', 'f8'), ('fctk_005', 'f8'),
+           ('fctk_095', 'f8'), ('Ecm', 'i8'), ('eps_c1', 'f8'), ('eps_cu1', 'f8'), ('eps_c2', 'f8'), ('eps_cu2', 'f8'),
+           ('n', 'f8'), ('eps_c3', 'f8'), ('eps_cu3', 'f8')])
+
+# Row in table 3.1 for each concrete class
+concrete_index = {concrete_class: index for index, concrete_class in enumerate(concrete_table['concrete_class'].tolist())}
+
+# Table 2 in EN10138-3. The diameter is only used to find the row for Y1860S3, Y1860S7 and Y1770S7, the other names
+# have one row each and no diameter (NaN)
+strand_table = np.array([
+    # name, diameter, fpk, Ap, Fpk, Fp01k
+    ('Y19060S3', np.nan, 1960, 13.6, 26.6, 22.9),
+    ('Y1860S3', 6.5, 1860, 21.1, 39.2, 33.8),
+    ('Y1860S3', 6.8, 1860, 23.4, 43.5, 37.4),
+    ('Y1860S3', 7.5, 1860, 20, 54, 46.4),
+    ('Y1860S7', 7.0, 1860, 30, 56, 48),
+    ('Y1860S7', 9.0, 1860, 50, 93, 80),
+    ('Y1860S7', 11.0, 1860, 75, 140, 120),
+    ('Y1860S7', 12.5, 1860, 93, 173, 149),
+    ('Y1860S7', 13.0, 1860, 100, 186, 160),
+    ('Y1860S7', 15.2, 1860, 140, 260, 224),
+    ('Y1860S7', 16.0, 1860, 150, 279, 240),
+    ('Y1770S7', 15.2, 1770, 140, 248, 213),
+    ('Y1770S7', 16.0, 1770, 150, 265, 228),
+    ('Y1770S7', 18.0, 1770, 200, 354, 304),
+    ('Y1860S7G', np.nan, 1860, 112, 209, 180),
+    ('Y1820S7G', np.nan, 1820, 165, 300, 258),
+    ('Y1700S7G', np.nan, 1700, 223, 380, 327),
+    ('Y2160S3', np.nan, 2160, 13.6, 29.4, 26.2),
+    ('Y2060S3', np.nan, 2060, 13.6, 28, 24.1),
+    ('Y1960S3', np.nan, 1960, 21.2, 41.4, 35.6),
+    ('Y2160S7', np.nan, 2160, 28.2, 60.9, 52.4),
+    ('Y2060S7', np.nan, 2060, 30, 62, 53),
+    ('Y1960S7', np.nan, 1960, 50, 98, 84)],
+    dtype=[('name', 'U8'), ('diameter', 'f8'), ('fpk', 'i8'), ('Ap', 'f8'), ('Fpk', 'f8'), ('Fp01k', 'f8')])
+
+# Row in table 2 for each prestress, given by (name, diameter) or only name when the name has one row
+strand_index = {(name, diameter) if diameter == diameter else name: index
+                for index, (name, diameter) in enumerate(zip(strand_table['name'].tolist(), strand_table['diameter'].tolist()))}
+
+
+def get_concrete_index(concrete_classes) -> np.ndarray:
+    ''' Function that finds the row in table 3.1 for an array of concrete classes, with one dictionary lookup
+    for each class instead of sorting the classes.
+    Args:
+        concrete_classes(array):  concrete classes, for instance 'C30'
+    Returns:
+        index(array):  row in concrete_table for each concrete class
+    Raises:
+        ValueError:  If a concrete class do not exist
+    '''
+    concrete_classes = np.asarray(concrete_classes, dtype=object).reshape(-1)
+    index = np.fromiter((concrete_index.get(concrete_class, -1) for concrete_class in concrete_classes), dtype=int, count=len(concrete_classes))
+    if np.any(index < 0):
+        raise ValueError(f'Concrete class {concrete_classes[np.argmax(index < 0)]} do not exist')
+    return index
+
+
+def get_strand_index(names, diameters) -> np.ndarray:
+    ''' Function that finds the row in table 2 in EN10138-3 for arrays of prestress names and diameters, with
+    dictionary lookups instead of sorting the names.
+    Args:
+        names(array):  name of prestress type, None for no prestress
+        diameters(array):  diameter of prestressed reinforcement [mm]
+    Returns:
+        index(array):  row in strand_table for each prestress, -1 if there is no prestress or the prestress do not exist
+    '''
+    names = np.asarray(names, dtype=object).reshape(-1).tolist()
+    diameters = np.asarray(diameters, dtype=float).reshape(-1).tolist()
+    return np.fromiter((strand_index.get((name, diameter), strand_index.get(name, -1)) for name, diameter in zip(names, diameters)),
+                       dtype=int, count=len(names))
+
+
 class Material: 
     '''Material class to contain material properties used in calculations.
     All calculations are done according to the standards
@@ -150,37 +247,9 @@ class Material:
         Raises:
             ValueError:  If the concrete class do not exist
         '''
-        match concrete_class:
-            case 'C12':
-                return 0
-            case 'C16':
-                return 1
-            case 'C20':
-                return 2
-            case 'C25':
-                return 3
-            case 'C30':
-                return 4
-            case 'C35':
-                return 5
-            case 'C40':
-                return 6
-            case 'C45':
-                return 7
-            case 'C50':
-                return 8
-            case 'C55':
-                return 9
-            case 'C60':
-                return 10 
-            case 'C70':
-                return 11
-            case 'C80':
-                return 12
-            case 'C90':
-                return 13
-            case _:
-                raise ValueError(f'Concrete class {concrete_class} do not exist')
+        if concrete_class not in concrete_index:
+            raise ValueError(f'Concrete class {concrete_class} do not exist')
+        return concrete_index[concrete_class]
     
     def get_fck(self, index: int) -> int:
         ''' Get compression strength fck based on index number and table 3.1 in EC2.
@@ -189,8 +258,7 @@ class Material:
         Returns:
             fck(int):  cylinder compression strength [N/mm2]
         '''
-        fck_vektor = [12, 16, 20, 25, 30, 35, 40, 45, 50, 55, 60, 70, 80, 90]
-        return fck_vektor[index]
+        return concrete_table['fck'][index].item()
     
     def get_fck_cube(self, index: int) -> int:
         ''' Get compressive strength fck_cube based on index number and table 3.1 in EC2.
@@ -199,8 +267,7 @@ class Material:
         Returns:
             fck_cube(int):  Cubic compressive strength [N/mm2]
         '''
-        fck_cube_vektor = [15, 20, 25, 30, 37, 45, 50, 55, 60, 67, 75, 85, 95, 105]
-        return fck_cube_vektor[index]
+        return concrete_table['fck_cube'][index].item()
     
     def get_fcm(self, index: int) -> int:
         ''' Get compressive strength fcm based on index number and table 3.1 in EC2.
@@ -209,8 +276,7 @@ class Material:
         Returns:
             fcm(int):  middlevalue of cylinder compressive strength [N/mm2]
             '''
-        fcm_vektor = [20, 24, 28, 33, 38, 43, 48, 53, 58, 63, 68, 78, 88, 98]
-        return fcm_vektor[index]
+        return concrete_table['fcm'][index].item()
 
     def get_fctm(self, index: int) -> float:
         ''' Get tension strength fctm based on index number and table 3.1 in EC2.
@@ -219,8 +285,7 @@ class Material:
         Returns:
             fctm(float):  middlevalue of concrete axial tension strength [N/mm2]
             '''
-        fctm_vektor = [1.6, 1.9, 2.2, 2.6, 2.9, 3.2, 3.5, 3.8, 4.1, 4.2, 4.4, 4.6, 4.8, 5.0]
-        return fctm_vektor[index]
+        return concrete_table['fctm'][index].item()
 
     def get_fctk_005(self, index: int) -> float:
         ''' Get tension strength fct_005 based on index number and table 3.1 in EC2.
@@ -229,8 +294,7 @@ class Material:
         Returns:
             fctk_005(float):  0.05 % concrete characteristic axial tension strength [N/mm2]
         '''
-        fctk_005_vektor = [1.1, 1.3, 1.5, 1.8, 2.0, 2.2, 2.5, 2.7, 2.9, 3.0, 3.1, 3.2, 3.4, 3.5]
-        return fctk_005_vektor[index]
+        return concrete_table['fctk_005'][index].item()
         
     def get_fctk_095(self, index: int) -> float:
         ''' Get tension strength fctk_095 based on index number and table 3.1 in EC2.
@@ -239,8 +303,7 @@ class Material:
         Returns:
             fctk_095(float):  0.95 % concrete characteristic axial tension strenght [N/mm2]
         '''
-        fctk_095_vektor = [2.0, 2.5, 2.9, 3.3, 3.8, 4.2, 4.6, 4.9, 5.3, 5.5, 5.7, 6.0, 6.3, 6.6]
-        return fctk_095_vektor[index]
+        return concrete_table['fctk_095'][index].item()
     
     def get_Ecm(self, index: int) -> int:
         ''' Get elasiticty modulus Ecm based on index number and table 3.1 in EC2.
@@ -250,8 +313,7 @@ class Material:
         Returns:
             Ecm(int):  Elasticity modulus for concrete [N/mm2]
         '''
-        Ecm_vektor = [27, 29, 30, 31, 33, 34, 35, 36, 37, 38, 39, 41, 42, 44] 
-        return Ecm_vektor[index] * 1000 
+        return concrete_table['Ecm'][index].item() * 1000
 
     def get_eps_c1(self, index: int) -> float:
         ''' Get strain eps_c1 for a non-linear analysis based on index number and table 3.1 in EC2.
@@ -261,8 +323,7 @@ class Material:
         Returns:
             eps_c1(float):  compression strain for biggest stress
         '''
-        eps_c1_vektor = [1.8, 1.9, 2.0, 2.1, 2.2, 2.25, 2.3, 2.4, 2.45, 2.5, 2.6, 2.7, 2.8, 2.8]
-        return eps_c1_vektor[index] / 1000
+        return concrete_table['eps_c1'][index].item() / 1000
 
     def get_eps_cu1(self, index: int) -> float:
         ''' Get strain limit eps_cu1 for a non-linear analysis based on index number and table 3.1 in EC2.
@@ -272,8 +333,7 @@ class Material:
         Returns:
             eps_cu1(float):  strain limit for compression 
         '''
-        eps_cu1_vektor = [3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.2, 3.0, 2.8, 2.8, 2.8]
-        return eps_cu1_vektor[index] / 1000
+        return concrete_table['eps_cu1'][index].item() / 1000
 
 
     def get_eps_c2(self, index: int) -> float:
@@ -284,8 +344,7 @@ class Material:
         Returns:
             eps_c2(float):  compression strain for biggest stress 
         '''
-        eps_c2_vektor = [2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.2, 2.3, 2.4, 2.5, 2.6]
-        return eps_c2_vektor[index] / 1000
+        return concrete_table['eps_c2'][index].item() / 1000
   
     def get_eps_cu2(self, index: int) -> float:
         ''' Get strain limit eps_cu2 for a parabolic analysis based on index number and table 3.1 in EC2.
@@ -295,8 +354,7 @@ class Material:
         Returns:
             eps_cu2(float):  strain limit for compression 
         '''
-        eps_cu2_vektor = [3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.1, 2.9, 2.7, 2.6, 2.6]
-        return eps_cu2_vektor[index] / 1000
+        return concrete_table['eps_cu2'][index].item() / 1000
     
     def get_n(self, index: int) -> float:
         ''' Get exponent n based on index number and table 3.1 in EC2.
@@ -305,8 +363,7 @@ class Material:
         Returns:
             n(float):  exponent
         '''
-        n_vektor = [2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 1.75, 1.6, 1.45, 1.4, 1.4]
-        return n_vektor[index]
+        return concrete_table['n'][index].item()
 
     def get_eps_c3(self, index: int) -> float:
         ''' Get strain eps_c3 for a bilinear or rectangular analysis based on index number and table 3.1 in EC2.
@@ -316,8 +373,7 @@ class Material:
         Returns:
             eps_c3(float):  compression strain for biggest stress 
         '''
-        eps_c3_vektor = [1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.8, 1.9, 2.0, 2.2, 2.3]
-        return eps_c3_vektor[index] / 1000
+        return concrete_table['eps_c3'][index].item() / 1000
     
     def get_eps_cu3(self, index: int) -> float:
         ''' Get strain limit eps_cu3 for a bilinear or rectangular analysis based on index number and table 3.1 in EC2.
@@ -327,8 +383,7 @@ class Material:
         Returns:
             eps_cu3(float):  strain limit for compression 
         '''
-        eps_cu3_vektor = [3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.1, 2.9, 2.7, 2.6, 2.6]
-        return eps_cu3_vektor[index] / 1000
+        return concrete_table['eps_cu3'][index].item() / 1000
     
     def calculate_lambda(self, fck: int) -> float:
         ''' Function that calculate a factor lambda which defines the effective height for 
@@ -395,62 +450,10 @@ class Material:
         Returns:
             index(int):  determining parameters for prestress or "None" if the name do not exist.
         '''
-        if prestress_name == 'Y1860S3':
-            match prestress_diameter:
-                case 6.5:
-                    return 1
-                case 6.8:
-                    return 2
-                case 7.5:
-                    return 3
-        elif prestress_name == 'Y1860S7':
-            match prestress_diameter:
-                case 7.0:
-                    return 4
-                case 9.0:
-                    return 5
-                case 11.0:
-                    return 6
-                case 12.5:
-                    return 7
-                case 13.0:
-                    return 8
-                case 15.2:
-                    return 9
-                case 16.0:
-                    return 10 
-        elif prestress_name == 'Y1770S7':
-            match prestress_diameter:
-                case 15.2:
-                    return 11
-                case 16.0:
-                    return 12
-                case 18.0:
-                    return 13
-        elif prestress_name == None:
+        if prestress_name == None:
             return None
-        else:
-            match prestress_name:
-                case 'Y19060S3':
-                    return 0
-                case 'Y1860S7G':
-                    return 14
-                case 'Y1820S7G':
-                    return 15
-                case 'Y1700S7G':
-                    return 16
-                case 'Y2160S3':
-                    return 17
-                case 'Y2060S3':
-                    return 18
-                case 'Y1960S3':
-                    return 19
-                case 'Y2160S7':
-                    return 20
-                case 'Y2060S7':
-                    return 21
-                case 'Y1960S7':
-                   return 22
+        index = strand_index.get((prestress_name, prestress_diameter), strand_index.get(prestress_name))
+        return index
     
         
     def get_fpk(self, index_prestress: int) -> int: 
@@ -463,9 +466,7 @@ class Material:
         if index_prestress == None:
             return 0
         else: 
-            fpk = [1960, 1860, 1860, 1860, 1860, 1860, 1860, 1860, 1860, 1860, 1860, 1770,
-             1770, 1770, 1860, 1820, 1700, 2160, 2060, 1960, 2160, 2060, 1960]
-            return fpk[index_prestress]
+            return strand_table['fpk'][index_prestress].item()
 
     def get_Ap(self, index_prestress: int) -> float:
         '''Get area of each prestress strand based on index and table 2 in EN10138-3.
@@ -477,9 +478,7 @@ class Material:
         if index_prestress == None:
             return 0
         else: 
-            Ap = [13.6, 21.1, 23.4, 20, 30, 50, 75, 93, 100,
-             140, 150, 140, 150, 200, 112, 165, 223, 13.6, 13.6, 21.2, 28.2, 30, 50]
-            return Ap[index_prestress]
+            return strand_table['Ap'][index_prestress].item()
     
     def get_Fpk(self, index_prestress: int) -> float:
         '''Get characteristic maximum force Fm based on index and table 2 in EN10138-3.
@@ -491,9 +490,7 @@ class Material:
         if index_prestress == None:
             return 0
         else: 
-            Fpk = [26.6, 39.2, 43.5, 54, 56, 93, 140, 173, 186, 260, 279, 248, 265, 354, 209, 300, 
-                    380, 29.4, 28, 41.4, 60.9, 62, 98]
-            return Fpk[index_prestress]
+            return strand_table['Fpk'][index_prestress].item()
     
     
     def get_Fp01k(self, index_prestress: int) -> float:
@@ -506,9 +503,7 @@ class Material:
         if index_prestress == None:
             return 0
         else: 
-            Fp01k = [22.9, 33.8, 37.4, 46.4, 48, 80, 120, 149, 160, 224, 240, 213, 228, 304, 180, 258, 
-                     327, 26.2, 24.1, 35.6, 52.4, 53,84]
-            return Fp01k[index_prestress]
+            return strand_table['Fp01k'][index_prestress].item()
     
     def calculate_fp01k(self, Fp01k: float, Ap: float, index_prestress: int)-> float:
         '''Calculate characteristic 0.1% proof tension for prestress
@@ -538,5 +533,56 @@ class Material:
         else: 
             fpd: float = fp01k / self.gamma_prestressed_reinforcement 
             return fpd
-    
-    
+
+
+# Names of all attributes in the Material class
+material_attributes = tuple(vars(Material('C30', 500, None, 0)))
+
+
+class Material_record:
+    ''' Class to contain the same attributes as the Material class, but read-only and with __slots__ so each record
+    use less memory. Records are made by the function get_material, and shared by all beams with the same materials.
+    '''
+    __slots__ = material_attributes
+
+    def __init__(self, material: Material):
+        '''Args:
+            material:  instance for Material class
+        '''
+        for name in material_attributes:
+            object.__setattr__(self, name, getattr(material, name))
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f'Material_record is read-only, {name} can not be changed')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'Material_record is read-only, {name} can not be deleted')
+
+    # Pickle gives the values back through __setstate__, since __setattr__ is blocked (beams are sent between processes by the Sweep class)
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in material_attributes)
+
+    def __setstate__(self, state: tuple):
+        for name, value in zip(material_attributes, state):
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return f'Material_record(fck={self.fck}, fyk={self.fyk}, fpk={self.fpk}, Ap_strand={self.Ap_strand})'
+
+
+@lru_cache(maxsize=1024)
+def get_material(concrete_class: str, steel_class: float, prestress_name: str, prestress_diameter: float) -> Material_record:
+    ''' Function that gives the material record for a combination of concrete, steel and prestress. The record is
+    only made the first time a combination is used, and the same record is given back after that. Number of hits
+    and misses is found with get_material.cache_info(), and the cache is emptied with get_material.cache_clear().
+    Args:
+        concrete_class (str): concrete class, from Input class
+        steel_class (float): steel class, from Input class
+        prestress_name (str): name of prestress type, from Input class, according to table 2 in EN10138-3
+        prestress_diameter (float): diameter of prestressed reinforcement, from Input class, according to table 2 in EN10138-3
+    Returns:
+        material:  read-only record with all attributes from the Material class
+    Raises:
+        ValueError:  If the concrete class do not exist
+    '''
+    return Material_record(Material(concrete_class, steel_class, prestress_name, prestress_diameter))
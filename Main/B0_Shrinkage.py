@@ -0,0 +1,159 @@
+# Import module numpy as np
+import numpy as np
+
+''' This script contain the Shrinkage class that apply for all reinforcement cases.
+'''
+
+# From EC2 table 3.3
+h0_table = np.array([100, 200, 300, 500])
+k_h_table = np.array([1, 0.85, 0.75, 0.7])
+
+# From EC2 annex B.2, alpha_ds1 and alpha_ds2 for each cement class
+alpha_ds_table = {'S': (3, 0.13), 'N': (4, 0.12), 'R': (6, 0.11)}
+
+
+def calculate_k_h(h0):
+    ''' Function that interpolates the factor k_h in EC2 table 3.3
+    Args:
+        h0(float or array):  effective cross section thickness [mm]
+    Returns:
+        k_h(float or array):  factor that depends on the effective thickness, NaN outside the table
+    '''
+    k_h = np.interp(h0, h0_table, k_h_table, left=np.nan, right=np.nan)
+    return k_h
+
+
+def get_alpha_ds(cement_class) -> tuple:
+    ''' Function that gives the factors alpha_ds1 and alpha_ds2 that depend on the cement class, from EC2 annex B.2
+    Args:
+        cement_class(str or array):  cement class 'N','S' or 'R'
+    Returns:
+        alpha_ds1(int or array):  factor for the cement class in EC2 (B.11)
+        alpha_ds2(float or array):  factor for the cement class in EC2 (B.11)
+    Raises:
+        ValueError:  if cement class is not R,N or S
+    '''
+    if not isinstance(cement_class, str):
+        cement_class = np.asarray(cement_class)
+        alpha_ds1, alpha_ds2 = np.empty(cement_class.shape), np.empty(cement_class.shape)
+        for value in set(cement_class.ravel().tolist()):
+            alpha_ds1[cement_class == value], alpha_ds2[cement_class == value] = get_alpha_ds(value)
+        return alpha_ds1, alpha_ds2
+
+    if cement_class not in alpha_ds_table:
+        raise ValueError(f'cement_class={cement_class}, expected R, N or S')
+    return alpha_ds_table[cement_class]
+
+
+def calculate_eps_cd0(cement_class, RH, fcm):
+    ''' Function that calculates nominal free shrinkage strain due to drying according to EC2 Annex B.2(1)
+    Args:
+        cement_class(str or array):  cement class 'N','S' or 'R'
+        RH(float or array):  relative humidity [%]
+        fcm(float or array):  middlevalue of cylinder compressive strength [N/mm2]
+    Returns:
+        eps_cd0(float or array):  nominal free shrinkage strain due to drying
+    Raises:
+        ValueError:  if cement class is not R,N or S
+    '''
+    alpha_ds1, alpha_ds2 = get_alpha_ds(cement_class)
+
+    fcm0 = 10
+
+    RH0 = 100
+
+    beta_RH = 1.55 * (1 - (RH / RH0) ** 3) # From EC2 (B.12)
+
+    eps_cd0 = 0.85 * ((220 + 110 * alpha_ds1) * np.exp(- alpha_ds2 * (fcm/fcm0))) * 10 ** (-6) * beta_RH # From EC2 (B.11)
+    return eps_cd0
+
+
+def calculate_eps_ca_inf(fck):
+    ''' Function that calculates autogenous shrinkage strain at t = infinity, according to EC2 3.1.4(6)
+    Args:
+        fck(float or array):  cylinder compression strength [N/mm2]
+    Returns:
+        eps_ca_inf(float or array):  autogenous shrinkage strain at t = infinity
+    '''
+    eps_ca_inf = 2.5 * (fck - 10) * 10 ** -6 # From EC2 (3.12)
+    return eps_ca_inf
+
+
+class Shrinkage:
+    ''' Class to contain shrinkage strain over time, according to EC2 3.1.4(6). The factors that do not depend on
+    the age (k_h, eps_cd0 and eps_ca_inf) are calculated once, so shrinkage can be found for any age, or a whole
+    vector of ages, without calculating them again.
+    '''
+    def __init__(self, h0: float, eps_cd0: float, fck: int):
+        '''Args:
+            h0(float):  effective cross section thickness [mm]
+            eps_cd0(float):  nominal free shrinkage strain due to drying, from Deflection class
+            fck(int):  cylinder compression strength, from Material class [N/mm2]
+        Returns:
+            k_h(float):  factor that depends on the effective thickness, from table 3.3
+            eps_cd_inf(float):  shrinkage strain due to drying at t = infinity
+            eps_ca_inf(float):  autogenous shrinkage strain at t = infinity
+        Raises:
+            ValueError:  if h0 is outside table 3.3
+        '''
+        self.h0 = h0
+        self.k_h = calculate_k_h(h0)
+        if np.isnan(self.k_h):
+            raise ValueError(f'h0={h0}, expected effective thickness between {h0_table[0]} and {h0_table[-1]} mm from EC2 table 3.3')
+        self.eps_cd_inf = self.k_h * eps_cd0 # From EC2 (3.9) with beta_ds = 1
+        self.eps_ca_inf = calculate_eps_ca_inf(fck)
+
+    def calculate_beta_ds(self, t, ts) -> np.ndarray:
+        ''' Function that calculates the factor beta_ds that describes drying shrinkage over time
+        Args:
+            t(float or array):  concrete age at the considered time [days], np.inf gives 1
+            ts(float or array):  concrete age when drying starts [days]
+        Returns:
+            beta_ds(float or array):  factor for drying shrinkage, 0 before drying starts
+        '''
+        drying = np.maximum(np.asarray(t, dtype=float) - ts, 0) # Time after drying starts
+        with np.errstate(divide='ignore'):
+            beta_ds = 1 / (1 + 0.04 * np.sqrt(self.h0 ** 3) / drying) # From EC2 (3.10)
+        return beta_ds[()]
+
+    def calculate_beta_as(self, t) -> np.ndarray:
+        ''' Function that calculates the factor beta_as that describes autogenous shrinkage over time
+        Args:
+            t(float or array):  concrete age at the considered time [days], np.inf gives 1
+        Returns:
+            beta_as(float or array):  factor for autogenous shrinkage
+        '''
+        beta_as = 1 - np.exp(- 0.2 * np.sqrt(np.asarray(t, dtype=float))) # From EC2 (3.13)
+        return beta_as[()]
+
+    def calculate_eps_cd(self, t, ts: float = 7) -> np.ndarray:
+        ''' Function that calculates shrinkage strain due to drying at the age t
+        Args:
+            t(float or array):  concrete age at the considered time [days]
+            ts(float or array):  concrete age when drying starts, assumed at the end of curing after 7 days [days]
+        Returns:
+            eps_cd(float or array):  shrinkage strain due to drying
+        '''
+        eps_cd = self.calculate_beta_ds(t, ts) * self.eps_cd_inf # From EC2 (3.9)
+        return eps_cd
+
+    def calculate_eps_ca(self, t) -> np.ndarray:
+        ''' Function that calculates autogenous shrinkage strain at the age t
+        Args:
+            t(float or array):  concrete age at the considered time [days]
+        Returns:
+            eps_ca(float or array):  autogenous shrinkage strain
+        '''
+        eps_ca = self.calculate_beta_as(t) * self.eps_ca_inf # From EC2 (3.11)
+        return eps_ca
+
+    def calculate_eps_cs(self, t, ts: float = 7) -> np.ndarray:
+        ''' Function that calculates total shrinkage strain at the age t
+        Args:
+            t(float or array):  concrete age at the considered time [days]
+            ts(float or array):  concrete age when drying starts, assumed at the end of curing after 7 days [days]
+        Returns:
+            eps_cs(float or array):  total shrinkage strain
+        '''
+        eps_cs = self.calculate_eps_cd(t, ts) + self.calculate_eps_ca(t) # From EC2 (3.8)
+        return eps_cs
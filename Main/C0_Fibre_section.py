@@ -0,0 +1,226 @@
+# Import module numpy as np
+import numpy as np
+
+''' This script contain the Fibre section class that apply for all reinforcement cases.
+The concrete is split into horizontal strips (fibres) with the parabola-rectangle stress-strain relation from EC2 3.1.7,
+and the reinforcement into layers, so moment-curvature diagrams and the moment capacity can be found for one or many
+cross sections at once.
+'''
+
+def solve_bracketed(function, low, high, tolerance: float = 1e-12, max_iterations: int = 100) -> tuple:
+    ''' Function that finds a root of function in [low, high] for many equations at once. A Newton step is used when
+    it stays inside the bracket, and bisection when it does not, so the iteration converges as long as the function
+    changes sign in the bracket.
+    Args:
+        function:  function of x that returns the value and the derivative, both arrays
+        low(array):  lower limit of the bracket
+        high(array):  upper limit of the bracket
+        tolerance(float):  convergence limit, relative to the width of the bracket
+        max_iterations(int):  maximum number of iterations
+    Returns:
+        x(array):  root, NaN where the function do not change sign in the bracket
+        found(array):  True where the function changes sign in the bracket
+    '''
+    low, high = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float))
+    f_low, f_high = function(low)[0], function(high)[0]
+    found = (np.sign(f_low) != np.sign(f_high)) | (f_low == 0) | (f_high == 0)
+
+    # The bracket is turned so the function is negative in low and positive in high
+    low, high = np.where(f_low > 0, high, low), np.where(f_low > 0, low, high)
+    step_limit = tolerance * np.abs(high - low)
+    x = np.where(f_low == 0, low, np.where(f_high == 0, high, (low + high) / 2))
+    for _ in range(max_iterations):
+        f, df = function(x)
+        low = np.where(f < 0, x, low)
+        high = np.where(f > 0, x, high)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - f / df
+        inside = (newton - low) * (newton - high) < 0
+        x_new = np.where(f == 0, x, np.where(inside, newton, (low + high) / 2))
+        step = np.where(found, np.abs(x_new - x), 0)
+        x = x_new
+        if np.all(step <= step_limit):
+            break
+    return np.where(found, x, np.nan), found
+
+
+class Fibre_section:
+    ''' Class to contain a rectangular cross section split into fibres. Calculations are based on following
+    assumptions from EC2 6.1(2)P:
+    - Full bond between concrete and reinforcement, prestressing strands have an initial strain from the prestress
+    - Naviers hypothesis
+    - Parabola-rectangle relation for concrete from EC2 3.1.7(1), figure 3.3
+    - Reinforcement with horizontal top branch from EC2 3.2.7(2), figure 3.8, and the same for prestressing steel
+      from EC2 3.3.6(7), figure 3.10
+    - Ignore concrete tension strength
+    Strain and stress are positive for compression in concrete and for tension in the reinforcement, and the depth y
+    is measured from the top. All arguments can be arrays with one value for each cross section, and the reinforcement
+    arguments have one extra last axis with one value for each layer.
+    '''
+    def __init__(self, width, height, fcd, eps_c2, eps_cu2, n, area, depth, E, fd, eps_0, fibres: int = 100):
+        '''Args:
+            width(float):  width of cross section, from Cross section class [mm]
+            height(float):  height of cross section, from Cross section class [mm]
+            fcd(float):  design compression strength in concrete, from Material class [N/mm2]
+            eps_c2(float):  compression strain for biggest stress, from Material class
+            eps_cu2(float):  strain limit for compression, from Material class
+            n(float):  exponent, from Material class
+            area(array):  area of each reinforcement layer [mm2]
+            depth(array):  distance from top to each reinforcement layer [mm]
+            E(array):  elasticity modulus for each reinforcement layer [N/mm2]
+            fd(array):  design strength for each reinforcement layer [N/mm2]
+            eps_0(array):  initial strain for each reinforcement layer, 0 for ordinary reinforcement
+            fibres(int):  number of concrete fibres over the height
+        Returns:
+            shape(tuple):  shape of the batch of cross sections
+            y(array):  distance from top to the middle of each fibre [mm]
+            dA(array):  area of each fibre [mm2]
+            M_Rd(array):  moment capacity [kNm]
+            kappa_Rd(array):  curvature when the concrete strain in top reaches eps_cu2 [mm-1]
+            x_Rd(array):  height of compression zone when the moment capacity is reached [mm]
+        '''
+        width, height, fcd, eps_c2, eps_cu2, n = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                                                       (width, height, fcd, eps_c2, eps_cu2, n)))
+        area, depth, E, fd, eps_0 = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float)) for value in
+                                                          (area, depth, E, fd, eps_0)))
+        self.shape = np.broadcast_shapes(width.shape, area.shape[:-1])
+
+        # Cross section values get one axis for the curvatures and one for the fibres or layers
+        self.height = np.broadcast_to(height, self.shape)
+        self.eps_c2, self.eps_cu2 = (np.broadcast_to(value, self.shape) for value in (eps_c2, eps_cu2))
+        self.fcd, self.n = (value[..., None, None] for value in (fcd, n))
+        self.y = (np.arange(fibres) + 0.5) / fibres * height[..., None, None]
+        self.dA = (width * height / fibres)[..., None, None]
+        self.area, self.depth, self.E, self.fd, self.eps_0 = (value[..., None, :] for value in (area, depth, E, fd, eps_0))
+
+        self.kappa_Rd = self.calculate_kappa_Rd()
+        self.x_Rd = self.eps_cu2 / self.kappa_Rd
+        self.M_Rd = self.calculate_forces(self.eps_cu2[..., None], self.kappa_Rd[..., None])[1][..., 0]
+
+    def calculate_concrete_stress(self, eps: np.ndarray) -> tuple:
+        ''' Function that calculates stress in concrete with the parabola-rectangle relation
+        Args:
+            eps(array):  concrete strain, positive for compression
+        Returns:
+            sigma(array):  concrete stress [N/mm2]
+            d_sigma(array):  derivative of the stress with respect to the strain [N/mm2]
+        '''
+        ratio = np.clip(eps / self.eps_c2[..., None, None], 0, 1)
+        sigma = self.fcd * (1 - (1 - ratio) ** self.n) # From EC2 (3.17) and (3.18)
+        d_sigma = np.where((eps > 0) & (ratio < 1), self.fcd * self.n / self.eps_c2[..., None, None] * (1 - ratio) ** (self.n - 1), 0)
+        return sigma, d_sigma
+
+    def calculate_steel_stress(self, eps: np.ndarray) -> tuple:
+        ''' Function that calculates stress in the reinforcement layers, elastic up to the design strength
+        Args:
+            eps(array):  reinforcement strain, positive for tension, including the initial strain
+        Returns:
+            sigma(array):  reinforcement stress [N/mm2]
+            d_sigma(array):  derivative of the stress with respect to the strain [N/mm2]
+        '''
+        sigma = np.clip(self.E * eps, - self.fd, self.fd)
+        d_sigma = np.where(np.abs(self.E * eps) < self.fd, self.E, 0)
+        return sigma, d_sigma
+
+    def calculate_forces(self, eps_top: np.ndarray, kappa: np.ndarray) -> tuple:
+        ''' Function that integrates the stresses over the fibres and reinforcement layers. The strain in the depth y
+        is eps_top - kappa * y.
+        Args:
+            eps_top(array):  concrete strain in top, shape (cross sections, curvatures)
+            kappa(array):  curvature, positive with compression in top, shape (cross sections, curvatures) [mm-1]
+        Returns:
+            N(array):  sum of axial forces, compression minus tension [N]
+            M(array):  moment about the top from the internal forces [kNm]
+            dN_deps(array):  derivative of N with respect to eps_top [N]
+            dN_dkappa(array):  derivative of N with respect to kappa [Nmm]
+        '''
+        eps_top, kappa = eps_top[..., None], kappa[..., None]
+        sigma_c, d_sigma_c = self.calculate_concrete_stress(eps_top - kappa * self.y)
+        sigma_s, d_sigma_s = self.calculate_steel_stress(self.eps_0 - eps_top + kappa * self.depth)
+
+        C, T = sigma_c * self.dA, sigma_s * self.area
+        N = np.sum(C, axis=-1) - np.sum(T, axis=-1)
+        M = (np.sum(T * self.depth, axis=-1) - np.sum(C * self.y, axis=-1)) * 10 ** -6
+        dN_deps = np.sum(d_sigma_c * self.dA, axis=-1) + np.sum(d_sigma_s * self.area, axis=-1)
+        dN_dkappa = - np.sum(d_sigma_c * self.dA * self.y, axis=-1) - np.sum(d_sigma_s * self.area * self.depth, axis=-1)
+        return N, M, dN_deps, dN_dkappa
+
+    def calculate_kappa_Rd(self) -> np.ndarray:
+        ''' Function that finds the curvature where the concrete strain in top is eps_cu2 and the axial forces are in
+        equilibrium. A curvature of 0 gives the whole cross section in compression, and a compression zone of one
+        thousandth of the height gives no concrete force, so the root is bracketed.
+        Returns:
+            kappa_Rd(array):  curvature at the moment capacity [mm-1], NaN if the reinforcement is too big to find
+                              equilibrium with the whole cross section in compression
+        '''
+        eps_top = self.eps_cu2[..., None]
+
+        def function(kappa):
+            N, _, _, dN_dkappa = self.calculate_forces(eps_top, kappa)
+            return N, dN_dkappa
+
+        kappa_Rd, _ = solve_bracketed(function, np.zeros(eps_top.shape), eps_top / (self.height[..., None] * 10 ** -3))
+        return kappa_Rd[..., 0]
+
+    def calculate_moment_curvature(self, kappa) -> tuple:
+        ''' Function that calculates the moment-curvature diagram. For each curvature the top strain is found from
+        equilibrium of the axial forces, between 0 (no concrete force) and the strain that gives stress fcd over the
+        whole height.
+        Args:
+            kappa(array):  curvatures, positive with compression in top. One dimensional for the same curvatures for
+                           all cross sections, or one row for each cross section [mm-1]
+        Returns:
+            M(array):  moment for each curvature, shape (cross sections, curvatures) [kNm], NaN where the concrete
+                       strain in top is bigger than eps_cu2
+            eps_top(array):  concrete strain in top for each curvature
+        Raises:
+            ValueError:  if a curvature is negative
+        '''
+        kappa = np.broadcast_to(np.asarray(kappa, dtype=float), self.shape + np.shape(kappa)[-1:])
+        if np.any(kappa < 0):
+            raise ValueError(f'kappa={kappa.min()}, expected curvatures that give compression in top')
+
+        def function(eps_top):
+            N, _, dN_deps, _ = self.calculate_forces(eps_top, kappa)
+            return N, dN_deps
+
+        eps_top, _ = solve_bracketed(function, np.zeros(kappa.shape), self.eps_c2[..., None] + kappa * self.height[..., None])
+        M = self.calculate_forces(np.nan_to_num(eps_top), kappa)[1]
+        return np.where(eps_top <= self.eps_cu2[..., None], M, np.nan), eps_top
+
+
+def get_reinforcement_layers(beam) -> tuple:
+    ''' Function that finds the reinforcement layers in a beam, in the same places as the ULS classes use them.
+    The bottom layer is ordinary reinforcement in d_1, or prestressed reinforcement in d_2 with the effective
+    prestrain from the ULS prestressed class. The top layer is ordinary reinforcement in cnom when the beam has
+    ordinary reinforcement in top, and has zero area for the other reinforcement cases.
+    Args:
+        beam:  instance of the Beam class
+    Returns:
+        area, depth, E, fd, eps_0(list):  two values each, for the bottom and top layer
+    '''
+    material, cross_section = beam.material_instance, beam.cross_section_instance
+    top_area = cross_section.As if beam.prestressed_and_ordinary_in_top else 0
+    if beam.is_the_beam_prestressed:
+        bottom = (cross_section.Ap, cross_section.d_2, material.Ep, material.fpd, beam.ULS_instance.eps_diff)
+    else:
+        bottom = (cross_section.As, cross_section.d_1, material.Es, material.fyd, 0)
+    top = (top_area, cross_section.cnom, material.Es, material.fyd, 0)
+    return tuple([bottom_value, top_value] for bottom_value, top_value in zip(bottom, top))
+
+
+def get_fibre_section(beams, fibres: int = 100) -> Fibre_section:
+    ''' Function that makes one Fibre section instance for a list of beams, so all cross sections are solved at once
+    Args:
+        beams:  list of instances of the Beam class, or one instance
+        fibres(int):  number of concrete fibres over the height
+    Returns:
+        fibre_section:  instance of the Fibre section class, with one cross section for each beam
+    '''
+    beams = [beams] if not isinstance(beams, (list, tuple)) else beams
+    layers = np.array([get_reinforcement_layers(beam) for beam in beams], dtype=float)
+    material = [beam.material_instance for beam in beams]
+    cross_section = [beam.cross_section_instance for beam in beams]
+    return Fibre_section([cs.width for cs in cross_section], [cs.height for cs in cross_section],
+                         [m.fcd for m in material], [m.eps_c2 for m in material], [m.eps_cu2 for m in material],
+                         [m.n for m in material], *(layers[:, i] for i in range(5)), fibres=fibres)
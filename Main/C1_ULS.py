@@ -4,6 +4,61 @@ import numpy as np
 ''' This script contain the ULS class that apply for ordinary reinforced cross section.
 '''
 
+# Capacity formulas that the ULS class and the Limit state class in the Reliability script use. The arguments can
+# also be arrays or dual numbers.
+
+def calculate_M_Rd(alpha: float, fcd: float, width: float, d: float, lambda_factor: float,
+                   netta: float) -> float:
+    ''' Function that calculates M_Rd based on calculated alpha
+    Args:
+        alpha(float):  Compression-zone-height factor 
+        fcd(float):  design compression strength in concrete, from Material class [N/mm2]
+        width(float):  width of beam, from Cross section class [mm]
+        d(float):  effective height from Cross section class [mm]
+        lambda(float):  factor for the effective height from Material class
+        netta(float):  factor for the effective strength, from Material class
+    Returns: 
+        M_Rd(float):  moment capacity [kNm]
+    '''
+    M_Rd = lambda_factor * netta * alpha * (1 - 0.5 * lambda_factor * alpha) * fcd * width * d ** 2 # from Sørensen (4.14)
+    return M_Rd *  10 ** -6
+
+
+def calculate_V_Rd(d: float, As: float, width: float, fcd: float, gamma_concrete: float, 
+                   fck: int) -> float:
+    ''' Function that calculate V_Rd according to EC2 6.2.2(1), when there is assumed no 
+    calculation based need for shear reinforcement. The arguments can also be arrays or dual numbers.
+    Args:
+        d(float):  effective height, from Cross section class [mm]
+        As(float):  area of reinforcement, from Cross section class[mm2]
+        width(float):  width of beam, from Input class [mm]
+        fcd(float):  design compression strength in concrete, from Material class [N/mm2]
+        gamma_concrete(float):  materialfactor for concrete, from Material class
+        fck(int):  cylinder compression strength, from Material class [N/mm2]
+    Returns:
+        V_Rd(float):  Shear force capacity [kN]
+    '''
+    k = np.minimum(1 + np.sqrt(200 / d), 2)
+
+    ro_l = np.minimum(As / (width * d), 0.02)
+
+    sigma_cp = 0.2 * fcd 
+
+    CRd_c = 0.18 / gamma_concrete # from EC2 NA.6.2.2(1)
+
+    k_1 = 0.15
+
+    v_min = 0.035 * k ** (3/2) * fck ** (0.5) # from EC2 (6.3N)
+
+    V_Rd_c = (CRd_c * k * (100 * ro_l * fck) ** (1/3) + k_1 * sigma_cp) * width * d # from EC2 (6.2.a)
+
+    V_Rd_min = (v_min + k_1 * sigma_cp) * width * d # from EC2 (6.2.b)
+
+    V_Rd = np.maximum(V_Rd_c, V_Rd_min) * 10 ** -3
+
+    return V_Rd
+
+
 class ULS:
     ''' Class to contain all relevant ultimate limit state (ULS) controls. 
     Calculations are based on following assumptions from EC2 6.1(2)P:
@@ -87,14 +142,12 @@ class ULS:
         Returns: 
             M_Rd(float):  moment capacity [kNm]
         '''
-        M_Rd = lambda_factor * netta * alpha * (1 - 0.5 * lambda_factor * alpha) * fcd * width * d ** 2 # from Sørensen (4.14)
-        return M_Rd *  10 ** -6
-    
-    
+        return calculate_M_Rd(alpha, fcd, width, d, lambda_factor, netta)
+
     def calculate_V_Rd(self, d: float, As: float, width: float, fcd: float, gamma_concrete: float, 
                        fck: int) -> float:
         ''' Function that calculate V_Rd according to EC2 6.2.2(1), when there is assumed no 
-        calculation based need for shear reinforcement.
+        calculation based need for shear reinforcement. The arguments can also be arrays or dual numbers.
         Args:
             d(float):  effective height, from Cross section class [mm]
             As(float):  area of reinforcement, from Cross section class[mm2]
@@ -105,26 +158,8 @@ class ULS:
         Returns:
             V_Rd(float):  Shear force capacity [kN]
         '''
-        k = min(1 + np.sqrt(200 / d), 2)
-
-        ro_l = min(As / (width * d), 0.02)
-
-        sigma_cp = 0.2 * fcd 
-
-        CRd_c = 0.18 / gamma_concrete # from EC2 NA.6.2.2(1)
+        return calculate_V_Rd(d, As, width, fcd, gamma_concrete, fck)
 
-        k_1 = 0.15
-
-        v_min = 0.035 * k ** (3/2) * fck ** (0.5) # from EC2 (6.3N)
-
-        V_Rd_c = (CRd_c * k * (100 * ro_l * fck) ** (1/3) + k_1 * sigma_cp) * width * d # from EC2 (6.2.a)
-
-        V_Rd_min = (v_min + k_1 * sigma_cp) * width * d # from EC2 (6.2.b)
-
-        V_Rd = max(V_Rd_c, V_Rd_min) * 10 ** -3
-
-        return V_Rd 
-    
     def control_of_M_cap(self, M_Rd: float, M_Ed: float) -> bool:
         ''' Function that control moment capacity compared with design moment
         Args:
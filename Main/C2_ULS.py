@@ -4,6 +4,26 @@ import numpy as np
 ''' This script contain the ULS class that apply for prestressed reinforced cross section.
 '''
 
+# Capacity formula that the ULS prestressed class and the Limit state class in the Reliability script use. The
+# arguments can also be arrays or dual numbers.
+
+def calculate_moment_capacity(alpha: float, fcd: float, width: float, d: float, lambda_factor: float,
+                              netta: float) -> float:
+    ''' Function that calculates M_Rd based on calculated alpha
+    Args:
+        alpha(float):  Compression-zone-height factor 
+        fcd(float):  design compression strength in concrete, from Material class [N/mm2]
+        width(float):  width of beam, from Input class [mm]
+        d(float):  effective height, from Cross section class [mm]
+        lambda_factor(float):  factor for effective height, from Material class
+        netta(float):  factor for effective strength, from Material class
+    Returns: 
+        M_Rd(float):  moment capacity [kNm]
+    '''
+    M_Rd = netta * lambda_factor * alpha * (1 - 0.5 * lambda_factor * alpha) * fcd * width * d ** 2 # from Sørensen (4.14)
+    return M_Rd *  10 ** -6
+
+
 class ULS_prestressed:
     ''' Class to contain all relevant ultimate limit state (ULS) controls for prestressed cross section.
     All calculations are done according to the standard NS-EN 1992-1-1:2004 (abbreviated to EC2) and the 
@@ -99,9 +119,8 @@ class ULS_prestressed:
         Returns: 
             M_Rd(float):  moment capacity [kNm]
         '''
-        M_Rd = netta * lambda_factor * alpha * (1 - 0.5 * lambda_factor * alpha) * fcd * width * d ** 2 # from Sørensen (4.14)
-        return M_Rd *  10 ** -6
-    
+        return calculate_moment_capacity(alpha, fcd, width, d, lambda_factor, netta)
+
     def control_moment(self, M_Ed: float, M_p: float, M_Rd: float) -> bool:
         ''' Function that control moment capacity 
         Args:   
@@ -34,7 +34,7 @@ class ULS_prestress_and_ordinary:
                                           material.netta, material.fyd, cross_section.As)
         self.M_Rd = self.calculate_moment_capacity(self.alpha, material.fcd, cross_section.width, cross_section.d_2, material.lambda_factor, material.netta, material.fyd, cross_section.As, cross_section.cnom)
         self.M_control = self.control_moment(load.M_Ed, load.M_prestress, self.M_Rd)
-        self.V_Rd = self.calc_shear_capacity(cross_section.d_2, cross_section.Ac, cross_section.width, cross_section.Ap, material.fcd, material.gamma_concrete, material.fck, load.P0, 
+        self.V_Rd = self.calc_shear_capacity(cross_section.d_2, cross_section.Ac, cross_section.width, cross_section.Ap, material.fcd, material.gamma_concrete, material.fck, load.P0_d, 
                                              material.gamma_prestressed_reinforcement, time_effect.loss_percentage)
         self.V_control = self.control_V(self.V_Rd, load.V_Ed, Asw, cross_section.d_2, material.fyd, material.fck, cross_section.width, material.fcd)
         self.M_utilization = self.calculate_utilization_M(self.M_Rd)
@@ -0,0 +1,77 @@
+# Import module numpy as np
+import numpy as np
+
+''' This script contain the Bar diameter table class that apply for all reinforcement cases.
+The table 7.2N from EC2 is made once, and the maximum bar diameter is found for one or many beams at once.
+'''
+
+# Reasons for a maximum bar diameter that could not be found, given as flag by the Bar diameter table class
+inside_table = 0
+stress_above_table = 1
+crack_width_outside_table = 2
+not_calculated = 3
+
+out_of_table_messages = {stress_above_table: 'the stress is bigger that the maximum',
+                         crack_width_outside_table: 'the crack width is outside table 7.2N',
+                         not_calculated: 'the stress or crack width is not calculated'}
+
+
+class Bar_diameter_table:
+    ''' Class to contain a table of maximum bar diameters, with bilinear interpolation between the crack widths and
+    reinforcement stresses. The coefficients for each cell in the table are calculated once, so a query only needs to
+    find the cell with searchsorted and evaluate a polynomial.
+    '''
+    def __init__(self, diameters: list, stresses: list, crack_widths: list):
+        '''Args:
+            diameters(list):  bar diameter matrix, one row for each crack width and one column for each stress [mm]
+            stresses(list):  reinforcement stresses, increasing [N/mm2]
+            crack_widths(list):  crack widths [mm]
+        Returns:
+            stresses(array):  reinforcement stresses, increasing [N/mm2]
+            crack_widths(array):  crack widths, increasing [mm]
+            coefficients(array):  c0 + c1 * s + c2 * t + c3 * s * t for each cell, where s and t is the position in the
+                                  cell along the crack width and stress, shape (crack widths - 1, stresses - 1, 4)
+        '''
+        order = np.argsort(crack_widths)
+        Ø = np.asarray(diameters, dtype=float)[order]
+        self.crack_widths = np.asarray(crack_widths, dtype=float)[order]
+        self.stresses = np.asarray(stresses, dtype=float)
+
+        corner_00, corner_10 = Ø[:-1, :-1], Ø[1:, :-1]
+        corner_01, corner_11 = Ø[:-1, 1:], Ø[1:, 1:]
+        self.coefficients = np.stack([corner_00, corner_10 - corner_00, corner_01 - corner_00,
+                                      corner_11 - corner_10 - corner_01 + corner_00], axis=-1)
+
+    def get_max_bar_diameter(self, w_max, sigma) -> tuple:
+        ''' Function that finds the maximum bar diameter with bilinear interpolation. A stress under the lowest stress
+        in the table is set to the lowest stress.
+        Args:
+            w_max(float or array):  limit value of crack width [mm]
+            sigma(float, array or dual number):  reinforcement stress [N/mm2], a dual number gives the derivatives of
+                the interpolation
+        Returns:
+            max_bar_diameter(array):  maximum bar diameter to limit crack width [mm], NaN outside the table
+            flag(array):  inside_table, or the reason the maximum bar diameter could not be found
+        '''
+        w_max = np.asarray(w_max, dtype=float)
+        w, a = self.crack_widths, self.stresses
+
+        sigma = np.maximum(sigma, a[0]) # limiting the stress to fit into the table
+        k = np.clip(np.searchsorted(w, w_max, side='right') - 1, 0, len(w) - 2)
+        i = np.clip(np.searchsorted(a, sigma, side='right') - 1, 0, len(a) - 2)
+        s = (w_max - w[k]) / (w[k + 1] - w[k])
+        t = (sigma - a[i]) / (a[i + 1] - a[i])
+
+        c = self.coefficients[k, i]
+        max_bar_diameter = c[..., 0] + c[..., 1] * s + c[..., 2] * t + c[..., 3] * s * t
+
+        flag = np.where(sigma > a[-1], stress_above_table, inside_table)
+        flag = np.where((w_max < w[0]) | (w_max > w[-1]), crack_width_outside_table, flag)
+        flag = np.where(np.isnan(w_max) | np.isnan(sigma), not_calculated, flag)
+        return np.where(flag == inside_table, max_bar_diameter, np.nan), flag
+
+
+# From EC2 table 7.2N
+table_7_2N = Bar_diameter_table(diameters=[[40, 32, 20, 16, 12, 10, 8, 6], [32, 25, 16, 12, 10, 8, 6, 5], [25, 16, 12, 8, 6, 5, 4, 0]],
+                                stresses=[160, 200, 240, 280, 320, 360, 400, 450],
+                                crack_widths=[0.4, 0.3, 0.2])
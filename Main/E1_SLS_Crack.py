@@ -1,6 +1,9 @@
 # Import module numpy as np
 import numpy as np
 
+from E0_Bar_diameter import table_7_2N, inside_table, out_of_table_messages # From the Bar diameter script, import table 7.2N from EC2
+from Q0_Dual import Dual # From the Dual script, import the Dual class (kept for the sensitivity of the utilization degrees)
+
 ''' This script contain the Crack control class that apply for ordinary reinforced cross section.
 '''
 
@@ -24,6 +27,7 @@ class Crack_control:
             alpha(float):  factor for calculating reinforcment stress
             sigma_s(float):  reinforcement stress [N/mm2]
             max_bar_diameter(float):  maximum bar diameter to limit crack width [mm
+            table_flag(int):  inside_table, or the reason the maximum bar diameter is outside table 7.2N
             control_bar_diameter(boolean):  control of bar diameter, return True or False
         '''
         self.k_c = self.calculate_kc(cross_section.cnom, cross_section.c_min_dur)
@@ -133,42 +137,23 @@ class Crack_control:
 
     def calculate_maximal_bar_diameter(self, w_max: float, sigma: float) -> float:
         ''' Function that calculates max bar diameter according to EC2 table 7.2N, using 
-        interpolation in two directions. The bar diameters are implemented as a matrix Ø , the reinforcement 
-        tension as vector a, and crack width as vector w.
+        interpolation in two directions, from the Bar diameter table class.
         Args:
             w_max(float):  limit value of crack width [mm]
             sigma(float):  reinforcement stress [N/mm2]
         Returns:
-            max_bar_diameter(float):  maximum bar diameter to limit crack width [mm]
+            max_bar_diameter(float):  maximum bar diameter to limit crack width [mm], None outside the table. A Dual
+                                      number if sigma is a Dual number
         '''
+        max_bar_diameter, flag = table_7_2N.get_max_bar_diameter(w_max, sigma)
+        self.table_flag = int(flag)
 
-        # limiting the stress to fit into table 7.2N from EC2
-        if sigma < 160:
-            sigma = 160
-        elif sigma > 450:
-            sigma = None
-        else:
-            sigma = sigma 
-
-        # If sigma is outside the range of the table, return None    
-        if sigma == None:
-            max_bar_diameter = None
+        # If sigma or the crack width is outside the range of the table, return None
+        if self.table_flag != inside_table:
+            return None
+        max_bar_diameter = max_bar_diameter[()]
+        return max_bar_diameter if isinstance(max_bar_diameter, Dual) else float(max_bar_diameter)
 
-        else:
-            Ø = ([[40, 32, 20, 16, 12, 10, 8, 6],[32, 25, 16, 12, 10, 8, 6, 5],[25, 16, 12, 8, 6, 5, 4, 0]])  #  Bar diameter matrix
-            a = [160, 200, 240, 280, 320, 360, 400, 450]  #  Reinforcement tension vector
-            w = [0.4, 0.3, 0.2]  #  Crack width vector
-        
-            for k in range(0,len(w)-1,1):
-                if w[k] >= w_max > w[k+1]:
-                    for i in range(len(a) - 1):
-                        x1 = Ø[k][i] * (w[k+1]-w_max)/(w[k+1]-w[k]) + Ø[k+1][i]* (w_max-w[k])/(w[k+1]-w[k]) 
-                        x2 = Ø[k][i+1] * (w[k+1]-w_max)/(w[k+1]-w[k]) + Ø[k+1][i+1]* (w_max-w[k])/(w[k+1]-w[k]) 
-                        if a[i] <= sigma < a[i + 1]:
-                            max_bar_diameter = x1 * (a[i+1]-sigma) / (a[i+1]-a[i]) + x2 * (sigma-a[i]) / (a[i+1] - a[i])
-
-        return max_bar_diameter
-            
     def control_of_bar_diameter(self, bar_diameter: float, max_bar_diameter: float) -> bool:
         ''' Control of max bar diameter compared to given bar_diameter. 
         Args:
@@ -178,7 +163,7 @@ class Crack_control:
             True if given reinforcement diameter is suifficent, or False if its not suifficent
         '''
         if max_bar_diameter == None:
-            return (f'the stress is bigger that the maximum, and the crack control could not be executed')
+            return (f'{out_of_table_messages[self.table_flag]}, and the crack control could not be executed')
         elif bar_diameter < max_bar_diameter:
             return True
         else: 
@@ -0,0 +1,122 @@
+# Import module numpy as np
+import numpy as np
+
+''' This script contain the Span class that apply for all reinforcement cases.
+The simply supported beam is split into points along the span, and moment, shear force, curvature and deflection
+are found in each point, for one or many beams at once.
+'''
+
+class Span:
+    ''' Class to contain moment, shear force, curvature and deflection along the span of a simply supported beam with
+    distributed load. The cross section is cracked where the design moment is bigger than the crack moment, and
+    tension stiffening is found in each point according to EC2 7.4.3(3). The deflection line is found by integrating
+    the curvature twice, so zeta varies along the span instead of using the value in the middle of the beam.
+    All arguments can be arrays with one value for each beam, and the results then get one row for each beam.
+    '''
+    def __init__(self, length, q_d, q_longlasting, EI_1, EI_2, M_cr, K_s, points: int = 1000):
+        '''Args:
+            length(float):  length of beam, from Input class [m]
+            q_d(float):  design load, from Load properties class [kN/m]
+            q_longlasting(float):  long lasting load that gives deflection with creep, g + p * factor / 100 [kN/m]
+            EI_1(float):  bending stiffness for uncracked cross section, from Deflection class [Nmm2]
+            EI_2(float):  bending stiffness for cracked cross section, from Deflection class [Nmm2]
+            M_cr(float):  crack moment, from Deflection class [kNm]
+            K_s(float):  curvature because of shrinkage, from Deflection class [mm-1]
+            points(int):  number of points along the span, including both supports
+        Returns:
+            x(array):  position along the span, from the left support [m]
+            M_Ed(array):  design moment [kNm]
+            V_Ed(array):  design shear force [kN]
+            cracked(array):  True where the cross section is cracked
+            zeta(array):  distribution factor for tension stiffening
+            curvature(array):  curvature including creep and shrinkage, with tension stiffening [mm-1]
+            deflection(array):  deflection line, positive downwards [mm]
+            max_deflection(float):  largest deflection along the span [mm]
+        '''
+        length, q_d, q_longlasting, EI_1, EI_2, M_cr, K_s = (np.asarray(value, dtype=float)[..., None] for value in
+                                                             (length, q_d, q_longlasting, EI_1, EI_2, M_cr, K_s))
+        self.x = np.linspace(0, 1, points) * length
+        self.M_Ed = self.calculate_moment(self.x, length, q_d)
+        self.V_Ed = self.calculate_shear_force(self.x, length, q_d)
+        self.cracked = self.M_Ed >= M_cr
+        self.zeta = self.calculate_zeta(self.M_Ed, M_cr, self.cracked)
+        self.curvature = self.calculate_curvature(self.calculate_moment(self.x, length, q_longlasting), EI_1, EI_2, K_s, self.zeta)
+        self.deflection = self.calculate_deflection_line(self.x * 1000, self.curvature)
+        self.max_deflection = np.max(self.deflection, axis=-1)
+
+    def calculate_moment(self, x: np.ndarray, length: float, q: float) -> np.ndarray:
+        ''' Function that calculates moment along a simply supported beam with distributed load
+        Args:
+            x(array):  position along the span [m]
+            length(float):  length of beam [m]
+            q(float):  distributed load [kN/m]
+        Returns:
+            M(array):  moment [kNm]
+        '''
+        M = q * x * (length - x) / 2
+        return M
+
+    def calculate_shear_force(self, x: np.ndarray, length: float, q: float) -> np.ndarray:
+        ''' Function that calculates shear force along a simply supported beam with distributed load
+        Args:
+            x(array):  position along the span [m]
+            length(float):  length of beam [m]
+            q(float):  distributed load [kN/m]
+        Returns:
+            V(array):  shear force [kN]
+        '''
+        V = q * (length / 2 - x)
+        return V
+
+    def calculate_zeta(self, M_Ed: np.ndarray, M_cr: float, cracked: np.ndarray) -> np.ndarray:
+        ''' Function that calculates the distribution factor zeta in each point. Assumed long term load to find beta,
+        as the Deflection class.
+        Args:
+            M_Ed(array):  design moment [kNm]
+            M_cr(float):  crack moment [kNm]
+            cracked(array):  True where the cross section is cracked
+        Returns:
+            zeta(array):  distribution factor, 0 where the cross section is uncracked
+        '''
+        beta = 0.5 # Assumed longterm loads
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(M_Ed > 0, M_cr / M_Ed, 0) # A crack moment of 0 gives zeta = 1 also at the supports
+        zeta = np.where(cracked, 1 - beta * ratio ** 2, 0) # From EC2 (7.19)
+        return zeta
+
+    def calculate_curvature(self, M: np.ndarray, EI_1: float, EI_2: float, K_s: float, zeta: np.ndarray) -> np.ndarray:
+        ''' Function that calculates curvature with tension stiffening, as an interpolation between the cracked
+        and uncracked curvature. The curvature because of shrinkage is the same for cracked and uncracked.
+        Args:
+            M(array):  moment from long lasting load [kNm]
+            EI_1(float):  bending stiffness for uncracked cross section [Nmm2]
+            EI_2(float):  bending stiffness for cracked cross section [Nmm2]
+            K_s(float):  curvature because of shrinkage [mm-1]
+            zeta(array):  distribution factor
+        Returns:
+            curvature(array):  curvature [mm-1]
+        '''
+        curvature_uncracked = M * 10 ** 6 / EI_1 + K_s
+        curvature_cracked = M * 10 ** 6 / EI_2 + K_s
+        curvature = zeta * curvature_cracked + (1 - zeta) * curvature_uncracked # From EC2 (7.18)
+        return curvature
+
+    def calculate_deflection_line(self, x: np.ndarray, curvature: np.ndarray) -> np.ndarray:
+        ''' Function that integrates the curvature twice with the trapezoidal rule. The integration constants are
+        found from zero deflection at both supports.
+        Args:
+            x(array):  position along the span [mm]
+            curvature(array):  curvature [mm-1]
+        Returns:
+            deflection(array):  deflection line, positive downwards [mm]
+        '''
+        dx = np.diff(x, axis=-1)
+        rotation = np.zeros(curvature.shape)
+        rotation[..., 1:] = np.cumsum((curvature[..., 1:] + curvature[..., :-1]) / 2 * dx, axis=-1)
+        integral = np.zeros(curvature.shape)
+        integral[..., 1:] = np.cumsum((rotation[..., 1:] + rotation[..., :-1]) / 2 * dx, axis=-1)
+
+        # The deflection is minus the double integral, with a linear term so it is zero at both supports
+        deflection = integral[..., -1:] * (x - x[..., :1]) / (x[..., -1:] - x[..., :1]) - integral
+        return deflection
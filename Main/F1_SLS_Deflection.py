@@ -1,6 +1,9 @@
 # Import module numpy as np
 import numpy as np
 
+from B0_Shrinkage import Shrinkage, calculate_eps_cd0 # From the Shrinkage script, import the Shrinkage class and EC2 (B.11)
+from F0_Span import Span # From the Span script, import the Span class (for moment, curvature and deflection along the span)
+
 ''' This script contain the Deflection class that apply for ordinary reinforced cross section.
 '''
 
@@ -33,6 +36,7 @@ class Deflection:
             deflection_cracked(float):  deflection including creep for cracked cross section [mm]
             M_cr(float):  crack moment [kNm]
             control_Mcr(bool)  True if cracked cross section. False if uncracked cross section
+            shrinkage:  instance for Shrinkage class that gives shrinkage strain at any age
             eps_cd(float):  shrinkage strain due to drying over time
             eps_ca(float):  autogenous shrinkage strain
             eps_cs(float):  total shrinkage strain
@@ -55,8 +59,9 @@ class Deflection:
         self.M_cr = self.calculate_M_cr(material.fctm, self.Ic1, self.netta, self.Is1, cross_section.height, self.alpha_uncracked, cross_section.d_1)
         self.control_Mcr = self.control_of_Mcr(self.M_cr, load.M_Ed)
         self.eps_cd0 = self.calculate_eps_cd_0(cement_class, RH, material.fcm)
-        self.eps_cd = self.calculate_eps_cd(self.eps_cd0, cross_section.Ac, cross_section.width, cross_section.height)
-        self.eps_ca = self.calculate_eps_ca(material.fck)
+        self.shrinkage = self.calculate_shrinkage(self.eps_cd0, cross_section.Ac, cross_section.width, cross_section.height, material.fck)
+        self.eps_cd = self.calculate_eps_cd(self.shrinkage)
+        self.eps_ca = self.calculate_eps_ca(self.shrinkage)
         self.eps_cs = self.calculate_eps_cs(self.eps_cd, self.eps_ca)
         self.K_s = self.calculate_curvature(self.eps_cs, self.netta, cross_section.As, cross_section.Ac, cross_section.height, cross_section.d_1, cross_section.width)
         self.deflection_shrinkage = self.calculate_deflection_shrinkage(self.K_s, length)
@@ -244,67 +249,58 @@ class Deflection:
         Raises:
             ValueError:  checks if the cement class equals R, N or S.
         '''
-        if cement_class == 'S': 
-            alpha_ds1 = 3 
-            alpha_ds2 = 0.13
-        elif cement_class == 'N':
-            alpha_ds1 = 4
-            alpha_ds2 = 0.12
-        elif cement_class == 'R':
-            alpha_ds1 = 6
-            alpha_ds2 = 0.11
-        else:
-            raise ValueError(f'cement_class={cement_class}, expected R, N or S')
-        
-        fcm0 = 10 
-
-        RH0 = 100 
-
-        beta_RH = 1.55 * (1 - (RH / RH0) ** 3) # From EC2 (B.12)
-
-        eps_cd0 = 0.85 * ((220 + 110 * alpha_ds1) * np.exp(- alpha_ds2 * (fcm/fcm0))) * 10 ** (-6) * beta_RH # From EC2 (B.11)
+        eps_cd0 = calculate_eps_cd0(cement_class, RH, fcm) # From EC2 (B.11) and (B.12)
         return eps_cd0
 
-    def calculate_eps_cd(self, eps_cd0: float, Ac: float, width: float, height: float) -> float:
-        ''' Function that calculates shrinkage strain due to drying over time, according to EC2 3.1.4(6) 
-        and table 3.3. 't' is assumed 50 years = 18263 days, and for conservative calculations, its assumed
-        t = infintiy, which makes beta_ds = 1. The function nterpolates table 3.3 to find correct k_h
-        Args: 
+    def calculate_eps_cd(self, shrinkage: Shrinkage) -> float:
+        ''' Function that gives shrinkage strain due to drying over time, according to EC2 3.1.4(6).
+        't' is assumed 50 years = 18263 days, and for conservative calculations, its assumed
+        t = infintiy, which makes beta_ds = 1. k_h from table 3.3 is found once, in the Shrinkage class
+        Args:
+            shrinkage:  instance for Shrinkage class
+        Returns:
+            eps_cd(float):  shrinkage strain due to drying over time
+        '''
+        eps_cd = shrinkage.eps_cd_inf # From EC2 (3.9) with beta_ds = 1
+        return eps_cd
+
+    def calculate_shrinkage(self, eps_cd0: float, Ac: float, width: float, height: float, fck: int) -> Shrinkage:
+        ''' Function that makes the Shrinkage class, which keeps the factors that do not depend on the age, so
+        shrinkage can be found at other ages than t = infinity
+        Args:
             eps_cd0(float):  nominal free shrinkage strain due to drying
             Ac(float):  concrete area, from Cross section class [mm2]
             width(float):  width of cross section, from Input class [mm]
             height(float):  height of cross section, from Input class [mm]
+            fck(int):  cylinder compression strength, from Material class [N/mm2]
         Returns:
-            eps_cd(float):  shrinkage strain due to drying over time
+            shrinkage:  instance for Shrinkage class
+        Raises:
+            ValueError:  if the effective thickness is outside table 3.3 in EC2
         '''
-        h_0 = 2 * Ac / (2 * width + 2 * height) # effective width 
+        h_0 = 2 * Ac / (2 * width + 2 * height) # effective width
+        return Shrinkage(h_0, eps_cd0, fck)
 
-        # Interpolation EC2 table 3.3
-        h_0_vector = [100,200,300,500]
-        k_h_vector = [1,0.85,0.75,0.7]
-        for i in range(len(h_0_vector)-1):
-            if h_0_vector[i+1] >= h_0 >= h_0_vector[i]:
-                k_h = ((k_h_vector[i+1] - k_h_vector[i]) / (h_0_vector[i+1] - h_0_vector[i]) ) * (h_0 - h_0_vector[i]) + k_h_vector[i]
-
-        beta_ds = 1 # From EC2 (3.10) with t = infinity 
+    def calculate_eps_cs_at_age(self, t, ts: float = 7) -> np.ndarray:
+        ''' Function that calculates total shrinkage strain at the age t, according to EC2 (3.8) - (3.13)
+        Args:
+            t(float or array):  concrete age at the considered time, or a vector of ages [days]
+            ts(float):  concrete age when drying starts, assumed at the end of curing after 7 days [days]
+        Returns:
+            eps_cs(float or array):  total shrinkage strain
+        '''
+        return self.shrinkage.calculate_eps_cs(t, ts)
 
-        eps_cd = beta_ds * k_h * eps_cd0 # From EC2 (3.9)
-        return eps_cd
-    
-    def calculate_eps_ca(self, fck: int) -> float:
-        ''' Function that calculates autogenous shrinkage strain, according to EC2 3.1.4(6). 
+    def calculate_eps_ca(self, shrinkage: Shrinkage) -> float:
+        ''' Function that gives autogenous shrinkage strain, according to EC2 3.1.4(6).
         't' is assumed 50 years = 18263 days, and for conservative calculations, its assumed
-        t = infintiy, which makes beta_as = 1. 
-        Args: 
-            fck(int):  cylinder compression strength, from Material class [N/mm2]
+        t = infintiy, which makes beta_as = 1.
+        Args:
+            shrinkage:  instance for Shrinkage class
         Returns:
             eps_ca(float):  autogenous shrinkage strain
         '''
-        beta_as = 1 # From EC2 (3.13) with t = infinity
-
-        eps_ca_inf = 2.5 * (fck - 10) * 10 ** -6 # From EC2 (3.12)
-
-        eps_ca = beta_as * eps_ca_inf # From EC2 (3.11)
+        eps_ca = shrinkage.eps_ca_inf # From EC2 (3.11) with beta_as = 1
         return eps_ca
 
     def calculate_eps_cs(self, eps_cd: float, eps_ca: float) -> float:
@@ -379,6 +375,19 @@ class Deflection:
             (1 - zeta) * (deflection_uncracked + deflection_shrinkage) # From EC2 (7.18)
         return total_deflection
 
+    def calculate_span(self, load, length: float, factor: float, points: int = 1000) -> Span:
+        ''' Function that calculates moment, shear force, curvature and deflection in points along the span, with
+        tension stiffening in each point instead of only in the middle of the beam
+        Args:
+            load:  instance from Load properties class that contain all load properties
+            length(float):  length of beam, from Input class [m]
+            factor(float):  percentage of live load that is long lasting, from Input class [%]
+            points(int):  number of points along the span
+        Returns:
+            span:  instance for Span class with the deflection line
+        '''
+        return Span(length, load.q_d, load.g_d + load.p_d * factor / 100, self.EI_1, self.EI_2, self.M_cr, self.K_s, points)
+
     def control_deflection(self, length: float, total_deflection: float) -> bool:
         ''' Function that control max deflection according to EC2 7.4.1(4)
         Args:
@@ -1,8 +1,145 @@
 # Import module numpy as np
 import numpy as np
+import math
 
-''' This script contain the Cracked stress class that apply for prestressed reinforced cross section.
+''' This script contain the Cracked stress class that apply for prestressed reinforced cross section, and the
+functions that solve the third degree equation for alpha, for one cross section or many at once.
 '''
+
+def solve_cubic(a3, a2, a1, a0, newton_steps: int = 2) -> tuple:
+    ''' Function that solves the third degree equation a3 * x^3 + a2 * x^2 + a1 * x + a0 = 0 in closed form, for
+    arrays of coefficients. Three real roots are found with the trigonometric method, and one real root with
+    Cardano's formula. The real roots are polished with Newton iterations, since Cardano's formula loses precision
+    when the two cube roots almost cancel. If a3 is 0, the second degree equation is solved.
+    Args:
+        a3, a2, a1, a0(array):  coefficients, any shape that can be broadcast together
+        newton_steps(int):  number of Newton iterations on the real roots
+    Returns:
+        roots(array):  roots, shape (..., 3). For a complex pair, the real part is given
+        real(array):  True for the real roots, shape (..., 3). False for the complex pair and missing roots
+    '''
+    a3, a2, a1, a0 = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (a3, a2, a1, a0)))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Normalized and depressed equation t^3 + p * t + q = 0, with x = t - b / 3
+        b, c, d = a2 / a3, a1 / a3, a0 / a3
+        shift = b / 3
+        p = c - b * shift
+        q = shift * (2 * shift ** 2 - c) + d
+        discriminant = (q / 2) ** 2 + (p / 3) ** 3
+        cubic = np.isfinite(discriminant) & (a3 != 0)
+        one = cubic & (discriminant > 10 ** -12 * ((q / 2) ** 2 + np.abs(p / 3) ** 3)) # A double root is not split by rounding
+        three = cubic & ~one
+
+        # One real root and a complex pair (Cardano)
+        root = np.sqrt(discriminant)
+        cardano = np.cbrt(-q / 2 + root) + np.cbrt(-q / 2 - root) - shift
+
+        # Three real roots (trigonometric method), in decreasing order
+        r = 2 * np.sqrt(-p / 3)
+        angle = np.where(p == 0, 0, np.arccos(np.clip(3 * q / (p * r), -1, 1)) / 3) # p = 0 is a triple root
+        trigonometric = [r * np.cos(angle - 2 * np.pi * k / 3) - shift for k in range(3)]
+
+        # Second degree equation if a3 is 0
+        quadratic = (a3 == 0) & (a2 != 0) & np.isfinite(a2 * a1 * a0)
+        root = np.sqrt(a1 ** 2 - 4 * a2 * a0)
+        quadratic_real = quadratic & np.isfinite(root)
+
+        roots = [np.where(one, cardano, np.where(three, trigonometric[0], np.where(quadratic, (-a1 + root) / (2 * a2), np.nan))),
+                 np.where(three, trigonometric[1], np.where(quadratic, (-a1 - root) / (2 * a2), np.nan)),
+                 np.where(three, trigonometric[2], np.nan)]
+        real = [one | three | quadratic_real, three | quadratic_real, three]
+
+        # Newton iterations on the real roots
+        for _ in range(newton_steps):
+            for k in range(3):
+                x = roots[k]
+                f = ((a3 * x + a2) * x + a1) * x + a0
+                df = (3 * a3 * x + 2 * a2) * x + a1
+                step = f / df
+                roots[k] = np.where(real[k] & np.isfinite(step), x - step, x)
+
+        # The real part of the complex pair from the polished real root, since the sum of the roots is -b
+        complex_part = (-b - roots[0]) / 2
+        roots[1] = np.where(one, complex_part, roots[1])
+        roots[2] = np.where(one, complex_part, roots[2])
+    return np.stack(roots, axis=-1), np.stack(real, axis=-1)
+
+
+def solve_cubic_scalar(a3: float, a2: float, a1: float, a0: float, newton_steps: int = 2) -> tuple:
+    ''' Function that solves one third degree equation a3 * x^3 + a2 * x^2 + a1 * x + a0 = 0 with the same method as
+    the solve cubic function, but with Python floats and the math module. For one equation, the NumPy arrays cost
+    much more time than the formulas, so the Cracked stress class uses this function for one beam.
+    Args:
+        a3, a2, a1, a0(float):  coefficients
+        newton_steps(int):  number of Newton iterations on the real roots
+    Returns:
+        roots(list):  three roots, NaN for missing roots. For a complex pair, the real part is given
+        real(list):  True for the real roots. False for the complex pair and missing roots
+    '''
+    a3, a2, a1, a0 = float(a3), float(a2), float(a1), float(a0)
+    roots, real = [math.nan] * 3, [False] * 3
+    one = False
+    if a3 != 0 and math.isfinite(a3 * a2 * a1 * a0):
+        # Normalized and depressed equation t^3 + p * t + q = 0, with x = t - b / 3
+        b, c, d = a2 / a3, a1 / a3, a0 / a3
+        shift = b / 3
+        p = c - b * shift
+        q = shift * (2 * shift ** 2 - c) + d
+        discriminant = (q / 2) ** 2 + (p / 3) ** 3
+        if math.isfinite(discriminant):
+            one = discriminant > 10 ** -12 * ((q / 2) ** 2 + abs(p / 3) ** 3) # A double root is not split by rounding
+            if one:
+                # One real root and a complex pair (Cardano)
+                root = math.sqrt(discriminant)
+                roots[0] = math.cbrt(-q / 2 + root) + math.cbrt(-q / 2 - root) - shift
+                real[0] = True
+            else:
+                # Three real roots (trigonometric method), in decreasing order. p = 0 is a triple root
+                r = 2 * math.sqrt(-p / 3)
+                angle = 0 if p == 0 else math.acos(min(max(3 * q / (p * r), -1), 1)) / 3
+                roots = [r * math.cos(angle - 2 * math.pi * k / 3) - shift for k in range(3)]
+                real = [True] * 3
+    elif a3 == 0 and a2 != 0 and math.isfinite(a2 * a1 * a0):
+        # Second degree equation if a3 is 0
+        discriminant = a1 ** 2 - 4 * a2 * a0
+        if discriminant >= 0:
+            root = math.sqrt(discriminant)
+            roots[:2] = (-a1 + root) / (2 * a2), (-a1 - root) / (2 * a2)
+            real[:2] = True, True
+
+    # Newton iterations on the real roots
+    for _ in range(newton_steps):
+        for k in range(3):
+            if real[k]:
+                x = roots[k]
+                df = (3 * a3 * x + 2 * a2) * x + a1
+                if df != 0:
+                    step = (((a3 * x + a2) * x + a1) * x + a0) / df
+                    if math.isfinite(step):
+                        roots[k] = x - step
+
+    # The real part of the complex pair from the polished real root, since the sum of the roots is -b
+    if one:
+        roots[1] = roots[2] = (-b - roots[0]) / 2
+    return roots, real
+
+
+def get_admissible_root(roots: np.ndarray, real: np.ndarray, low: float = 0, high: float = 1) -> tuple:
+    ''' Function that picks the lowest real root between low and high
+    Args:
+        roots(array):  roots from the solve cubic function, shape (..., 3)
+        real(array):  True for the real roots, shape (..., 3)
+        low(float):  lower limit, not included
+        high(float):  upper limit, not included
+    Returns:
+        root(array):  lowest admissible root, NaN if there is none
+        found(array):  True if there is an admissible root
+    '''
+    admissible = real & (roots > low) & (roots < high)
+    root = np.min(np.where(admissible, roots, np.inf), axis=-1)
+    found = np.any(admissible, axis=-1)
+    return np.where(found, root, np.nan), found
+
 class Cracked_Stress:
     '''Class to contain calculation of cracked prestressed cross section. 
     All calculations are done according to the standard NS-EN 1992-1-1:2004 (abbreviated to EC2) and the 
@@ -24,6 +161,7 @@ class Cracked_Stress:
             Ns(float):  axial force because of free shrink [kN]
             a(float):  ratio between moment and axial force [mm]
             alpha(float):  factor for calculating stresses
+            alpha_found(boolean):  True if alpha is a real root of Sørensen (6.24) between 0 and 1
             sigma_c(float):  stress in concrete top [N/mm2]
         '''
         self.Ec_middle = self.calculate_Ec_middle(material.Ecm, creep_number.phi_selfload, creep_number.phi_liveload, load.Mg_d, load.Mp_d, load.M_prestress, time_effect.loss_percentage)
@@ -116,7 +254,8 @@ class Cracked_Stress:
     
     def calculate_alpha(self, d :float, e: float, a: float, netta: float, ro_l: float) -> float:
         ''' Function that calculates factor alpha, using a function to calculate
-        a third degree equation, from Sørensen (6.24)
+        a third degree equation, from Sørensen (6.24). If no real root is between 0 and 1, the real part of a
+        complex pair between 0 and 1 is used, as the earlier solution with np.roots did, and alpha_found is set to False.
         Args:
             d(float):  effective height, from Cross section class[mm]
             e(float):  distance to reinforcement, from Cross section class [mm]
@@ -124,16 +263,16 @@ class Cracked_Stress:
             netta(float): material stiffness ratio
             ro_l(float): reinforcement ratio
         Returns:
-            alpha(float):  factor
+            alpha(float):  lowest real root between 0 and 1. If there is none, the lowest real part of a complex
+                           pair between 0 and 1, and NaN only if neither is between 0 and 1
         '''
-        coefficients = [d / (6 * (e + a)), 0.5 * (1 - d / (e + a)), netta * ro_l, - netta * ro_l] 
-
-        roots = np.roots(coefficients)
+        roots, real = solve_cubic_scalar(d / (6 * (e + a)), 0.5 * (1 - d / (e + a)), netta * ro_l, - netta * ro_l)
 
-        for num in roots:
-            if 0 < num < 1:            
-                alpha = float(num)
-                return alpha
+        admissible = [root for root, is_real in zip(roots, real) if is_real and 0 < root < 1]
+        self.alpha_found = bool(admissible)
+        if not admissible:
+            admissible = [root for root in roots if 0 < root < 1] # NaN is never between 0 and 1
+        return min(admissible) if admissible else math.nan
     
     def calculate_concrete_stress_cracked(self, d: float, width: float, alpha: float, netta: float, ro_l: float) -> float:
         ''' Function that calculates concrete stress in top of cross section, sørensen (6.25)
@@ -1,9 +1,59 @@
 # Import module numpy as np
 import numpy as np
+from functools import lru_cache
 
-''' This script contain the Time effects class that apply for prestressed reinforced cross section.
+''' This script contain the Time effects class that apply for prestressed reinforced cross section, and the
+Relaxation class that gives relaxation loss over time for one prestress strand.
 '''
 
+# Time after the prestress is applied for each construction stage, where the stage losses are found [days]
+construction_stages = {'transfer': 0, 'erection': 28, '1 year': 365, '50 years': 18263}
+
+
+class Relaxation:
+    ''' Class to contain relaxation loss over time for one prestress strand, according to EC2 3.3.2(7). Assumed
+    class 2: low relaxation. The parts that do not depend on time are calculated once.
+    '''
+    def __init__(self, fpk: float, fp01k: float):
+        '''Args:
+            fpk(float):  characteristic strength for prestress, from Material class [N/mm2]
+            fp01k(float):  0.1% limit of strength for prestress, from Material class [N/mm2]
+        Returns:
+            sigma_pi(float):  initial prestress [N/mm2]
+            ro_1000(float):  relaxation loss after 1000 hours [%]
+            my(float):  ratio between initial prestress and fpk
+            factor(float):  part of EC2 (3.29) that does not depend on time [N/mm2]
+            exponent(float):  exponent for time in EC2 (3.29)
+        '''
+        self.sigma_pi = min(0.75 * fpk, 0.85 * fp01k) # From EC2 (5.43)
+        self.ro_1000 = 2.5 # 3.3.2(6), assumed class 2 from 3.3.2(4)
+        self.my = self.sigma_pi / fpk # From EC2 3.3.2(7)
+        self.factor = self.sigma_pi * 0.66 * self.ro_1000 * np.e ** (9.1 * self.my) * 10 ** (-5) # From EC2 (3.29)
+        self.exponent = 0.75 * (1 - self.my) # From EC2 (3.29)
+
+    def calculate_delta_sigma_pr(self, t) -> float:
+        ''' Function that calculates relaxation loss for one or many times
+        Args:
+            t(float or array):  time after stress-application [hours]
+        Returns:
+            delta_sigma_pr(float or array):  absolute value of relaxation loss [N/mm2]
+        '''
+        delta_sigma_pr = self.factor * (np.asarray(t, dtype=float) / 1000) ** self.exponent # From EC2 (3.29)
+        return delta_sigma_pr[()]
+
+
+@lru_cache(maxsize=1024)
+def get_relaxation(fpk: float, fp01k: float) -> Relaxation:
+    ''' Function that gives a shared Relaxation class for each prestress strand
+    Args:
+        fpk(float):  characteristic strength for prestress [N/mm2]
+        fp01k(float):  0.1% limit of strength for prestress [N/mm2]
+    Returns:
+        relaxation:  instance of the Relaxation class
+    '''
+    return Relaxation(fpk, fp01k)
+
+
 class time_effects:
     ''' Class to contain losses that is caused by time, including shrink, creep and relaxation. 
     All calculations are done according to the standard NS-EN 1992-1-1:2004 (abbreviated to EC2) and the 
@@ -22,31 +72,31 @@ class time_effects:
             loss(float):  stress reduction in prestress because for relaxation, shrink and creep [N/mm2]
             loss_percentage(float):  stress reduction in prestress because for relaxation, shrink and creep [%]
         '''
-        self.delta_relaxation = self.calculate_delta_sigma_pr(material.fpk, material.fp01k,500000)
+        # Kept for the losses over time
+        self.relaxation = get_relaxation(float(material.fpk), float(material.fp01k))
+        self.creep_number = creep_number
+        self.shrinkage = deflection.shrinkage
+        self.sigma_c_QP = stress_uncracked.sigma_c_uncracked[2]
+        self.sigma_p_max = load.sigma_p_max
+        self.Ep, self.Ecm = material.Ep, material.Ecm
+        self.section_factor = (cross_section.Ap / cross_section.Ac) * (1 + (cross_section.Ac / cross_section.Ic) * cross_section.e ** 2)
+
+        self.delta_relaxation = self.calculate_delta_sigma_pr(500000)
         self.loss = self.calculate_stress_reduction(deflection.eps_cs, material.Ep, material.Ecm, self.delta_relaxation, creep_number.phi_selfload,
                                                     stress_uncracked.sigma_c_uncracked[2], cross_section.Ap, cross_section.Ac, cross_section.Ic, cross_section.e) 
         self.loss_percentage = self.calculate_loss_percentage(self.loss, load.sigma_p_max)
     
 
-    def calculate_delta_sigma_pr(self, fpk: float, fp01k: float, t) -> float:
+    def calculate_delta_sigma_pr(self, t) -> float:
         ''' Calculation of loss in stress because of relaxation, where the steel is exposed to constant
         strain for long time, according to EC2 3.3.2(7) and 5.10.3(2). Assumed class 2: low relaxation. 
         Args:
-            fpk(float):  characteristic strength for prestress, from Material class [N/mm2]
-            fp01k(float):  0.1% limit of strength for prestress, from Material class [N/mm2]
             t(int):  time after stress-application, assumed t = 500 000 from EC2 3.3.2(8).[hours]
            
         Returns:
             delta_sigma_pr(float):  Absolute value of relaxation loss [N/mm2]
         '''
-        sigma_pi = min(0.75 * fpk, 0.85 * fp01k) # From EC2 (5.43)
-
-        ro_1000 = 2.5 # 3.3.2(6), assumed class 2 from 3.3.2(4)
-
-        my = sigma_pi / fpk # From EC2 3.3.2(7)
-
-        # Assumed class 2, from EC2 (3.29):
-        delta_sigma_pr = sigma_pi * (0.66 * ro_1000 * np.e ** (9.1 * my) * ((t/1000) ** (0.75 * (1 - my))) * 10 ** (-5)) 
+        delta_sigma_pr = self.relaxation.calculate_delta_sigma_pr(t) # Assumed class 2, from EC2 (3.29)
         return delta_sigma_pr
 
     def calculate_stress_reduction(self, eps_cs: float, Ep: float, Ecm: float, delta_sigma_pr: float, phi_selfload: float,
@@ -83,4 +133,52 @@ class time_effects:
             loss(float):  precentage loss because of shrink, creep and relaxation [%]
         '''
         loss_percentage = (delta_sigma_p * 100) / sigma_p_max
-        return loss_percentage
\ No newline at end of file
+        return loss_percentage
+
+    def calculate_losses_over_time(self, t, t0: float = None, ts: float = 7) -> dict:
+        ''' Function that calculates the losses because of relaxation, shrink and creep for many times in one
+        evaluation, with the same formula as the stress reduction function. Only shrink and creep after the prestress is
+        applied give losses.
+        Args:
+            t(float or array):  concrete ages at the considered times [days]
+            t0(float):  concrete age when the prestress is applied, as default when self-load is applied [days]
+            ts(float):  concrete age when drying starts, from the Shrinkage class [days]
+        Returns:
+            losses(dict):  one array for each of:
+            relaxation(array):  loss because of relaxation [N/mm2]
+            shrinkage(array):  loss because of shrink [N/mm2]
+            creep(array):  loss because of creep [N/mm2]
+            loss(array):  total loss [N/mm2]
+            loss_percentage(array):  total loss [%]
+        '''
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        t0 = self.creep_number.t0_self if t0 is None else t0
+
+        loaded = np.maximum(t, t0) # Times before the prestress is applied give the same strain as t0, so no shrink
+        eps_cs = self.shrinkage.calculate_eps_cs(loaded, ts) - self.shrinkage.calculate_eps_cs(t0, ts) # Shrink after the prestress is applied
+        delta_sigma_pr = self.relaxation.calculate_delta_sigma_pr(np.maximum(t - t0, 0) * 24) # Relaxation, time in hours
+        phi = self.creep_number.calculate_phi_matrix(t, t0)[0]
+
+        denominator = 1 + (self.Ep / self.Ecm) * self.section_factor * (1 + 0.8 * phi) # From EC2 (5.46)
+        losses = {'relaxation': 0.8 * delta_sigma_pr / denominator,
+                  'shrinkage': eps_cs * self.Ep / denominator,
+                  'creep': (self.Ep / self.Ecm) * phi * abs(self.sigma_c_QP) / denominator}
+        before = t <= t0
+        for name in ('relaxation', 'shrinkage', 'creep'):
+            losses[name] = np.where(before, 0.0, losses[name]) # No losses before the prestress is applied
+        losses['loss'] = losses['relaxation'] + losses['shrinkage'] + losses['creep']
+        losses['loss_percentage'] = self.calculate_loss_percentage(losses['loss'], self.sigma_p_max)
+        return losses
+
+    def calculate_stage_losses(self, stages: dict = None) -> dict:
+        ''' Function that calculates the stage losses, the losses at each construction stage, in one evaluation.
+        Only the losses are given, they are not checked against limits for each stage
+        Args:
+            stages(dict):  time after the prestress is applied for each stage [days], as default construction_stages
+        Returns:
+            stage_losses(dict):  for each stage, a dict with relaxation, shrinkage, creep, loss [N/mm2] and loss_percentage [%]
+        '''
+        stages = construction_stages if stages is None else stages
+        t0 = self.creep_number.t0_self
+        losses = self.calculate_losses_over_time(t0 + np.array(list(stages.values()), dtype=float), t0)
+        return {stage: {name: float(value[i]) for name, value in losses.items()} for i, stage in enumerate(stages)}
@@ -0,0 +1,810 @@
+# Import module numpy as np
+import numpy as np
+from types import SimpleNamespace
+
+from A0_Input import Input # From the Input script, import the Input class (for the default values of all fields)
+from B0_Material import get_material, get_concrete_index, get_strand_index, material_attributes, strand_table # From the Material script, import the function that gives shared Material records (for all reinforcement patterns)
+from B0_Creep_number import calculate_beta_fcm, calculate_phi_RH, calculate_t0_adjusted, calculate_beta_t0, calculate_beta_c # From the Creep number script, import the formulas from EC2 annex B
+from B0_Shrinkage import calculate_k_h, calculate_eps_cd0, calculate_eps_ca_inf # From the Shrinkage script, import table 3.3 and the shrinkage formulas from EC2
+from E0_Bar_diameter import table_7_2N # From the Bar diameter script, import table 7.2N from EC2
+from G2_SLS_Cracked import solve_cubic, get_admissible_root # From the Cracked stress script, import the third degree equation solver
+
+''' This script contain the Beam batch class that apply for all reinforcement cases.
+The class evaluates the same checks as the Beam class in the Results script, but for many beams at once. Every
+input field is given as a column (array) and every result is returned as a column, so the formulas from the
+Material, Cross section, Load, Creep number, ULS, Reinforcement, Crack, Deflection, Stress and Time effects
+classes are evaluated with one NumPy operation for the whole batch instead of one object per beam.
+'''
+
+# Names of all input fields in the Input class, in the order they are defined
+input_fields = tuple(vars(Input()).keys())
+
+# Input fields that are given as text or as True/False
+text_fields = ('concrete_class', 'steel_class', 'cement_class', 'exposure_class', 'prestressed_reinforcment_name')
+bool_fields = ('is_the_beam_prestressed', 'prestressed_and_ordinary_in_top')
+
+# Names of all result columns from the Beam batch class
+result_fields = ('is_the_beam_prestressed', 'prestressed_and_ordinary_in_top',
+                 'M_Rd', 'M_Ed', 'M_control', 'M_utilization',
+                 'V_Rd', 'V_Ed', 'V_control', 'V_utilization',
+                 'As_control', 'As_utilization', 'Asw_control', 'Asw_utilization',
+                 'crack_control', 'crack_utilization', 'max_bar_diameter', 'bar_diameter_flag',
+                 'deflection_control', 'deflection_utilization', 'total_deflection',
+                 'stress_control', 'alpha_found', 'passed',
+                 'concrete_emission', 'ordinary_reinforcement_emission', 'prestressed_reinforcement_emission', 'total_emission',
+                 'cost_concrete', 'cost_reinforcement', 'total_cost')
+
+
+def columns_from_inputs(inputs) -> dict:
+    ''' Function that collects a list of Input instances into columns that can be given to the Beam batch class
+    Args:
+        inputs:  list or other iterable with instances of the Input class
+    Returns:
+        columns(dict):  one array for each field in the Input class
+    '''
+    inputs = list(inputs)
+    columns = {}
+    for field in input_fields:
+        values = [getattr(input, field) for input in inputs]
+        if field in text_fields:
+            columns[field] = np.array(values, dtype=object)
+        elif field in bool_fields:
+            columns[field] = np.array(values, dtype=bool)
+        else:
+            columns[field] = np.array(values, dtype=float)
+    return columns
+
+
+class Beam_batch:
+    ''' Class to contain all beam checks related to ULS and SLS for a batch of beams. The formulas are the same as
+    in the Beam class and the classes it makes instances of, only evaluated for arrays instead of one beam.
+    Checks that the Beam class does not run for a reinforcement case are given as False, and the column "passed"
+    tells if all checks that are relevant for the reinforcement case are suifficient.
+    Where the Beam class would stop with an error for one beam (for instance a reinforcement stress outside table 7.2N
+    or an effective thickness outside table 3.3 in EC2), the batch gives NaN for that beam and continue with the rest.
+    '''
+    def __init__(self, columns: dict, controls: bool = True):
+        '''Args:
+            columns(dict):  array or single value for each field in the Input class. Fields that are not given
+                            get the value from the Input class, and single values are used for all beams.
+            controls(boolean):  if False, only emission and cost are calculated, and all controls are False
+        Returns:
+            size(int):  number of beams in the batch
+            One array for each name in result_fields, where:
+            M_Rd(float):  moment capacity [kNm]
+            M_Ed(float):  design moment the capacity is controlled against, including prestress [kNm]
+            V_Rd(float):  shear capacity, including shear reinforcement if needed [kN]
+            V_Ed(float):  design shear force [kN]
+            M_control, V_control, As_control, Asw_control, crack_control, deflection_control, stress_control(bool):
+                            result of each control, True if suifficient
+            M_utilization, V_utilization, As_utilization, Asw_utilization, crack_utilization, deflection_utilization(float):
+                            utilization degree for each control [%]
+            max_bar_diameter(float):  maximum bar diameter to limit crack width [mm]
+            bar_diameter_flag(float):  inside_table, or the reason the maximum bar diameter is outside table 7.2N, from the Bar diameter script
+            total_deflection(float):  deflection including both shrinkage and creep, with tension stiffening [mm]
+            alpha_found(bool):  True if the cracked stress factor alpha is a real root between 0 and 1, only for prestressed beams
+            passed(bool):  True if all controls that apply for the reinforcement case are suifficient
+            concrete_emission, ordinary_reinforcement_emission, prestressed_reinforcement_emission, total_emission(float):
+                            emissions [kg CO2 eq.]
+            cost_concrete, cost_reinforcement, total_cost(float):  cost [NOK], reinforcement and total cost only for
+                            ordinary reinforced beams as in the Beam class
+        '''
+        input = self.get_columns(columns)
+        self.size = len(input.width)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+
+            # Defines the columns that is common for all cases of reinforcement
+
+            material = self.get_material(input)
+            cross_section = self.calculate_cross_section(input, material)
+            self.allocate_results(input)
+            self.calculate_emissions_and_cost(input, material, cross_section)
+            if not controls:
+                return
+
+            load = self.calculate_load(input, material, cross_section)
+            creep = self.calculate_creep(input, material, cross_section)
+            deflection_1 = self.calculate_deflection(input, material, cross_section, load, creep)
+
+            prestressed = input.is_the_beam_prestressed
+            top = input.prestressed_and_ordinary_in_top
+            groups = [(np.flatnonzero(~prestressed), self.calculate_ordinary),
+                      (np.flatnonzero(prestressed & ~top), self.calculate_prestressed),
+                      (np.flatnonzero(prestressed & top), self.calculate_prestress_and_ordinary)]
+
+            # Each reinforcement case is calculated for its own beams, and the results are put back in the columns
+
+            for index, calculate in groups:
+                if len(index) > 0:
+                    results = calculate(*(self.take(stage, index) for stage in (input, material, cross_section, load, creep, deflection_1)))
+                    for name, value in results.items():
+                        getattr(self, name)[index] = value
+
+    def get_columns(self, columns: dict) -> SimpleNamespace:
+        ''' Function that makes one array with equal length for each field in the Input class
+        Args:
+            columns(dict):  array or single value for each field in the Input class
+        Returns:
+            input:  namespace with one array for each field in the Input class
+        Raises:
+            ValueError:  if a field do not exist in the Input class, or the columns have different length
+        '''
+        unknown = set(columns) - set(input_fields)
+        if unknown:
+            raise ValueError(f'There is no input field called {sorted(unknown)}')
+
+        default = Input()
+        values = {field: columns.get(field, getattr(default, field)) for field in input_fields}
+
+        lengths = {len(value) for value in values.values() if np.ndim(value) == 1}
+        if len(lengths) > 1:
+            raise ValueError(f'All columns must have the same length, got lengths {sorted(lengths)}')
+        size = lengths.pop() if lengths else 1
+
+        input = SimpleNamespace()
+        for field, value in values.items():
+            if field in text_fields:
+                array = np.empty(size, dtype=object)
+                array[:] = value
+            elif field in bool_fields:
+                array = np.broadcast_to(np.asarray(value, dtype=bool), (size,)).copy()
+            else:
+                array = np.broadcast_to(np.asarray(value, dtype=float), (size,)).copy()
+            setattr(input, field, array)
+        return input
+
+    def take(self, stage: SimpleNamespace, index: np.ndarray) -> SimpleNamespace:
+        ''' Function that picks out some of the beams from one calculation stage
+        Args:
+            stage:  namespace with one array for each attribute
+            index(array):  index of the beams to pick out
+        Returns:
+            namespace with the same attributes, only for the chosen beams
+        '''
+        return SimpleNamespace(**{name: value[index] for name, value in vars(stage).items()})
+
+    def allocate_results(self, input: SimpleNamespace):
+        ''' Function that makes the result columns. Values are NaN and controls are False until they are calculated.
+        Args:
+            input:  namespace with one array for each field in the Input class
+        '''
+        for name in result_fields:
+            if name in ('M_control', 'V_control', 'As_control', 'Asw_control', 'crack_control', 'deflection_control',
+                        'stress_control', 'alpha_found', 'passed'):
+                setattr(self, name, np.zeros(self.size, dtype=bool))
+            else:
+                setattr(self, name, np.full(self.size, np.nan))
+        self.is_the_beam_prestressed = input.is_the_beam_prestressed.copy()
+        self.prestressed_and_ordinary_in_top = input.is_the_beam_prestressed & input.prestressed_and_ordinary_in_top
+
+    def get_results(self) -> dict:
+        ''' Function that collects all result columns
+        Returns:
+            results(dict):  one array for each name in result_fields
+        '''
+        return {name: getattr(self, name) for name in result_fields}
+
+#-------------COMMON FOR ALL REINFORCEMENT CASES---------------------------------------------------------------
+
+    def get_material(self, input: SimpleNamespace) -> SimpleNamespace:
+        ''' Function that finds material properties from the Material class. The Material class is only made once for
+        each combination of concrete class, steel class and prestress, and the properties are spread out to all beams.
+        Args:
+            input:  namespace with one array for each field in the Input class
+        Returns:
+            material:  namespace with one array for each attribute in the Material class
+        Raises:
+            ValueError:  If a concrete class do not exist
+        '''
+        # Concrete and prestress are coded with their row in the tables in the Material script, and steel class in order of appearance
+        concrete = get_concrete_index(input.concrete_class)
+        strand = get_strand_index(input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter) + 1
+        steel_classes = {}
+        steel = np.fromiter((steel_classes.setdefault(steel_class, len(steel_classes)) for steel_class in input.steel_class),
+                            dtype=int, count=len(input.steel_class))
+
+        combined = (concrete * len(steel_classes) + steel) * (len(strand_table) + 1) + strand
+        _, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+
+        instances = [get_material(input.concrete_class[i], float(input.steel_class[i][1:4]), input.prestressed_reinforcment_name[i],
+                              input.prestressed_reinforcment_diameter[i]) for i in first]
+
+        material = SimpleNamespace()
+        for name in material_attributes:
+            setattr(material, name, np.array([getattr(instance, name) for instance in instances], dtype=float)[inverse.reshape(-1)])
+        return material
+
+    def calculate_cross_section(self, input: SimpleNamespace, material: SimpleNamespace) -> SimpleNamespace:
+        ''' Function that calculates the cross section properties, the same way as the Cross section class
+        Args:
+            input:  namespace with one array for each field in the Input class
+            material:  namespace with one array for each attribute in the Material class
+        Returns:
+            cross_section:  namespace with one array for each attribute in the Cross section class
+        Raises:
+            ValueError:  if an exposure class do not exist
+        '''
+        cs = SimpleNamespace()
+        cs.width = input.width
+        cs.height = input.height
+        cs.Ac = input.width * input.height
+        cs.Ic = (input.width * input.height ** 3) / 12
+        cs.c_min_b = np.maximum(input.ordinary_reinforcement_diameter, 10)
+
+        # c_min_dur from EC2 table NA.4.4N, X0 use c_min_b
+        c_min_dur_table = {'XC1': 15, 'XC2': 25, 'XC3': 25, 'XC4': 25, 'XD1': 40, 'XS1': 40, 'XD2': 40, 'XD3': 40, 'XS2': 40, 'XS3': 50}
+        cs.c_min_dur = np.empty(len(input.width))
+        for exposure_class in set(input.exposure_class):
+            rows = input.exposure_class == exposure_class
+            if exposure_class == 'X0':
+                cs.c_min_dur[rows] = cs.c_min_b[rows]
+            elif exposure_class in c_min_dur_table:
+                cs.c_min_dur[rows] = c_min_dur_table[exposure_class]
+            else:
+                raise ValueError (f'There is no exposure class called{exposure_class} and therefor no value for c.min.dur')
+
+        cs.cnom = np.maximum(np.maximum(cs.c_min_b, cs.c_min_dur), 10) + 10 # From 4.4.1.2(2) and 4.4.1.1(2)
+        cs.As = (0.5 * input.ordinary_reinforcement_diameter) ** 2 * np.pi * input.nr_ordinary_reinforcement_bars
+        cs.d_1 = input.height - cs.cnom - 0.5 * input.ordinary_reinforcement_diameter - input.stirrup_diameter
+        cs.d_2 = input.height - cs.cnom - 0.5 * input.prestressed_reinforcment_diameter - input.stirrup_diameter
+        cs.e = input.height / 2 - cs.cnom + input.stirrup_diameter + input.prestressed_reinforcment_diameter / 2
+        cs.Ap = input.nr_prestressed_bars * material.Ap_strand
+        return cs
+
+    def calculate_load(self, input: SimpleNamespace, material: SimpleNamespace, cs: SimpleNamespace) -> SimpleNamespace:
+        ''' Function that calculates the load properties, the same way as the Load properties class
+        Args:
+            input:  namespace with one array for each field in the Input class
+            material:  namespace with one array for each attribute in the Material class
+            cs:  namespace with one array for each attribute in the Cross section class
+        Returns:
+            load:  namespace with one array for each attribute in the Load properties class
+        '''
+        length = input.beam_length
+        load = SimpleNamespace()
+        load.g_k = input.distributed_selfload
+        load.p_k = input.distributed_liveload
+        load.q_k = load.g_k + load.p_k
+        load.g_d = load.g_k * material.gamma_selfload
+        load.p_d = load.p_k * material.gamma_liveload
+        load.q_d = load.g_d + load.p_d
+        load.Mg_k = (load.g_k * length ** 2) / 8
+        load.Mp_k = (load.p_k * length ** 2) / 8
+        load.M_k = load.Mg_k + load.Mp_k
+        load.Mg_d = (load.g_d * length ** 2) / 8
+        load.Mp_d = (load.p_d * length ** 2) / 8
+        load.M_Ed = load.Mg_d + load.Mp_d
+        load.V_k = load.q_k * length / 2
+        load.V_Ed = load.q_d * length / 2
+        load.sigma_p_max = np.minimum(0.8 * material.fpk, 0.9 * material.fp01k) # From EC2 5.10.2.1(1)
+        load.P0_d = load.sigma_p_max * cs.Ap
+        load.M_prestress = - load.P0_d * cs.e * 10 ** -6
+        return load
+
+    def calculate_creep(self, input: SimpleNamespace, material: SimpleNamespace, cs: SimpleNamespace, t: int = 18263) -> SimpleNamespace:
+        ''' Function that calculates the creep numbers, the same way as the Creep number class (EC2 annex B)
+        Args:
+            input:  namespace with one array for each field in the Input class
+            material:  namespace with one array for each attribute in the Material class
+            cs:  namespace with one array for each attribute in the Cross section class
+            t(int):  concrete age at the considered time, assumed 50 years [days]
+        Returns:
+            creep:  namespace with one array for each attribute in the Creep number class
+        '''
+        fcm = material.fcm
+        RH = input.relative_humidity
+        t0_self = input.selfload_application
+        t0_live = input.liveload_application
+        creep = SimpleNamespace()
+        creep.h0 = (2 * cs.Ac) / (2 * (cs.width + cs.height)) # From (B.6)
+        creep.beta_fcm = calculate_beta_fcm(fcm)
+        creep.phi_RH = calculate_phi_RH(creep.h0, fcm, RH)
+        creep.t0_adjusted_self = calculate_t0_adjusted(t0_self, input.cement_class)
+        creep.t0_adjusted_live = calculate_t0_adjusted(t0_live, input.cement_class)
+        creep.beta_t0_self = calculate_beta_t0(creep.t0_adjusted_self)
+        creep.beta_t0_live = calculate_beta_t0(creep.t0_adjusted_live)
+        creep.phi_0_self = creep.phi_RH * creep.beta_fcm * creep.beta_t0_self # From (B.2)
+        creep.phi_0_live = creep.phi_RH * creep.beta_fcm * creep.beta_t0_live # From (B.2)
+        creep.beta_c = calculate_beta_c(t0_self, t, RH, creep.h0, fcm)
+        creep.phi_selfload = creep.phi_0_self * creep.beta_c # From (B.1)
+        creep.phi_liveload = creep.phi_0_live * creep.beta_c # From (B.1)
+        return creep
+
+    def calculate_shrinkage(self, input: SimpleNamespace, material: SimpleNamespace, cs: SimpleNamespace) -> np.ndarray:
+        ''' Function that calculates total shrinkage strain, the same way as the Deflection classes.
+        Assumed t = infinity, which makes beta_ds = 1 and beta_as = 1.
+        Args:
+            input:  namespace with one array for each field in the Input class
+            material:  namespace with one array for each attribute in the Material class
+            cs:  namespace with one array for each attribute in the Cross section class
+        Returns:
+            eps_cs(array):  total shrinkage strain
+        '''
+        eps_cd0 = calculate_eps_cd0(input.cement_class, input.relative_humidity, material.fcm)
+
+        h_0 = 2 * cs.Ac / (2 * cs.width + 2 * cs.height)
+        eps_cd = calculate_k_h(h_0) * eps_cd0 # From EC2 (3.9), with k_h from table 3.3
+
+        eps_ca = calculate_eps_ca_inf(material.fck)
+        return eps_cd + eps_ca # From EC2 (3.8)
+
+    def calculate_deflection(self, input: SimpleNamespace, material: SimpleNamespace, cs: SimpleNamespace, load: SimpleNamespace,
+                             creep: SimpleNamespace, time_effect: SimpleNamespace = None) -> SimpleNamespace:
+        ''' Function that calculates deflection, the same way as the Deflection class, or the Deflection prestressed class
+        when time effects are given.
+        Args:
+            input:  namespace with one array for each field in the Input class
+            material:  namespace with one array for each attribute in the Material class
+            cs:  namespace with one array for each attribute in the Cross section class
+            load:  namespace with one array for each attribute in the Load properties class
+            creep:  namespace with one array for each attribute in the Creep number class
+            time_effect:  namespace with time effect losses, only for prestressed cross section
+        Returns:
+            deflection:  namespace with the attributes from the Deflection classes
+        '''
+        Ec_eff_selfload = material.Ecm / (1 + creep.phi_selfload) # From EC2 (7.20)
+        Ec_eff_liveload = material.Ecm / (1 + creep.phi_liveload) # From EC2 (7.20)
+
+        deflection = SimpleNamespace()
+        if time_effect is None:
+            A, d, E_reinforcement = cs.As, cs.d_1, material.Es
+            deflection.Ec_middle = load.M_Ed / (load.Mg_d / Ec_eff_selfload + load.Mp_d / Ec_eff_liveload) # From Sørensen (5.25)
+        else:
+            A, d, E_reinforcement = cs.Ap, cs.d_2, material.Ep
+            M_prestress = np.abs(load.M_prestress * (1 - time_effect.loss_percentage / 100))
+            deflection.Ec_middle = (M_prestress + load.Mg_d + load.Mp_d) / ((M_prestress + load.Mg_d) / Ec_eff_selfload + load.Mp_d / Ec_eff_liveload) # Based on Sørensen (5.25)
+
+        # Both Deflection classes use Es in the stiffness ratio, also for prestressed reinforcement
+        deflection.netta = netta = material.Es / deflection.Ec_middle
+        width, h, length = cs.width, cs.height, input.beam_length
+        ro = A / (width * d)
+        longlasting_load = load.g_d + load.p_d * (input.percent_longlasting_liveload / 100)
+
+        alpha_uncracked = np.minimum(1, (cs.Ac * 0.5 * h + netta * A * d) / (d * (cs.Ac + netta * A))) # From Sørensen (5.13)
+        Ic1 = (width * h ** 3) / 12 + width * h * (alpha_uncracked * d - h / 2) ** 2 # From Sørensen (5.14)
+        Is1 = A * (d - alpha_uncracked * d) ** 2 # From Sørensen (5.15)
+        EI_1 = deflection.Ec_middle * Ic1 + E_reinforcement * Is1 # From Sørensen (5.16)
+        deflection_uncracked = (5 * longlasting_load * (length * 1000) ** 4) / (384 * EI_1)
+
+        alpha_cracked = np.sqrt((netta * ro) ** 2 + 2 * netta * ro) - netta * ro # From Sørensen (5.5)
+        Ic2 = (width * (alpha_cracked * d) ** 3) / 3 # From Sørensen (5.6)
+        Is2 = A * ((1 - alpha_cracked) * d) ** 2 # From Sørensen (5.7)
+        EI_2 = deflection.Ec_middle * Ic2 + material.Es * Is2 # From Sørensen (5.8)
+        deflection_cracked = (5 * longlasting_load * (length * 1000) ** 4) / (384 * EI_2)
+
+        deflection.M_cr = fctm_M_cr = material.fctm * (Ic1 + netta * Is1) / (h - alpha_uncracked * d) * 10 ** (-6) # From Sørensen (5.20)
+        deflection.control_Mcr = load.M_Ed >= fctm_M_cr
+
+        deflection.eps_cs = self.calculate_shrinkage(input, material, cs)
+        a = (cs.Ac * 0.5 * h + netta * A * d) / (cs.Ac + netta * A) # From Sørensen ex. 5.6
+        e = d - a # From Sørensen ex. 5.6
+        I = (width * h ** 3) / 12 + width * h * (a - h / 2) ** 2 + netta * A * e ** 2 # From Sørensen ex. 5.6
+        K_s = deflection.eps_cs * netta * (A * e) / I # From Sørensen (5.33)
+        deflection_shrinkage = (K_s * (length * 1000) ** 2) / 8
+
+        zeta = np.where(deflection.control_Mcr, 1 - 0.5 * (deflection.M_cr / load.M_Ed) ** 2, 0) # From EC2 (7.19)
+        deflection.total_deflection = zeta * (deflection_cracked + deflection_shrinkage) + \
+            (1 - zeta) * (deflection_uncracked + deflection_shrinkage) # From EC2 (7.18)
+
+        max_deflection = (length * 1000) / 250 # From EC2 7.4.1(4)
+        deflection.control = max_deflection > deflection.total_deflection
+        deflection.utilization = np.round((max_deflection / deflection.total_deflection) * 100, 1)
+        return deflection
+
+#-------------ULS, REINFORCEMENT AND CRACK CONTROL---------------------------------------------------------------
+
+    def calculate_alpha(self, a: np.ndarray, b: np.ndarray, c: np.ndarray, under_reinforced: np.ndarray,
+                        alpha_under: np.ndarray) -> np.ndarray:
+        ''' Function that chooses alpha for under-reinforced cross section, or the largest root of the
+        abc-formula for over-reinforced cross section, as in the ULS classes
+        Args:
+            a, b, c(array):  coefficients of the quadratic equation for over-reinforced cross section
+            under_reinforced(array):  True if the cross section is under-reinforced
+            alpha_under(array):  alpha for under-reinforced cross section
+        Returns:
+            alpha(array):  Compression-zone-height factor
+        '''
+        root = np.sqrt(b ** 2 - 4 * a * c)
+        alpha_over = np.maximum((- b + root) / (2 * a), (- b - root) / (2 * a))
+        return np.where(under_reinforced, alpha_under, alpha_over)
+
+    def calculate_V_Rd(self, d: np.ndarray, ro_l: np.ndarray, width: np.ndarray, sigma_cp: np.ndarray,
+                       gamma_concrete: np.ndarray, fck: np.ndarray) -> np.ndarray:
+        ''' Function that calculate V_Rd according to EC2 6.2.2(1), when there is assumed no
+        calculation based need for shear reinforcement.
+        Args:
+            d(array):  effective height [mm]
+            ro_l(array):  reinforcement ratio, limited to 0.02
+            width(array):  width of beam [mm]
+            sigma_cp(array):  concrete compression stress from axial force [N/mm2]
+            gamma_concrete(array):  materialfactor for concrete
+            fck(array):  cylinder compression strength [N/mm2]
+        Returns:
+            V_Rd(array):  Shear force capacity [kN]
+        '''
+        k = np.minimum(1 + np.sqrt(200 / d), 2)
+        CRd_c = 0.18 / gamma_concrete # from EC2 NA.6.2.2(1)
+        k_1 = 0.15
+        v_min = 0.035 * k ** (3/2) * fck ** (0.5) # from EC2 (6.3N)
+        V_Rd_c = (CRd_c * k * (100 * ro_l * fck) ** (1/3) + k_1 * sigma_cp) * width * d # from EC2 (6.2.a)
+        V_Rd_min = (v_min + k_1 * sigma_cp) * width * d # from EC2 (6.2.b)
+        return np.maximum(V_Rd_c, V_Rd_min) * 10 ** -3
+
+    def calculate_V_Rds(self, Asw: np.ndarray, d: np.ndarray, fyd: np.ndarray, alpha_cw: np.ndarray, fck: np.ndarray,
+                        width: np.ndarray, fcd: np.ndarray) -> np.ndarray:
+        ''' Function that calculates shear capacity if there is calculation-based need for shear reinforcement, EC2 6.2.3(3)
+        Args:
+            Asw(array):  area of shear reinforcement per meter [mm2/mm]
+            d(array):  effective height [mm]
+            fyd(array):  design tension strength in reinforcement [N/mm2]
+            alpha_cw(array):  coefficient for the stress in the compression chord
+            fck(array):  cylinder compression strength [N/mm2]
+            width(array):  width of beam [mm]
+            fcd(array):  design compression strength in concrete [N/mm2]
+        Returns:
+            V_Rds(array):  shear capacity with shear reinforcement [kN]
+        '''
+        v = 0.6 * (1 - fck / 250) # from EC2 (6.6N)
+        return np.minimum(Asw * 0.9 * d * fyd * 10 ** -3, alpha_cw * v * width * 0.9 * d * fcd * 10 ** -3) # from EC2 (6.8)
+
+    def calculate_alpha_cw(self, sigma_cp: np.ndarray, fcd: np.ndarray) -> np.ndarray:
+        ''' Function that calculates alpha_cw for prestressed cross section, as in the ULS prestressed classes
+        Args:
+            sigma_cp(array):  concrete compression stress from axial force [N/mm2]
+            fcd(array):  design compression strength in concrete [N/mm2]
+        Returns:
+            alpha_cw(array):  coefficient for the stress in the compression chord
+        '''
+        return np.select([(0 < sigma_cp) & (sigma_cp <= 0.25 * fcd), (0.25 < sigma_cp) & (sigma_cp <= 0.5 * fcd)],
+                         [1 + sigma_cp / fcd, 1.25], # from EC2 (6.11.aN) and (6.11.bN)
+                         2.5 * (1 - sigma_cp / fcd)) # from EC2 (6.11.cN)
+
+    def calculate_As_min(self, material: SimpleNamespace, width: np.ndarray, d: np.ndarray) -> np.ndarray:
+        ''' Function that calculates As minimum according to EC2 9.2.1.1(1)
+        Args:
+            material:  namespace with one array for each attribute in the Material class
+            width(array):  width of beam [mm]
+            d(array):  effective height [mm]
+        Returns:
+            As_min(array):  Minimum reinforcement [mm2]
+        '''
+        return np.maximum(0.26 * (material.fctm / material.fyk) * width * d, 0.0013 * width * d)
+
+    def calculate_Asw_min(self, material: SimpleNamespace, width: np.ndarray) -> np.ndarray:
+        ''' Function that calculates minimum shear reinforcement according to EC2 9.2.2(5), vertical bars
+        Args:
+            material:  namespace with one array for each attribute in the Material class
+            width(array):  width of beam [mm]
+        Returns:
+            Asw_min(array):  minimum shear reinforcement [mm2/mm]
+        '''
+        ro_w_min = 0.1 * np.sqrt(material.fck) / material.fyk # From EC2 (9.5N)
+        return ro_w_min * width * np.sin(np.pi / 2) # From EC2 (9.4)
+
+    def calculate_crack_width(self, input: SimpleNamespace, cs: SimpleNamespace) -> np.ndarray:
+        ''' Function that get the limit value for crack width according to table NA.7.1 and NA.7.3.1
+        Args:
+            input:  namespace with one array for each field in the Input class
+            cs:  namespace with one array for each attribute in the Cross section class
+        Returns:
+            crack_width(array):  limit value of crack width [mm]
+        '''
+        k_c = np.minimum(cs.cnom / cs.c_min_dur, 1.3)
+        return np.where(input.exposure_class == 'X0', 0.4, 0.3 * k_c)
+
+    def calculate_ordinary(self, input, material, cs, load, creep, deflection) -> dict:
+        ''' Function that calculates all checks for ordinary reinforced beams, as the ULS, Reinforcement control,
+        Crack control and Deflection classes.
+        Args:
+            input, material, cs, load, creep, deflection:  namespaces for the beams in this reinforcement case
+        Returns:
+            results(dict):  result columns for the beams in this reinforcement case
+        '''
+        fcd, fyd, Es, eps_cu3 = material.fcd, material.fyd, material.Es, material.eps_cu3
+        lambda_factor, netta = material.lambda_factor, material.netta
+        width, d, As = cs.width, cs.d_1, cs.As
+        Asw = input.shear_reinforcement
+
+        # ULS, from the ULS class
+        alpha_bal = eps_cu3 / (eps_cu3 + material.eps_yd) # from Sørensen (4.20)
+        As_balanced = lambda_factor * netta * alpha_bal * width * d * fcd / fyd # from Sørensen (4.21)
+        a = lambda_factor * netta * fcd * width * d
+        alpha = self.calculate_alpha(a, eps_cu3 * Es * As, - eps_cu3 * Es * As, As <= As_balanced,
+                                     (fyd * As) / (lambda_factor * netta * fcd * width * d)) # from Sørensen (4.18) and (4.19)
+        M_Rd = lambda_factor * netta * alpha * (1 - 0.5 * lambda_factor * alpha) * fcd * width * d ** 2 * 10 ** -6 # from Sørensen (4.14)
+        V_Rd = self.calculate_V_Rd(d, np.minimum(As / (width * d), 0.02), width, 0.2 * fcd, material.gamma_concrete, material.fck)
+        V_Rds = self.calculate_V_Rds(Asw, d, fyd, 1, material.fck, width, fcd)
+        V_capacity = np.where(V_Rd >= load.V_Ed, V_Rd, V_Rds)
+
+        # Reinforcement, from the Reinforcement control class
+        z = (1 - 0.5 * lambda_factor * alpha) * d # From Sørensen (4.13)
+        As_necessary = (load.M_Ed * 10 ** 6) / (z * fyd) # From Sørensen (4.26)
+        As_min = self.calculate_As_min(material, width, d)
+        Asw_min = self.calculate_Asw_min(material, width)
+
+        # Crack, from the Crack control class
+        netta_crack = Es / deflection.Ec_middle
+        ro = As / (width * d)
+        alpha_crack = np.sqrt((netta_crack * ro) ** 2 + 2 * netta_crack * ro) - netta_crack * ro # From Sørensen (5.5)
+        EI_2 = deflection.Ec_middle * (width * (alpha_crack * d) ** 3) / 3 + Es * As * ((1 - alpha_crack) * d) ** 2 # From Sørensen (5.6)-(5.8)
+        sigma_s = Es * (load.M_Ed * 10 ** 6 * (1 - alpha_crack) * d) / EI_2 # From Sørensen (5.55)
+        max_bar_diameter, bar_diameter_flag = table_7_2N.get_max_bar_diameter(self.calculate_crack_width(input, cs), sigma_s)
+        bar_diameter = input.ordinary_reinforcement_diameter
+
+        results = {'M_Rd': M_Rd, 'M_Ed': load.M_Ed, 'M_control': M_Rd >= load.M_Ed,
+                   'M_utilization': np.round((M_Rd / load.M_Ed) * 100, 1),
+                   'V_Rd': V_Rd, 'V_Ed': load.V_Ed, 'V_control': V_capacity >= load.V_Ed,
+                   'V_utilization': np.round((V_capacity / load.V_Ed) * 100, 1),
+                   'As_control': ~((As > 0.04 * cs.Ac) | (As < As_min) | (As < As_necessary)),
+                   'As_utilization': np.round((As / As_necessary) * 100, 1),
+                   'Asw_control': Asw_min < Asw, 'Asw_utilization': np.round((Asw / Asw_min) * 100, 1),
+                   'crack_control': bar_diameter < max_bar_diameter, 'max_bar_diameter': max_bar_diameter, 'bar_diameter_flag': bar_diameter_flag,
+                   'crack_utilization': np.round((max_bar_diameter / bar_diameter) * 100, 1),
+                   'deflection_control': deflection.control, 'deflection_utilization': deflection.utilization,
+                   'total_deflection': deflection.total_deflection}
+        results['passed'] = results['M_control'] & results['V_control'] & results['As_control'] & results['Asw_control'] & \
+            results['crack_control'] & results['deflection_control']
+        return results
+
+#-------------PRESTRESSED REINFORCEMENT---------------------------------------------------------------
+
+    def calculate_stress_uncracked(self, material, cs, load, y_s: np.ndarray = None, As: np.ndarray = None) -> SimpleNamespace:
+        ''' Function that calculates concrete stress for uncracked prestressed cross section, as the Uncracked stress class,
+        or the Uncracked stress prestress and ordinary class when ordinary reinforcement in top is given.
+        Args:
+            material, cs, load:  namespaces for the beams in this reinforcement case
+            y_s(array):  distance from middle of cross section to ordinary reinforcement in top [mm]
+            As(array):  area of ordinary reinforcement in top [mm2]
+        Returns:
+            stress_uncracked:  namespace with At, yt, It and sigma_c_uncracked = [sigma_c_under, sigma_c_over, sigma_c_prestress]
+        '''
+        netta_p = material.Ep / material.Ecm
+        stress = SimpleNamespace()
+        if As is None:
+            stress.At = cs.Ac + (netta_p - 1) * cs.Ap # From Sørensen (6.6)
+            stress.yt = ((netta_p - 1) * cs.Ap * cs.e) / stress.At # From Sørensen (6.7)
+            stress.It = (cs.width * cs.height ** 3) / 12 + cs.width * cs.height * stress.yt ** 2 + (netta_p - 1) * cs.Ap * (cs.e - stress.yt) ** 2 # From Sørensen (6.8)
+        else:
+            netta_s = material.Es / material.Ecm
+            stress.At = cs.Ac + (netta_p - 1) * cs.Ap + (netta_s - 1) * As # Derivated from Sørensen (6.6)
+            stress.yt = (As * y_s * (netta_s - 1) - (netta_p - 1) * cs.Ap * cs.e) / stress.At # Derivated from Sørensen (6.7)
+            stress.It = (cs.width * cs.height ** 3) / 12 + cs.width * cs.height * stress.yt ** 2 + (netta_p - 1) * cs.Ap * (cs.e - stress.yt) ** 2 \
+                + (netta_s - 1) * As * (y_s - stress.yt) ** 2 # Based on Sørensen (6.8)
+
+        N = - load.P0_d # From Sørensen (6.10a)
+        Mt = N * (cs.e - stress.yt) # From Sørensen (6.10b)
+        stress.sigma_c_uncracked = [N / stress.At + Mt / (stress.It / (y - stress.yt)) for y in (cs.height / 2, - cs.height / 2, cs.e)] # From Sørensen (6.11)
+        return stress
+
+    def calculate_time_effects(self, material, cs, creep, stress_uncracked, deflection, load, t: int = 500000) -> SimpleNamespace:
+        ''' Function that calculates losses caused by relaxation, shrink and creep, as the Time effects class
+        Args:
+            material, cs, creep, stress_uncracked, deflection, load:  namespaces for the beams in this reinforcement case
+            t(int):  time after stress-application, assumed t = 500 000 from EC2 3.3.2(8).[hours]
+        Returns:
+            time_effect:  namespace with delta_relaxation, loss [N/mm2] and loss_percentage [%]
+        '''
+        time_effect = SimpleNamespace()
+        sigma_pi = np.minimum(0.75 * material.fpk, 0.85 * material.fp01k) # From EC2 (5.43)
+        my = sigma_pi / material.fpk # From EC2 3.3.2(7)
+        time_effect.delta_relaxation = sigma_pi * (0.66 * 2.5 * np.e ** (9.1 * my) * ((t/1000) ** (0.75 * (1 - my))) * 10 ** (-5)) # From EC2 (3.29)
+
+        Ep, Ecm, phi = material.Ep, material.Ecm, creep.phi_selfload
+        time_effect.loss = np.abs((deflection.eps_cs * Ep + 0.8 * time_effect.delta_relaxation + (Ep / Ecm) * phi * np.abs(stress_uncracked.sigma_c_uncracked[2])) / \
+            (1 + (Ep / Ecm) * (cs.Ap / cs.Ac) * (1 + (cs.Ac / cs.Ic) * cs.e ** 2) * (1 + 0.8 * phi))) # From EC2 5.10.6(2)
+        time_effect.loss_percentage = (time_effect.loss * 100) / load.sigma_p_max
+        return time_effect
+
+    def calculate_prestressed_alpha(self, material, cs, load, time_effect, As: np.ndarray) -> np.ndarray:
+        ''' Function that calculates alpha for prestressed cross section, as the ULS prestressed classes.
+        With As = 0 the formulas are the same as for prestressed reinforcement only.
+        Args:
+            material, cs, load, time_effect:  namespaces for the beams in this reinforcement case
+            As(array):  area of ordinary reinforcement in top [mm2]
+        Returns:
+            alpha(array):  Compression-zone-height factor
+        '''
+        eps_cu3, Ep, fcd, fpd, fyd = material.eps_cu3, material.Ep, material.fcd, material.fpd, material.fyd
+        lambda_factor, netta, width, d, Ap = material.lambda_factor, material.netta, cs.width, cs.d_2, cs.Ap
+        eps_diff = (load.sigma_p_max / Ep) * (1 - time_effect.loss_percentage / 100) # Sørensen (6.4)
+        alpha_b = eps_cu3 / (eps_cu3 + fpd / Ep - eps_diff) # Sørensen (7.7)
+        Apb = (netta * lambda_factor * alpha_b * width * d * fcd + fyd * As) / fpd # Sørensen (7.8)
+        return self.calculate_alpha(netta * lambda_factor * fcd * width * d, fyd * As + (eps_cu3 - eps_diff) * Ep * Ap, - eps_cu3 * Ep * Ap,
+                                    Ap <= Apb, (fpd * Ap - fyd * As) / (netta * lambda_factor * fcd * width * d)) # Sørensen (7.9) and (7.10)
+
+    def calculate_cracked_alpha(self, d: np.ndarray, e: np.ndarray, a: np.ndarray, netta: np.ndarray, ro_l: np.ndarray) -> tuple:
+        ''' Function that calculates factor alpha from the third degree equation Sørensen (6.24), as the Cracked stress class
+        Args:
+            d(array):  effective height [mm]
+            e(array):  distance to reinforcement [mm]
+            a(array):  ratio between moment and axial force [mm]
+            netta(array):  material stiffness ratio
+            ro_l(array):  reinforcement ratio
+        Returns:
+            alpha(array):  factor, NaN if no root is between 0 and 1
+            found(array):  True if alpha is a real root, False if the real part of the complex roots is used
+        '''
+        roots, real = solve_cubic(d / (6 * (e + a)), 0.5 * (1 - d / (e + a)), netta * ro_l, - netta * ro_l)
+        alpha, found = get_admissible_root(roots, real)
+        complex_part, _ = get_admissible_root(roots, ~np.isnan(roots))
+        return np.where(found, alpha, complex_part), found
+
+    def calculate_prestressed(self, input, material, cs, load, creep, deflection_1) -> dict:
+        ''' Function that calculates all checks for prestressed beams, as the Uncracked stress, Time effects, Deflection
+        prestressed, Cracked stress, Stress, ULS prestressed, Crack control prestressed and Reinforcement control prestressed classes.
+        Args:
+            input, material, cs, load, creep, deflection_1:  namespaces for the beams in this reinforcement case
+        Returns:
+            results(dict):  result columns for the beams in this reinforcement case
+        '''
+        width, d, Ap, Ep, fcd = cs.width, cs.d_2, cs.Ap, material.Ep, material.fcd
+        Asw = input.shear_reinforcement
+
+        stress_uncracked = self.calculate_stress_uncracked(material, cs, load)
+        time_effect = self.calculate_time_effects(material, cs, creep, stress_uncracked, deflection_1, load)
+        deflection = self.calculate_deflection(input, material, cs, load, creep, time_effect)
+
+        # Cracked stress, from the Cracked stress class
+        Ec_middle = deflection.Ec_middle
+        netta = material.Es / Ec_middle
+        ro_l = Ap / (width * d)
+        Ns = deflection.eps_cs * Ep * Ap * 10 ** -3 # From Sørensen (6.15)
+        N = load.P0_d * 10 ** -3 - Ns # From Sørensen fig. 6.8
+        M = load.Mg_d + load.Mp_d + load.M_prestress * (1 - time_effect.loss_percentage / 100) + (Ns * cs.e * 10 ** -3)
+        alpha_cracked, alpha_found = self.calculate_cracked_alpha(d, cs.e, 1000 * M / N, netta, ro_l)
+        sigma_c_cracked = (-N * 10 ** 3) / (width * d * (0.5 * alpha_cracked - netta * ro_l * ((1 - alpha_cracked) / alpha_cracked))) # Sørensen (6.25)
+
+        # Stress, from the Stress class. The cracked check in the Stress class is never reached, so only the
+        # first uncracked stress decides the control
+        delta_sigma_p = (np.abs(sigma_c_cracked) / Ec_middle * (1 - alpha_cracked) / alpha_cracked - deflection.eps_cs) * Ep
+        sigma_p_cracked = load.sigma_p_max - np.abs(delta_sigma_p) - time_effect.loss
+        sigma_c_under = stress_uncracked.sigma_c_uncracked[0]
+        stress_control = np.where(sigma_c_under < 0, 0.6 * material.fck < sigma_c_under, material.fctm > sigma_c_under) # From EC2 7.2(2)
+
+        # ULS, from the ULS prestressed class
+        alpha = self.calculate_prestressed_alpha(material, cs, load, time_effect, np.zeros(len(d)))
+        M_Rd = material.netta * material.lambda_factor * alpha * (1 - 0.5 * material.lambda_factor * alpha) * fcd * width * d ** 2 * 10 ** -6 # from Sørensen (4.14)
+        M_Ed = load.M_Ed + load.M_prestress
+
+        # The ULS prestressed class gives the concrete area and prestress area to the shear capacity in opposite order
+        N_Ed = np.abs(load.P0_d) * material.gamma_0_9 * (1 - time_effect.loss / 100)
+        sigma_cp = np.minimum(N_Ed / Ap, 0.2 * fcd)
+        V_Rd = self.calculate_V_Rd(d, np.minimum(cs.Ac / (width * d), 0.02), width, sigma_cp, material.gamma_concrete, material.fck)
+        V_Rds = self.calculate_V_Rds(Asw, d, material.fyd, self.calculate_alpha_cw(sigma_cp, fcd), material.fck, width, fcd)
+        V_control = (V_Rd >= load.V_Ed) | (V_Rds >= load.V_Ed)
+        V_Rd = np.where((V_Rd < load.V_Ed) & V_control, V_Rds, V_Rd)
+
+        # Crack, from the Crack control prestressed class
+        sigma_p = load.sigma_p_max - np.abs(sigma_p_cracked)
+        max_bar_diameter, bar_diameter_flag = table_7_2N.get_max_bar_diameter(self.calculate_crack_width(input, cs), sigma_p)
+        bar_diameter = input.ordinary_reinforcement_diameter
+
+        # Reinforcement, from the Reinforcement control prestressed class
+        Asw_min = self.calculate_Asw_min(material, width)
+        Ap_necessary = (load.M_Ed * 10 ** 6) / ((1 - 0.5 * material.lambda_factor * alpha) * d * material.fpd) # Derivated from Sørensen (4.26)
+
+        results = {'M_Rd': M_Rd, 'M_Ed': M_Ed, 'M_control': M_Rd >= M_Ed, 'M_utilization': np.round((M_Rd / M_Ed) * 100, 1),
+                   'V_Rd': V_Rd, 'V_Ed': load.V_Ed, 'V_control': V_control, 'V_utilization': np.round((V_Rd / load.V_Ed) * 100, 1),
+                   'As_control': Ap >= Ap_necessary, 'As_utilization': np.round((Ap / Ap_necessary) * 100, 1),
+                   'Asw_control': Asw_min < Asw, 'Asw_utilization': np.round((Asw / Asw_min) * 100, 1),
+                   'crack_control': bar_diameter < max_bar_diameter, 'max_bar_diameter': max_bar_diameter, 'bar_diameter_flag': bar_diameter_flag,
+                   'crack_utilization': np.round((max_bar_diameter / bar_diameter) * 100, 1),
+                   'deflection_control': deflection.control, 'deflection_utilization': deflection.utilization,
+                   'total_deflection': deflection.total_deflection, 'stress_control': stress_control, 'alpha_found': alpha_found}
+        results['passed'] = results['M_control'] & results['V_control'] & results['As_control'] & results['Asw_control'] & \
+            results['crack_control'] & results['deflection_control'] & results['stress_control']
+        return results
+
+    def calculate_prestress_and_ordinary(self, input, material, cs, load, creep, deflection_1) -> dict:
+        ''' Function that calculates all checks for prestressed beams with ordinary reinforcement in top, as the Uncracked
+        stress prestress and ordinary, Time effects and ULS prestress and ordinary classes.
+        Args:
+            input, material, cs, load, creep, deflection_1:  namespaces for the beams in this reinforcement case
+        Returns:
+            results(dict):  result columns for the beams in this reinforcement case
+        '''
+        width, d, As, fcd = cs.width, cs.d_2, cs.As, material.fcd
+        y_s = cs.height / 2 - cs.cnom - input.stirrup_diameter - input.ordinary_reinforcement_diameter / 2
+
+        stress_uncracked = self.calculate_stress_uncracked(material, cs, load, y_s, As)
+        time_effect = self.calculate_time_effects(material, cs, creep, stress_uncracked, deflection_1, load)
+
+        # ULS, from the ULS prestress and ordinary class
+        alpha = np.abs(self.calculate_prestressed_alpha(material, cs, load, time_effect, As))
+        M_Rd = (material.netta * material.lambda_factor * alpha * (1 - 0.5 * material.lambda_factor * alpha) * fcd * width * d ** 2 + \
+            material.fyd * As * (d - cs.cnom)) * 10 ** -6 # Derivated from Sørensen (4.14)
+        M_Ed = load.M_Ed + load.M_prestress
+
+        N_Ed = np.abs(load.P0_d) * material.gamma_prestressed_reinforcement * (1 - time_effect.loss_percentage / 100)
+        sigma_cp = np.minimum(N_Ed / cs.Ac, 0.2 * fcd)
+        V_Rd = self.calculate_V_Rd(d, np.minimum(cs.Ap / (width * d), 0.02), width, sigma_cp, material.gamma_concrete, material.fck)
+        V_Rds = self.calculate_V_Rds(input.shear_reinforcement, d, material.fyd, self.calculate_alpha_cw(sigma_cp, fcd), material.fck, width, fcd)
+        V_control = (V_Rd >= load.V_Ed) | (V_Rds >= load.V_Ed)
+        V_Rd = np.where((V_Rd < load.V_Ed) & V_control, V_Rds, V_Rd)
+
+        results = {'M_Rd': M_Rd, 'M_Ed': M_Ed, 'M_control': M_Rd >= M_Ed, 'M_utilization': np.round((M_Rd / M_Ed) * 100, 1),
+                   'V_Rd': V_Rd, 'V_Ed': load.V_Ed, 'V_control': V_control, 'V_utilization': np.round((V_Rd / load.V_Ed) * 100, 1)}
+        results['passed'] = results['M_control'] & results['V_control']
+        return results
+
+#-------------EMISSION AND COST---------------------------------------------------------------
+
+    def calculate_emissions_and_cost(self, input: SimpleNamespace, material: SimpleNamespace, cs: SimpleNamespace):
+        ''' Function that calculates emission and cost for all beams, as the Beam class. Prestressed beams without
+        ordinary reinforcement in top use minimum ordinary reinforcement for the emission, and cost is only calculated
+        for ordinary reinforced beams.
+        Args:
+            input:  namespace with one array for each field in the Input class
+            material:  namespace with one array for each attribute in the Material class
+            cs:  namespace with one array for each attribute in the Cross section class
+        '''
+        prestressed_only = input.is_the_beam_prestressed & ~input.prestressed_and_ordinary_in_top
+        As = np.where(prestressed_only, self.calculate_As_min(material, cs.width, cs.d_2), cs.As)
+        Ap = np.where(input.is_the_beam_prestressed, cs.Ap, 0)
+
+        self.concrete_emission[:] = self.calculate_emissions_concrete(input)
+        self.ordinary_reinforcement_emission[:] = self.calculate_emissions_ordinary_reinforcement(As, 7700, input)
+        self.prestressed_reinforcement_emission[:] = self.calculate_emissions_prestressed_reinforcement(7810, Ap, input)
+        self.total_emission[:] = np.round(self.concrete_emission + self.ordinary_reinforcement_emission + self.prestressed_reinforcement_emission, 1)
+
+        self.cost_concrete[:] = self.get_cost_concrete(input)
+        self.cost_reinforcement[:] = np.where(input.is_the_beam_prestressed, np.nan, self.get_cost_ordinary_reinforcement(input, cs.As, 7700))
+        self.total_cost[:] = np.round(self.cost_concrete + self.cost_reinforcement, 1)
+
+    def calculate_emissions_concrete(self, input: SimpleNamespace) -> np.ndarray:
+        ''' Calculates kg CO2 equivalents for the beams from concrete, as the Beam class
+        Args:
+            input:  namespace with one array for each field in the Input class
+        Returns:
+            emissions from concrete [kg CO2 eq.]
+        '''
+        emission_factor = {'C20': 180, 'C25': 190, 'C30': 225, 'C35': 240, 'C45': 270, 'C55': 280, 'C65': 300}
+        factor = np.array([emission_factor.get(concrete_class, 0) for concrete_class in input.concrete_class], dtype=float)
+        return factor * input.width * input.height * 10 ** -6 * input.beam_length
+
+    def calculate_emissions_ordinary_reinforcement(self, As: np.ndarray, density_ordinary: int, input: SimpleNamespace) -> np.ndarray:
+        ''' Calculates kg CO2 equivalents for the beams from ordinary reinforcement
+        Args:
+            As(array):  area of ordinary reinforcement [mm2]
+            density_ordinary(int):  Density for ordinary reinforcement steel [kg/m3]
+            input:  namespace with one array for each field in the Input class
+        Returns:
+            emissions from ordinary reinfrocement[kg CO2 eq.]
+        '''
+        return As * 10 ** -6 * density_ordinary * input.beam_length * 0.34
+
+    def calculate_emissions_prestressed_reinforcement(self, density_prestressed: int, Ap: np.ndarray, input: SimpleNamespace) -> np.ndarray:
+        ''' Calculates kg CO2 equivalents for the beams from prestressed reinforcment
+        Args:
+            density_prestressed(int):  Density for prestressed reinforcement steel [kg/m3]
+            Ap(array):  area of prestressed reinforcement [mm2]
+            input:  namespace with one array for each field in the Input class
+        Returns:
+            emissions from prestressed reinforcment steel [kg CO2 eq.]
+        '''
+        return Ap * 10 ** -6 * input.beam_length * density_prestressed * 1.86
+
+    def get_cost_concrete(self, input: SimpleNamespace) -> np.ndarray:
+        ''' Calculates cost for the beams from concrete, as the Beam class
+        Args:
+            input:  namespace with one array for each field in the Input class
+        Returns:
+            cost of concrete [NOK]
+        '''
+        price = {'C20': 1613, 'C30': 1723, 'C35': 1887.8, 'C45': 1973}
+        factor = np.array([price.get(concrete_class, 0) for concrete_class in input.concrete_class], dtype=float)
+        return factor * input.width * input.height * 10 ** -6 * input.beam_length
+
+    def get_cost_ordinary_reinforcement(self, input: SimpleNamespace, As: np.ndarray, density_ordinary: int) -> np.ndarray:
+        ''' Calculates cost for the beams from ordinary reinfrocement, as the Beam class
+        Args:
+            input:  namespace with one array for each field in the Input class
+            As(array):  area of ordinary reinforcement [mm2]
+            density_ordinary(int):  Density for ordinary reinforcement steel [kg/m3]
+        Returns:
+            cost of ordinary reinforcement [NOK]
+        '''
+        diameter = input.ordinary_reinforcement_diameter
+        price = np.select([np.isin(diameter, [8, 10]), diameter == 12, np.isin(diameter, [16, 20, 25])], [27.92, 28.72, 27.84], 0)
+        return As * 10 ** -6 * density_ordinary * input.beam_length * price
@@ -0,0 +1,157 @@
+# Import module numpy as np
+import numpy as np
+import time
+
+from A0_Input import Input # From the Input script, import the Input class (for the fields that are not optimized)
+from K0_Batch import Beam_batch # From the Batch script, import the Beam batch class (to check many designs at once)
+
+''' This script contain the Optimizer class that apply for all reinforcement cases.
+'''
+
+class Beam_optimizer:
+    ''' Class to find the beam design with lowest emission or cost where all controls are suifficient. The search is
+    done over width, height, number and diameter of ordinary reinforcement bars, concrete class and prestress strands.
+    Designs are checked in batches with the Beam batch class, and two kinds of pruning are used:
+    - Monotony: the moment capacity M_Rd and the shear capacity V_Rd grows with the effective height. The lowest height
+      where the moment and shear control is suifficient is found with bisection for each combination of the other
+      parameters, and all lower designs are pruned without being checked.
+    - Bound: emission and cost are known before the controls are calculated, so the rest of the designs are checked in
+      order of increasing objective, and all designs after the first suifficient design are pruned.
+    '''
+    def __init__(self, input: Input = None, widths: tuple = (300,), heights: tuple = (800,), nr_bars: tuple = (4,),
+                 diameters: tuple = (20,), concrete_classes: tuple = ('C30',), strands: tuple = (None,),
+                 objective: str = 'total_emission', batch_size: int = 512):
+        '''Args:
+            input:  instance for Input class with the fields that are not optimized (loads, length, exposure class etc.)
+            widths(tuple):  widths of beam to search [mm]
+            heights(tuple):  heights of beam to search [mm], in any order since they are sorted for the bisection
+            nr_bars(tuple):  number of ordinary reinforcement bars to search
+            diameters(tuple):  ordinary reinforcement diameters to search [mm]
+            concrete_classes(tuple):  concrete classes to search, for instance 'C30'
+            strands(tuple):  prestress to search, None for ordinary reinforced beam or (name, diameter [mm], number of strands),
+                            for instance ('Y1860S7', 15.2, 8)
+            objective(str):  'total_emission' or 'total_cost'
+            batch_size(int):  number of designs checked in each batch
+        Returns:
+            optimum(dict):  input fields and results for the best design, or None if no design is suifficient
+            candidates(int):  number of designs in the design space
+            evaluated(int):  number of designs checked with the Beam batch class, including the bisection
+            pruned_monotony(int):  number of designs pruned because the moment or shear control could not be suifficient
+            searched(int):  number of designs checked in order of increasing objective
+            pruned_bound(int):  number of designs pruned because the objective could not be better than the optimum
+            wall_time(float):  time used for the search [s]
+        Raises:
+            ValueError:  if the objective is unknown, or cost is minimized for prestressed beams
+        '''
+        start = time.perf_counter()
+        self.input = Input() if input is None else input
+        self.objective = self.get_objective(objective, strands)
+        # The heights are sorted, since the bisection in calculate_minimum_height needs the capacity to grow with the index
+        self.space = [list(widths), sorted(heights), list(nr_bars), list(diameters), list(concrete_classes), list(strands)]
+        self.batch_size = batch_size
+
+        self.candidates = int(np.prod([len(values) for values in self.space]))
+        self.evaluated = 0
+        self.pruned_monotony = 0
+        self.optimum = self.search()
+        self.pruned_bound = self.candidates - self.pruned_monotony - self.searched
+        self.wall_time = time.perf_counter() - start
+
+    def get_objective(self, objective: str, strands: tuple) -> str:
+        ''' Function that controls the objective
+        Args:
+            objective(str):  'total_emission' or 'total_cost'
+            strands(tuple):  prestress to search
+        Returns:
+            objective(str):  name of the result column to minimize
+        Raises:
+            ValueError:  if the objective is unknown, or cost is minimized for prestressed beams
+        '''
+        if objective not in ('total_emission', 'total_cost'):
+            raise ValueError(f'objective={objective}, expected total_emission or total_cost')
+        if objective == 'total_cost' and any(strand is not None for strand in strands):
+            raise ValueError('total_cost is only calculated for ordinary reinforced beams, use strands=(None,)')
+        return objective
+
+    def get_columns(self, index: np.ndarray) -> dict:
+        ''' Function that makes input columns for the Beam batch class from index in the design space
+        Args:
+            index(array):  index of the designs, shape (number of designs, 6)
+        Returns:
+            columns(dict):  one array for each input field that is optimized, and the other fields from the Input instance
+        '''
+        width, height, nr_bars, diameter, concrete, strand = (index[:, i] for i in range(6))
+        strands = self.space[5]
+        columns = dict(vars(self.input))
+        columns['width'] = np.array(self.space[0], dtype=float)[width]
+        columns['height'] = np.array(self.space[1], dtype=float)[height]
+        columns['nr_ordinary_reinforcement_bars'] = np.array(self.space[2], dtype=float)[nr_bars]
+        columns['ordinary_reinforcement_diameter'] = np.array(self.space[3], dtype=float)[diameter]
+        columns['concrete_class'] = np.array(self.space[4], dtype=object)[concrete]
+        columns['is_the_beam_prestressed'] = np.array([strand is not None for strand in strands])[strand]
+        columns['prestressed_reinforcment_name'] = np.array([None if s is None else s[0] for s in strands], dtype=object)[strand]
+        columns['prestressed_reinforcment_diameter'] = np.array([0 if s is None else s[1] for s in strands], dtype=float)[strand]
+        columns['nr_prestressed_bars'] = np.array([0 if s is None else s[2] for s in strands], dtype=float)[strand]
+        return columns
+
+    def calculate_minimum_height(self, shape: tuple) -> np.ndarray:
+        ''' Function that finds the lowest height where the moment and shear control is suifficient, for each width,
+        number of bars, bar diameter, concrete class and strands. Since M_Rd and V_Rd grows with the effective height,
+        the height is found with bisection, for all combinations at once.
+        Args:
+            shape(tuple):  number of values for each parameter in the design space
+        Returns:
+            minimum_height(array):  index of the lowest height with suifficient capacity, shape[1] if no height is suifficient.
+                                    Shape (widths, nr_bars, diameters, concrete classes, strands)
+        '''
+        combinations = (shape[0], shape[2], shape[3], shape[4], shape[5])
+        width, nr_bars, diameter, concrete, strand = np.unravel_index(np.arange(int(np.prod(combinations))), combinations)
+        low = np.zeros(len(width), dtype=int)
+        high = np.full(len(width), shape[1])
+
+        while np.any(low < high):
+            active = np.flatnonzero(low < high)
+            middle = (low[active] + high[active]) // 2
+            index = np.stack([width[active], middle, nr_bars[active], diameter[active], concrete[active], strand[active]], axis=1)
+            results = Beam_batch(self.get_columns(index)).get_results()
+            self.evaluated += len(active)
+
+            capacity = results['M_control'] & results['V_control']
+            high[active[capacity]] = middle[capacity]
+            low[active[~capacity]] = middle[~capacity] + 1
+        return low.reshape(combinations)
+
+    def search(self) -> dict:
+        ''' Function that prunes designs where the moment or shear control can not be suifficient, and search the rest
+        of the design space in order of increasing objective.
+        Returns:
+            optimum(dict):  input fields and results for the best design, or None if no design is suifficient
+        '''
+        shape = tuple(len(values) for values in self.space)
+        index = np.stack(np.unravel_index(np.arange(self.candidates), shape), axis=1)
+
+        minimum_height = self.calculate_minimum_height(shape)
+        capacity = index[:, 1] >= minimum_height[index[:, 0], index[:, 2], index[:, 3], index[:, 4], index[:, 5]]
+        self.pruned_monotony = int(np.count_nonzero(~capacity))
+        index = index[capacity]
+
+        # Emission and cost do not depend on the controls, so the designs can be sorted before they are checked
+        objective = Beam_batch(self.get_columns(index), controls=False).get_results()[self.objective]
+        order = np.argsort(objective, kind='stable')
+        order = order[~np.isnan(objective[order])]
+
+        for position in range(0, len(order), self.batch_size):
+            chunk = index[order[position:position + self.batch_size]]
+            columns = self.get_columns(chunk)
+            results = Beam_batch(columns).get_results()
+            self.evaluated += len(chunk)
+
+            # The chunk is sorted, so the first suifficient design is the optimum
+            if results['passed'].any():
+                i = int(np.argmax(results['passed']))
+                optimum = {name: column[i] for name, column in columns.items() if np.ndim(column) == 1}
+                optimum.update({name: column[i] for name, column in results.items()})
+                self.searched = position + len(chunk)
+                return optimum
+        self.searched = len(order)
+        return None
@@ -0,0 +1,154 @@
+# Import module numpy as np
+import numpy as np
+from itertools import islice
+
+from A0_Input import Input # From the Input script, import the Input class (for the default values of the design fields)
+from K0_Batch import Beam_batch, columns_from_inputs # From the Batch script, import the Beam batch class and the column function
+
+''' This script contain the Pareto front class that apply for all reinforcement cases.
+'''
+
+# Utilization degrees that can govern a design. Controls that are not done for a reinforcement case are NaN.
+utilization_fields = ('M_utilization', 'V_utilization', 'As_utilization', 'Asw_utilization', 'crack_utilization', 'deflection_utilization')
+
+# Input fields that describe a design, and are kept for each design in the front
+design_fields = ('concrete_class', 'width', 'height', 'nr_ordinary_reinforcement_bars', 'ordinary_reinforcement_diameter',
+                 'is_the_beam_prestressed', 'prestressed_and_ordinary_in_top', 'nr_prestressed_bars',
+                 'prestressed_reinforcment_diameter', 'prestressed_reinforcment_name')
+
+
+def calculate_governing_utilization(results: dict) -> np.ndarray:
+    ''' Function that finds the governing utilization degree, which is the lowest ratio between capacity and demand
+    of all controls that are done for the beam
+    Args:
+        results(dict):  result columns from the Beam batch class
+    Returns:
+        governing_utilization(array):  governing utilization degree [%]
+    '''
+    utilization = np.stack([results[name] for name in utilization_fields])
+    with np.errstate(invalid='ignore'):
+        governing = np.fmin.reduce(utilization, axis=0)
+    return governing
+
+
+class Pareto_front:
+    ''' Class to contain the non-dominated designs across emission, cost and governing utilization degree. Emission
+    and cost are minimized, and governing utilization degree (capacity/demand) is maximized.
+    Designs are added in batches, and each batch is compared to the current front and then thrown away, so the
+    memory use depends on the size of the front and the block size, and not on the number of designs.
+    '''
+    maximize = ('governing_utilization',)
+
+    def __init__(self, objectives: tuple = ('total_emission', 'total_cost', 'governing_utilization'),
+                 only_passed: bool = True, block_size: int = 1024):
+        '''Args:
+            objectives(tuple):  names of the result columns to compare, governing_utilization is maximized and the rest minimized
+            only_passed(boolean):  True if only designs where all controls are suifficient can be in the front
+            block_size(int):  number of designs compared at once, limits the memory to block_size ** 2 comparisons
+        Returns:
+            points(array):  objectives for the designs in the front, shape (designs, objectives). Maximized objectives are negative
+            designs(dict):  one array for each design field, result column and governing_utilization, for the designs in the front
+            seen(int):  number of designs added
+            skipped(int):  number of designs not compared, because they did not pass or an objective is not calculated
+        '''
+        self.objectives = tuple(objectives)
+        self.only_passed = only_passed
+        self.block_size = block_size
+        self.sign = np.array([-1.0 if name in self.maximize else 1.0 for name in self.objectives])
+        self.points = np.empty((0, len(self.objectives)))
+        self.designs = None
+        self.seen = 0
+        self.skipped = 0
+
+    def add_columns(self, columns: dict):
+        ''' Function that checks a batch of designs with the Beam batch class and adds them to the front
+        Args:
+            columns(dict):  array or single value for each field in the Input class
+        '''
+        results = Beam_batch(columns).get_results()
+        results['governing_utilization'] = calculate_governing_utilization(results)
+        size = len(results['M_Rd'])
+
+        default = Input()
+        designs = {}
+        for field in design_fields:
+            value = columns.get(field, getattr(default, field))
+            designs[field] = np.broadcast_to(np.asarray(value, dtype=object if np.ndim(value) == 0 else None), (size,))
+        designs.update(results)
+        self.add(np.stack([results[name] for name in self.objectives], axis=1),
+                 designs, results['passed'] if self.only_passed else np.ones(size, dtype=bool))
+
+    def add_inputs(self, inputs, chunk_size: int = 10000):
+        ''' Function that adds a stream of designs to the front. The inputs are read chunk by chunk, so a generator
+        is never read further than the chunk that is checked.
+        Args:
+            inputs:  list, generator or other iterable with instances of the Input class
+            chunk_size(int):  number of designs checked in each batch
+        '''
+        inputs = iter(inputs)
+        while True:
+            chunk = list(islice(inputs, chunk_size))
+            if not chunk:
+                break
+            self.add_columns(columns_from_inputs(chunk))
+
+    def add(self, points: np.ndarray, designs: dict, valid: np.ndarray = None):
+        ''' Function that updates the front with new designs. New designs that are dominated by the front, or equal to a
+        design in the front, are thrown away, and designs in the front that are dominated by a new design are removed.
+        Args:
+            points(array):  objectives for the new designs, shape (designs, objectives)
+            designs(dict):  one array for each field that is kept for the new designs
+            valid(array):  True for the designs that can be in the front
+        '''
+        self.seen += len(points)
+        valid = np.all(np.isfinite(points), axis=1) & (True if valid is None else valid)
+        self.skipped += int(np.count_nonzero(~valid))
+        points = points[valid] * self.sign
+        designs = {name: np.asarray(value)[valid] for name, value in designs.items()}
+
+        for start in range(0, len(points), self.block_size):
+            block = points[start:start + self.block_size]
+            keep = self.get_non_dominated(block)
+
+            # New designs that are dominated by, or equal to, a design in the front are not kept
+            for front_start in range(0, len(self.points), self.block_size):
+                front = self.points[front_start:front_start + self.block_size]
+                keep[keep] &= ~np.any(np.all(front[:, None, :] <= block[None, keep, :], axis=2), axis=0)
+            block, new = block[keep], {name: value[start:start + self.block_size][keep] for name, value in designs.items()}
+            if len(block) == 0:
+                continue
+
+            # Designs in the front that are dominated by a new design are removed
+            dominated = np.zeros(len(self.points), dtype=bool)
+            for front_start in range(0, len(self.points), self.block_size):
+                front = self.points[front_start:front_start + self.block_size]
+                dominated[front_start:front_start + self.block_size] = np.any(
+                    np.all(block[:, None, :] <= front[None, :, :], axis=2) & np.any(block[:, None, :] < front[None, :, :], axis=2), axis=0)
+
+            self.points = np.concatenate([self.points[~dominated], block])
+            if self.designs is None:
+                self.designs = new
+            else:
+                self.designs = {name: np.concatenate([value[~dominated], new[name]]) for name, value in self.designs.items()}
+
+    def get_non_dominated(self, points: np.ndarray) -> np.ndarray:
+        ''' Function that finds the non-dominated designs in one block. Of equal designs, only the first is kept.
+        Args:
+            points(array):  objectives to minimize, shape (designs, objectives)
+        Returns:
+            non_dominated(array):  True for the designs that are not dominated by another design in the block
+        '''
+        weakly = np.all(points[:, None, :] <= points[None, :, :], axis=2) # weakly[j, i]: j is at least as good as i
+        strictly = weakly & np.any(points[:, None, :] < points[None, :, :], axis=2)
+        equal_before = weakly & weakly.T & np.tri(len(points), k=-1, dtype=bool).T
+        return ~np.any(strictly | equal_before, axis=0)
+
+    def get_front(self) -> dict:
+        ''' Function that collects the designs in the front, sorted by the first objective
+        Returns:
+            front(dict):  one array for each design field, result column and governing_utilization
+        '''
+        if self.designs is None:
+            return {}
+        order = np.lexsort(self.points.T[::-1])
+        return {name: value[order] for name, value in self.designs.items()}
@@ -0,0 +1,132 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+''' This script contain the Sweep class that apply for all reinforcement cases.
+The Beam class is evaluated for many instances of the Input class in parallel, with one process for each core.
+'''
+
+def evaluate_chunk(inputs: list, profile: bool = False, records: bool = False, profile_memory: bool = False) -> tuple:
+    ''' Function that makes the Beam class for each input in a chunk. Runs in the worker process.
+    Args:
+        inputs(list):  instances of the Input class
+        profile(boolean):  if True, the stages of the Beam class are measured with a Profiler
+        records(boolean):  if True, only the results of each beam are given back, as Beam records
+        profile_memory(boolean):  if True, the Profiler also measures the allocated memory of each stage
+    Returns:
+        beams(list):  instances of the Beam class or the Beam record class, in the same order as the inputs
+        timing(tuple):  process id, time used for the chunk [s] and number of beams
+        report(dict):  measurements for each stage from the Profile class, or None if profile is False
+    '''
+    from A0_Results import Beam # Imported in the worker, so the worker only needs the scripts when a chunk is evaluated
+
+    calculate = Beam.calculate_record if records else Beam
+    start = time.perf_counter()
+    if not profile:
+        beams = [calculate(input) for input in inputs]
+        return beams, (os.getpid(), time.perf_counter() - start, len(inputs)), None
+
+    from W0_Profiling import Profiler
+    with Profiler(memory=profile_memory) as profiler:
+        beams = [calculate(input) for input in inputs]
+    return beams, (os.getpid(), time.perf_counter() - start, len(inputs)), profiler.profile.get_report()
+
+
+class Sweep:
+    ''' Class to evaluate the Beam class for a list or generator of inputs with a pool of processes. The inputs are
+    split in chunks, and the beams are given back one by one in the same order as the inputs.
+    Only max_pending chunks are sent to the workers at once, so a generator is not read further ahead than the workers
+    can keep up with.
+    '''
+    def __init__(self, inputs, workers: int = None, chunk_size: int = 64, max_pending: int = None, profile: bool = False,
+                 records: bool = False, profile_memory: bool = False):
+        '''Args:
+            inputs:  list, generator or other iterable with instances of the Input class
+            workers(int):  number of processes, as default one for each core
+            chunk_size(int):  number of inputs sent to a worker at once
+            max_pending(int):  maximum number of chunks sent to the workers and not yet given back, as default two for each worker
+            profile(boolean):  if True, the stages of the Beam class are measured in the workers
+            records(boolean):  if True, the workers only give back the results of each beam as Beam records, which
+                               are much smaller to send between the processes and to keep in memory
+            profile_memory(boolean):  if True, the allocated memory of each stage is also measured, with tracemalloc in
+                                      each worker, which makes the beams slower. Only used if profile is True.
+        Returns:
+            worker_timing(dict):  for each process id, number of chunks, number of beams and time used [s]
+            profile:  instance for the Profile class with the measurements from all workers, or None if profile is False
+            wall_time(float):  time used for the sweep so far [s]
+        Raises:
+            ValueError:  if workers, chunk_size or max_pending is less than 1
+        '''
+        self.inputs = iter(inputs)
+        self.workers = os.cpu_count() if workers is None else workers
+        self.chunk_size = chunk_size
+        self.max_pending = 2 * self.workers if max_pending is None else max_pending
+        for name in ('workers', 'chunk_size', 'max_pending'):
+            if getattr(self, name) < 1:
+                raise ValueError(f'{name}={getattr(self, name)}, expected at least 1')
+        self.worker_timing = {}
+        self.wall_time = 0.0
+        self.records = records
+        self.profile_memory = profile_memory
+        self.profile = None
+        if profile:
+            from W0_Profiling import Profile
+            self.profile = Profile()
+
+    def __iter__(self):
+        ''' Function that runs the sweep
+        Returns:
+            beams:  generator with instances of the Beam class or the Beam record class, in the same order as the inputs
+        '''
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            while True:
+                # Back-pressure: only read more inputs when there is room for another chunk
+                while len(pending) < self.max_pending:
+                    chunk = list(islice(self.inputs, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(evaluate_chunk, chunk, self.profile is not None, self.records, self.profile_memory))
+                if not pending:
+                    break
+
+                beams, timing, report = pending.popleft().result()
+                self.add_timing(*timing)
+                if report is not None:
+                    self.profile.add_report(report)
+                self.wall_time = time.perf_counter() - start
+                yield from beams
+        self.wall_time = time.perf_counter() - start
+
+    def add_timing(self, pid: int, elapsed: float, count: int):
+        ''' Function that adds the timing of one chunk to the timing of the worker
+        Args:
+            pid(int):  process id of the worker
+            elapsed(float):  time used for the chunk [s]
+            count(int):  number of beams in the chunk
+        '''
+        timing = self.worker_timing.setdefault(pid, {'chunks': 0, 'beams': 0, 'time': 0.0})
+        timing['chunks'] += 1
+        timing['beams'] += count
+        timing['time'] += elapsed
+
+
+def run_sweep(inputs, workers: int = None, chunk_size: int = 64, max_pending: int = None, profile: bool = False,
+              records: bool = False, profile_memory: bool = False) -> Sweep:
+    ''' Function that evaluates the Beam class for many inputs in parallel
+    Args:
+        inputs:  list, generator or other iterable with instances of the Input class
+        workers(int):  number of processes, as default one for each core
+        chunk_size(int):  number of inputs sent to a worker at once
+        max_pending(int):  maximum number of chunks sent to the workers and not yet given back
+        profile(boolean):  if True, the stages of the Beam class are measured in the workers
+        records(boolean):  if True, the sweep gives Beam records with only the results instead of Beam instances
+        profile_memory(boolean):  if True, the allocated memory of each stage is also measured. Only used if profile is True.
+    Returns:
+        sweep:  instance of the Sweep class. Iterate over it to get the beams in the same order as the inputs,
+                and read worker_timing, wall_time and profile when it is done.
+    '''
+    return Sweep(inputs, workers, chunk_size, max_pending, profile, records, profile_memory)
@@ -0,0 +1,367 @@
+# Import module numpy as np
+import numpy as np
+import json
+import platform
+import subprocess
+import sys
+import time
+import copy
+import gc
+import tracemalloc
+
+from A0_Input import Input # From the Input script, import the Input class (to make the beams that are measured)
+
+''' This script contain the benchmark functions that apply for all reinforcement cases.
+The benchmark suite measures the constructor of each calculation class (micro benchmarks) and the Beam class and the
+Beam batch class for each reinforcement case and batch size (macro benchmarks). The results are saved as JSON, and
+can be compared with the results from an earlier run (the baseline) to find the benchmarks that have become slower.
+'''
+
+# Reinforcement cases and batch sizes in the macro benchmarks
+cases = ('ordinary', 'prestressed', 'prestress_and_ordinary')
+batch_sizes = (1, 10 ** 3, 10 ** 6)
+
+# Largest batch size that is measured with one Beam instance for each beam, bigger batches only use the Beam batch class
+max_beam_size = 10 ** 3
+
+def make_inputs(case: str) -> Input:
+    ''' Function that makes an input for one reinforcement case
+    Args:
+        case(str):  'ordinary', 'prestressed' or 'prestress_and_ordinary'
+    Returns:
+        input:  instance for the Input class
+    Raises:
+        ValueError:  if the case is unknown
+    '''
+    input = Input()
+    if case == 'ordinary':
+        return input
+    elif case in ('prestressed', 'prestress_and_ordinary'):
+        input.is_the_beam_prestressed = True
+        input.nr_prestressed_bars = 8
+        input.prestressed_reinforcment_diameter = 15.2
+        input.prestressed_reinforcment_name = 'Y1860S7'
+        input.prestressed_and_ordinary_in_top = case == 'prestress_and_ordinary'
+        return input
+    else:
+        raise ValueError(f'case={case}, expected ordinary, prestressed or prestress_and_ordinary')
+
+
+def time_function(function, repeat: int = 5) -> float:
+    ''' Function that measures the best time of several runs, to reduce noise from the rest of the machine
+    Args:
+        function:  function without arguments to measure
+        repeat(int):  number of runs
+    Returns:
+        time(float):  best time [s]
+    '''
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_import(module: str = 'A0_Results') -> float:
+    ''' Function that measures the time to import a script in a new Python process (cold start)
+    Args:
+        module(str):  name of the script
+    Returns:
+        time(float):  import time [s]
+    '''
+    code = f'import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return float(output.stdout.split()[-1])
+
+
+def run_benchmark(size: int = 1000):
+    ''' Function that measures and prints the time for the Beam class and the Beam batch class, for each reinforcement case
+    Args:
+        size(int):  number of beams
+    '''
+    from A0_Results import Beam
+    from K0_Batch import Beam_batch, columns_from_inputs
+
+    print(f'Cold import of A0_Results: {time_import() * 1000:.1f} ms')
+    for case in ('ordinary', 'prestressed', 'prestress_and_ordinary'):
+        inputs = [copy.copy(make_inputs(case)) for _ in range(size)]
+        columns = columns_from_inputs(inputs)
+        beam_time = time_function(lambda: [Beam(input) for input in inputs], repeat=3)
+        batch_time = time_function(lambda: Beam_batch(columns), repeat=3)
+        print(f'{case}: Beam {beam_time / size * 10 ** 6:.1f} us per beam, Beam batch {batch_time / size * 10 ** 6:.2f} us per beam, '
+              f'speed-up {beam_time / batch_time:.1f}x')
+
+
+def run_cubic_benchmark(size: int = 1000000, loop_size: int = 10000):
+    ''' Function that measures and prints the time for the closed form solver of the third degree equation Sørensen (6.24),
+    compared with np.roots and the scalar solver the Cracked stress class uses for one equation at a time, and the
+    largest difference between the closed form solver and np.roots
+    Args:
+        size(int):  number of equations solved with the closed form solver
+        loop_size(int):  number of equations solved with np.roots and the scalar solver, one at a time
+    '''
+    from G2_SLS_Cracked import solve_cubic, solve_cubic_scalar, get_admissible_root
+
+    # Coefficients in the range of the beams in the Beam class
+    generator = np.random.default_rng(0)
+    d = generator.uniform(200, 1500, size)
+    e = generator.uniform(30, 200, size)
+    a = generator.uniform(-3000, 3000, size)
+    netta_ro = generator.uniform(3, 30, size) * generator.uniform(10 ** -4, 0.03, size)
+    coefficients = (d / (6 * (e + a)), 0.5 * (1 - d / (e + a)), netta_ro, - netta_ro)
+
+    closed_form_time = time_function(lambda: get_admissible_root(*solve_cubic(*coefficients)), repeat=3)
+    alpha, found = get_admissible_root(*solve_cubic(*coefficients))
+
+    loop_size = min(loop_size, size)
+    reference = np.full(loop_size, np.nan)
+    start = time.perf_counter()
+    for j in range(loop_size):
+        roots = np.roots([coefficient[j] for coefficient in coefficients])
+        real = roots[(roots.imag == 0) & (roots.real > 0) & (roots.real < 1)].real
+        if len(real):
+            reference[j] = real.min()
+    roots_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for j in range(loop_size):
+        solve_cubic_scalar(*(coefficient[j] for coefficient in coefficients))
+    scalar_time = time.perf_counter() - start
+
+    difference = np.nanmax(np.abs(alpha[:loop_size] - reference) / reference)
+    print(f'Closed form: {closed_form_time / size * 10 ** 9:.1f} ns per equation, np.roots: {roots_time / loop_size * 10 ** 9:.1f} ns per equation, '
+          f'speed-up {roots_time / loop_size / (closed_form_time / size):.0f}x')
+    print(f'Scalar solver for one beam: {scalar_time / loop_size * 10 ** 9:.1f} ns per equation, '
+          f'speed-up {roots_time / scalar_time:.0f}x compared with np.roots')
+    print(f'Largest relative difference {difference:.1e}, same admissible roots: {np.array_equal(found[:loop_size], ~np.isnan(reference))}, '
+          f'no admissible root for {np.count_nonzero(~found)} of {size} equations')
+
+
+def measure_memory(function) -> tuple:
+    ''' Function that measures the memory kept by the result of a function, and the peak memory while it runs
+    Args:
+        function:  function without arguments
+    Returns:
+        result:  what the function gives back, kept alive until the memory is measured
+        kept(int):  memory allocated by the function and not freed when it is done [bytes]
+        peak(int):  largest memory allocated while the function runs [bytes]
+    '''
+    gc.collect()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return result, current - before, peak - before
+
+
+def run_memory_benchmark(size: int = 1000) -> dict:
+    ''' Function that measures and prints the memory used to keep the results of many beams, as Beam instances with
+    all their instances, as Beam records with only the results, and as rows in a structured array
+    Args:
+        size(int):  number of beams
+    Returns:
+        results(dict):  for each reinforcement case, the memory kept for each beam and the peak memory for all beams
+                        with Beam, Beam record and array [bytes]
+    '''
+    from A0_Results import Beam
+    from Z0_Record import records_to_array
+
+    results = {}
+    print(f'{"case":<24}{"kept [B/beam]":>30}{"peak [kB]":>30}{"1M beams kept [MB]":>30}')
+    print(f'{"":<24}' + f'{"Beam":>10}{"record":>10}{"array":>10}' * 3)
+    for case in cases:
+        inputs = [copy.copy(make_inputs(case)) for _ in range(size)]
+        beams, beam_kept, beam_peak = measure_memory(lambda: [Beam(input) for input in inputs])
+        del beams
+        records, record_kept, record_peak = measure_memory(lambda: [Beam.calculate_record(input) for input in inputs])
+        rows, array_kept, array_peak = measure_memory(lambda: records_to_array(records))
+        kept = {'Beam': beam_kept / size, 'record': record_kept / size, 'array': array_kept / size}
+        peak = {'Beam': beam_peak, 'record': record_peak, 'array': array_peak}
+        results[case] = {'kept': kept, 'peak': peak}
+        print(f'{case:<24}' + ''.join(f'{value:>10.0f}' for value in kept.values()) + ''.join(f'{value / 1024:>10.1f}' for value in peak.values()) +
+              ''.join(f'{value * 10 ** 6 / 1024 ** 2:>10.1f}' for value in kept.values()))
+    return results
+
+
+def get_micro_benchmarks() -> dict:
+    ''' Function that gives the micro benchmarks, one for the constructor of each calculation class. Each benchmark
+    makes one instance from a Beam made for the reinforcement case, with the same arguments as in the Beam class.
+    Returns:
+        benchmarks(dict):  reinforcement case and function that makes the instance from a beam and an input, for each class
+    '''
+    import T0_Graph as graph
+    from B0_Material import Material
+
+    def make_material(beam, input):
+        return Material(input.concrete_class, float(input.steel_class[1:4]), input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter)
+
+    return {'Material': ('prestressed', make_material),
+            'Cross_section': ('ordinary', graph.make_cross_section),
+            'Load_properties': ('ordinary', graph.make_load),
+            'Creep_number': ('ordinary', graph.make_creep),
+            'ULS': ('ordinary', graph.make_ULS),
+            'ULS_prestressed': ('prestressed', graph.make_ULS_prestressed),
+            'ULS_prestress_and_ordinary': ('prestress_and_ordinary', graph.make_ULS_prestress_and_ordinary),
+            'Deflection': ('ordinary', graph.make_deflection_1),
+            'Deflection_prestressed': ('prestressed', graph.make_deflection_prestressed),
+            'Cracked_Stress': ('prestressed', graph.make_stress_cracked),
+            'time_effects': ('prestressed', graph.make_time_effect),
+            'Stress': ('prestressed', graph.make_stress)}
+
+
+def measure(function, repeat: int = 5, min_time: float = 0.2) -> dict:
+    ''' Function that measures the time for one call of a function. The number of calls in each run is increased
+    until a run takes at least min_time, and the median and best of the runs are given.
+    Args:
+        function:  function without arguments to measure
+        repeat(int):  number of runs
+        min_time(float):  shortest time for one run [s]
+    Returns:
+        timing(dict):  median and best time for one call [s], and the number of calls in each run and of runs
+    '''
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return {'median': float(np.median(times)), 'best': float(np.min(times)), 'number': number, 'repeat': repeat}
+
+
+def make_batch_columns(case: str, size: int) -> dict:
+    ''' Function that makes columns for the Beam batch class with the same beam size times
+    Args:
+        case(str):  'ordinary', 'prestressed' or 'prestress_and_ordinary'
+        size(int):  number of beams
+    Returns:
+        columns(dict):  one value for each field in the Input class, and an array for the width
+    '''
+    columns = dict(vars(make_inputs(case)))
+    columns['width'] = np.full(size, float(columns['width']))
+    return columns
+
+
+def run_suite(sizes: tuple = batch_sizes, repeat: int = 5, min_time: float = 0.2, micro: bool = True, macro: bool = True) -> dict:
+    ''' Function that runs the benchmark suite
+    Args:
+        sizes(tuple):  batch sizes in the macro benchmarks
+        repeat(int):  number of runs of each benchmark
+        min_time(float):  shortest time for one run [s]
+        micro(boolean):  if True, the micro benchmarks are run
+        macro(boolean):  if True, the macro benchmarks are run
+    Returns:
+        suite(dict):  information about the machine, and the timing for each benchmark, where the name is
+                      micro/<class>, macro/Beam/<case>/<size> or macro/Beam_batch/<case>/<size>
+    '''
+    from A0_Results import Beam
+    from K0_Batch import Beam_batch
+
+    results = {}
+    if micro:
+        beams = {case: (Beam(make_inputs(case)), make_inputs(case)) for case in cases}
+        for name, (case, make) in get_micro_benchmarks().items():
+            beam, input = beams[case]
+            results[f'micro/{name}'] = measure(lambda: make(beam, input), repeat, min_time)
+    if macro:
+        for case in cases:
+            for size in sizes:
+                if size <= max_beam_size:
+                    inputs = [make_inputs(case) for _ in range(size)]
+                    timing = measure(lambda: [Beam(input) for input in inputs], repeat, min_time)
+                    results[f'macro/Beam/{case}/{size}'] = {**timing, 'per_beam': timing['median'] / size}
+                columns = make_batch_columns(case, size)
+                timing = measure(lambda: Beam_batch(columns), repeat, min_time)
+                results[f'macro/Beam_batch/{case}/{size}'] = {**timing, 'per_beam': timing['median'] / size}
+
+    return {'machine': {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+                        'processor': platform.processor()},
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'results': results}
+
+
+def save_suite(suite: dict, path: str):
+    ''' Function that saves the results of the benchmark suite as JSON
+    Args:
+        suite(dict):  results from run_suite
+        path(str):  path to the JSON file
+    '''
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(suite, file, indent=2)
+
+
+def load_suite(path: str) -> dict:
+    ''' Function that reads the results of the benchmark suite from JSON
+    Args:
+        path(str):  path to the JSON file
+    Returns:
+        suite(dict):  results from run_suite
+    Raises:
+        ValueError:  if the file does not contain results from the benchmark suite
+    '''
+    with open(path, encoding='utf-8') as file:
+        suite = json.load(file)
+    if not isinstance(suite, dict) or 'results' not in suite:
+        raise ValueError(f'The file {path} does not contain results from the benchmark suite')
+    return suite
+
+
+def compare_suites(suite: dict, baseline: dict, threshold: float = 0.1) -> dict:
+    ''' Function that compares the median times with the baseline. A benchmark is a regression if it is more than
+    threshold slower than in the baseline, and an improvement if it is more than threshold faster.
+    Args:
+        suite(dict):  results from run_suite
+        baseline(dict):  results from an earlier run of run_suite
+        threshold(float):  allowed relative change, 0.1 is 10 %
+    Returns:
+        comparison(dict):  for each benchmark in both suites, the ratio between the new and the baseline time and
+                           'regression', 'improvement' or 'unchanged'
+    Raises:
+        ValueError:  if the threshold is negative
+    '''
+    if threshold < 0:
+        raise ValueError(f'threshold={threshold}, expected a relative change of at least 0')
+    comparison = {}
+    for name, timing in suite['results'].items():
+        if name in baseline['results']:
+            ratio = timing['median'] / baseline['results'][name]['median']
+            if ratio > 1 + threshold:
+                status = 'regression'
+            elif ratio < 1 / (1 + threshold):
+                status = 'improvement'
+            else:
+                status = 'unchanged'
+            comparison[name] = {'ratio': ratio, 'status': status}
+    return comparison
+
+
+def print_suite(suite: dict, comparison: dict = None):
+    ''' Function that prints the results of the benchmark suite, and the comparison with the baseline if it is given
+    Args:
+        suite(dict):  results from run_suite
+        comparison(dict):  results from compare_suites
+    '''
+    for name, timing in suite['results'].items():
+        line = f'{name:<48} {timing["median"] * 10 ** 6:>14.2f} us'
+        if 'per_beam' in timing:
+            line += f' {timing["per_beam"] * 10 ** 6:>10.3f} us per beam'
+        if comparison and name in comparison:
+            line += f'  {comparison[name]["ratio"]:.2f}x baseline, {comparison[name]["status"]}'
+        print(line)
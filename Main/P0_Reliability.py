@@ -0,0 +1,361 @@
+# Import module numpy as np
+import numpy as np
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from C1_ULS import calculate_M_Rd, calculate_V_Rd # From the ULS script, import the capacity functions
+from C2_ULS import calculate_moment_capacity # From the ULS prestressed script, import the moment capacity function
+
+''' This script contain the Reliability class that apply for all reinforcement cases.
+Material strengths, geometry and loads are sampled from distributions, and the limit state g = M_R - M_E (or V_R - V_E)
+is evaluated for each sample with the capacity formulas from the ULS classes. The failure probability and the reliability
+index beta are found with Monte Carlo simulation, in chunks that are evaluated in a pool of processes.
+'''
+
+# Names of all variables that are sampled in the Limit state class
+variables = ('fc', 'fy', 'fp', 'width', 'height', 'a', 'selfload', 'liveload')
+
+
+class Distribution:
+    ''' Class to contain a probability distribution given by its mean value and coefficient of variation
+    '''
+    kinds = ('normal', 'lognormal', 'gumbel', 'deterministic')
+
+    def __init__(self, kind: str, mean: float, cov: float = 0):
+        '''Args:
+            kind(str):  'normal', 'lognormal', 'gumbel' (largest value) or 'deterministic'
+            mean(float):  mean value
+            cov(float):  coefficient of variation, standard deviation divided by the mean value
+        Returns:
+            std(float):  standard deviation
+        Raises:
+            ValueError:  if the kind is unknown, or the coefficient of variation is negative
+        '''
+        if kind not in self.kinds:
+            raise ValueError(f'kind={kind}, expected one of {", ".join(self.kinds)}')
+        if cov < 0:
+            raise ValueError(f'cov={cov}, expected a coefficient of variation of at least 0')
+        self.kind = kind
+        self.mean = float(mean)
+        self.cov = float(cov)
+        self.std = abs(self.mean) * self.cov
+
+    def __repr__(self) -> str:
+        return f'Distribution({self.kind!r}, {self.mean!r}, {self.cov!r})'
+
+    def sample(self, generator: np.random.Generator, size: int) -> np.ndarray:
+        ''' Function that draws samples from the distribution
+        Args:
+            generator:  NumPy random generator
+            size(int):  number of samples
+        Returns:
+            samples(array):  samples from the distribution
+        '''
+        if self.kind == 'normal':
+            return generator.normal(self.mean, self.std, size)
+        elif self.kind == 'lognormal':
+            sigma = np.sqrt(np.log(1 + self.cov ** 2))
+            return generator.lognormal(np.log(self.mean) - sigma ** 2 / 2, sigma, size)
+        elif self.kind == 'gumbel':
+            scale = self.std * np.sqrt(6) / np.pi
+            return generator.gumbel(self.mean - np.euler_gamma * scale, scale, size)
+        else:
+            return np.full(size, self.mean)
+
+
+def get_distributions(beam, input) -> dict:
+    ''' Function that gives assumed distributions for the sampled variables, with mean values from the beam.
+    The standard deviation of 5 N/mm2 for concrete gives fck as the 5 % fractile of fcm = fck + 8, and the yield
+    strength has a mean of fyk plus two standard deviations.
+    Args:
+        beam:  instance of the Beam class
+        input:  instance of the Input class that the beam is made from
+    Returns:
+        distributions(dict):  one instance of the Distribution class for each name in variables
+    '''
+    material, cross_section = beam.material_instance, beam.cross_section_instance
+    d = cross_section.d_2 if beam.is_the_beam_prestressed else cross_section.d_1
+    return {'fc': Distribution('lognormal', material.fcm, 5 / material.fcm),
+            'fy': Distribution('lognormal', material.fyk + 2 * 30, 30 / (material.fyk + 2 * 30)),
+            'fp': Distribution('lognormal', max(material.fp01k, 1) * 1.04, 0.025),
+            'width': Distribution('normal', cross_section.width, 5 / cross_section.width),
+            'height': Distribution('normal', cross_section.height, 5 / cross_section.height),
+            'a': Distribution('normal', cross_section.height - d, 5 / (cross_section.height - d)),
+            'selfload': Distribution('normal', input.distributed_selfload, 0.05),
+            'liveload': Distribution('gumbel', input.distributed_liveload, 0.2)}
+
+
+class Limit_state:
+    ''' Class to contain the limit state for one beam, g = M_R - M_E for the moment capacity or g = V_R - V_E for the
+    shear capacity. M_R is found with the same formulas as the ULS, ULS prestressed and ULS prestressed and ordinary
+    classes, and V_R with the shear capacity function from the ULS script, but with sampled strengths instead of design
+    strengths. M_E and V_E are found with the formulas from the Load properties class without load factors. For
+    prestressed beams the strain difference from the time effects and the moment from the prestress force are taken
+    from the beam. The functions work for floats, arrays and dual numbers.
+    '''
+    capacities = ('moment', 'shear')
+
+    def __init__(self, input, distributions: dict = None, capacity: str = 'moment'):
+        '''Args:
+            input:  instance of the Input class
+            distributions(dict):  instance of the Distribution class for names in variables, to change the
+                                  distributions from get_distributions
+            capacity(str):  'moment', or 'shear' for the shear capacity without shear reinforcement
+        Returns:
+            distributions(dict):  distribution for each name in variables
+        Raises:
+            ValueError:  if a name in distributions is not in variables, the capacity is unknown, or the shear
+                         capacity is asked for a prestressed beam
+        '''
+        from A0_Results import Beam # Imported here, so the workers only need the Beam class if they make the limit state
+
+        for name in distributions or {}:
+            if name not in variables:
+                raise ValueError(f'{name} is not a variable, expected one of {", ".join(variables)}')
+        if capacity not in self.capacities:
+            raise ValueError(f'capacity={capacity}, expected one of {", ".join(self.capacities)}')
+        if capacity == 'shear' and input.is_the_beam_prestressed:
+            raise ValueError('The shear capacity limit state is only made for ordinary reinforced beams')
+        beam = Beam(input)
+        material, cross_section = beam.material_instance, beam.cross_section_instance
+        self.distributions = {**get_distributions(beam, input), **(distributions or {})}
+
+        self.capacity = capacity
+        self.prestressed = beam.is_the_beam_prestressed
+        self.length = input.beam_length
+        self.lambda_factor, self.netta = material.lambda_factor, material.netta
+        self.eps_cu3, self.Es, self.Ep = material.eps_cu3, material.Es, material.Ep
+        self.As, self.Ap, self.cnom = cross_section.As, cross_section.Ap, cross_section.cnom
+        self.As_top = cross_section.As if beam.prestressed_and_ordinary_in_top else 0
+        self.eps_diff = beam.ULS_instance.eps_diff if self.prestressed else 0
+        self.M_prestress = beam.load_instance.M_prestress if self.prestressed else 0
+
+    def sample(self, generator: np.random.Generator, size: int) -> dict:
+        ''' Function that draws samples of all variables
+        Args:
+            generator:  NumPy random generator
+            size(int):  number of samples
+        Returns:
+            samples(dict):  one array for each name in variables
+        '''
+        return {name: self.distributions[name].sample(generator, size) for name in variables}
+
+    def calculate_M_R(self, fc, fy, fp, width, height, a):
+        ''' Function that calculates the moment capacity, with alpha for under-reinforced or over-reinforced cross section
+        Args:
+            fc(array):  concrete compression strength [N/mm2]
+            fy(array):  yield strength for ordinary reinforcement [N/mm2]
+            fp(array):  0.1 % proof stress for prestressed reinforcement [N/mm2]
+            width(array):  width of cross section [mm]
+            height(array):  height of cross section [mm]
+            a(array):  distance from bottom to the tension reinforcement [mm]
+        Returns:
+            M_R(array):  moment capacity [kNm]
+        '''
+        lambda_factor, netta, eps_cu3, eps_diff = self.lambda_factor, self.netta, self.eps_cu3, self.eps_diff
+        As = np.where(self.prestressed, self.Ap, self.As)
+        E = np.where(self.prestressed, self.Ep, self.Es)
+        f = np.where(self.prestressed, fp, fy)
+        top = fy * self.As_top
+        d = height - a
+        a_2 = netta * lambda_factor * fc * width * d
+
+        alpha_b = eps_cu3 / (eps_cu3 + f / E - eps_diff) # Sørensen (4.20) and (7.7)
+        under_reinforced = As <= (a_2 * alpha_b + top) / f # Sørensen (4.21) and (7.8)
+        b = top + (eps_cu3 - eps_diff) * E * As
+        c = - eps_cu3 * E * As
+        alpha_over = (- b + np.sqrt(b ** 2 - 4 * a_2 * c)) / (2 * a_2) # Sørensen (4.18) and (7.10)
+        alpha = np.abs(np.where(under_reinforced, (f * As - top) / a_2, alpha_over)) # Sørensen (4.19) and (7.9)
+
+        M_R = np.where(self.prestressed, calculate_moment_capacity(alpha, fc, width, d, lambda_factor, netta),
+                       calculate_M_Rd(alpha, fc, width, d, lambda_factor, netta))
+        return M_R + top * (d - self.cnom) * 10 ** -6 # From the ULS prestressed and ordinary class
+
+    def calculate_V_R(self, fc, width, height, a):
+        ''' Function that calculates the shear capacity without shear reinforcement with the function from the ULS
+        script. The mean strength is used, so the material factor is 1.
+        Args:
+            fc(array):  concrete compression strength [N/mm2]
+            width(array):  width of cross section [mm]
+            height(array):  height of cross section [mm]
+            a(array):  distance from bottom to the tension reinforcement [mm]
+        Returns:
+            V_R(array):  shear capacity [kN]
+        '''
+        return calculate_V_Rd(height - a, self.As, width, fc, 1, fc)
+
+    def calculate_M_E(self, selfload, liveload):
+        ''' Function that calculates the moment in the middle of the beam, including the moment from prestressing
+        Args:
+            selfload(array):  distributed selfload [kN/m]
+            liveload(array):  distributed liveload [kN/m]
+        Returns:
+            M_E(array):  moment [kNm]
+        '''
+        return (selfload + liveload) * self.length ** 2 / 8 + self.M_prestress
+
+    def calculate_V_E(self, selfload, liveload):
+        ''' Function that calculates the shear force near the supports
+        Args:
+            selfload(array):  distributed selfload [kN/m]
+            liveload(array):  distributed liveload [kN/m]
+        Returns:
+            V_E(array):  shear force [kN]
+        '''
+        return (selfload + liveload) * self.length / 2
+
+    def calculate_g(self, samples: dict):
+        ''' Function that calculates the limit state, negative for failure
+        Args:
+            samples(dict):  one array for each name in variables
+        Returns:
+            g(array):  M_R - M_E [kNm] or V_R - V_E [kN]
+        '''
+        if self.capacity == 'shear':
+            V_R = self.calculate_V_R(samples['fc'], samples['width'], samples['height'], samples['a'])
+            return V_R - self.calculate_V_E(samples['selfload'], samples['liveload'])
+        M_R = self.calculate_M_R(samples['fc'], samples['fy'], samples['fp'], samples['width'], samples['height'], samples['a'])
+        return M_R - self.calculate_M_E(samples['selfload'], samples['liveload'])
+
+
+def evaluate_chunk(limit_state: Limit_state, size: int, seed) -> tuple:
+    ''' Function that evaluates the limit state for one chunk of samples. Runs in the worker process, and only gives
+    back sums, so the memory does not grow with the number of samples.
+    Args:
+        limit_state:  instance of the Limit state class
+        size(int):  number of samples
+        seed:  NumPy SeedSequence, so every chunk get its own random numbers
+    Returns:
+        sums(tuple):  number of samples, number of failures, sum of g and sum of g squared
+    '''
+    g = limit_state.calculate_g(limit_state.sample(np.random.default_rng(seed), size))
+    return size, int(np.count_nonzero(g <= 0)), float(np.sum(g)), float(np.sum(g ** 2))
+
+
+class Reliability:
+    ''' Class to contain the failure probability and reliability index for the capacity of a beam, found with
+    Monte Carlo simulation. The samples are made and evaluated in chunks in a pool of processes, and only the sums
+    from each chunk are kept. The result is the same for the same seed, chunk size and number of samples, no matter
+    how many processes are used.
+    '''
+    def __init__(self, limit_state: Limit_state, samples: int = 10 ** 6, chunk_size: int = 10 ** 5,
+                 workers: int = None, seed: int = None, confidence: float = 0.95):
+        '''Args:
+            limit_state:  instance of the Limit state class
+            samples(int):  number of samples
+            chunk_size(int):  number of samples in each chunk
+            workers(int):  number of processes, as default one for each core. With 1 the chunks are evaluated in this process
+            seed(int):  seed for the random numbers, as default new random numbers each time
+            confidence(float):  confidence level for the intervals
+        Returns:
+            samples(int):  number of samples evaluated
+            failures(int):  number of samples with g <= 0
+            p_f(float):  failure probability
+            p_f_interval(tuple):  confidence interval for the failure probability (Wilson score interval)
+            beta(float):  reliability index, inf if no samples fail
+            beta_interval(tuple):  confidence interval for the reliability index
+            mean_g(float):  mean value of g [kNm]
+            std_g(float):  standard deviation of g [kNm]
+            wall_time(float):  time used [s]
+        Raises:
+            ValueError:  if samples, chunk_size or workers is less than 1, or the confidence level is not between 0 and 1
+        '''
+        self.workers = os.cpu_count() if workers is None else workers
+        for name, value in (('samples', samples), ('chunk_size', chunk_size), ('workers', self.workers)):
+            if value < 1:
+                raise ValueError(f'{name}={value}, expected at least 1')
+        if not 0 < confidence < 1:
+            raise ValueError(f'confidence={confidence}, expected a value between 0 and 1')
+        self.confidence = confidence
+
+        start = time.perf_counter()
+        sizes = [chunk_size] * (samples // chunk_size) + ([samples % chunk_size] if samples % chunk_size else [])
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        self.samples, self.failures, sum_g, sum_g2 = self.accumulate(limit_state, sizes, seeds)
+        self.wall_time = time.perf_counter() - start
+
+        self.mean_g = sum_g / self.samples
+        self.std_g = np.sqrt(max(sum_g2 / self.samples - self.mean_g ** 2, 0) * self.samples / max(self.samples - 1, 1))
+        self.p_f = self.failures / self.samples
+        self.p_f_interval = self.calculate_wilson_interval(self.failures, self.samples, confidence)
+        self.beta = self.calculate_beta(self.p_f)
+        self.beta_interval = (self.calculate_beta(self.p_f_interval[1]), self.calculate_beta(self.p_f_interval[0]))
+
+    def accumulate(self, limit_state: Limit_state, sizes: list, seeds: list) -> tuple:
+        ''' Function that evaluates all chunks and adds up the sums. Only two chunks for each worker are sent to the
+        pool at once, so the number of chunks waiting does not grow with the number of samples.
+        Args:
+            limit_state:  instance of the Limit state class
+            sizes(list):  number of samples in each chunk
+            seeds(list):  NumPy SeedSequence for each chunk
+        Returns:
+            sums(array):  number of samples, number of failures, sum of g and sum of g squared
+        '''
+        sums = np.zeros(4)
+        chunks = zip(sizes, seeds)
+        if self.workers == 1:
+            for size, seed in chunks:
+                sums += evaluate_chunk(limit_state, size, seed)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                pending = deque()
+                for size, seed in chunks:
+                    if len(pending) >= 2 * self.workers:
+                        sums += pending.popleft().result()
+                    pending.append(executor.submit(evaluate_chunk, limit_state, size, seed))
+                while pending:
+                    sums += pending.popleft().result()
+        return int(sums[0]), int(sums[1]), sums[2], sums[3]
+
+    def calculate_wilson_interval(self, failures: int, samples: int, confidence: float) -> tuple:
+        ''' Function that calculates the Wilson score interval for the failure probability, which also gives a
+        useful upper limit when no samples fail
+        Args:
+            failures(int):  number of samples with g <= 0
+            samples(int):  number of samples
+            confidence(float):  confidence level
+        Returns:
+            interval(tuple):  lower and upper limit for the failure probability
+        '''
+        z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+        p = failures / samples
+        denominator = 1 + z ** 2 / samples
+        center = (p + z ** 2 / (2 * samples)) / denominator
+        half_width = z * np.sqrt(p * (1 - p) / samples + z ** 2 / (4 * samples ** 2)) / denominator
+        low = 0.0 if failures == 0 else max(center - half_width, 0.0)
+        high = 1.0 if failures == samples else min(center + half_width, 1.0)
+        return float(low), float(high)
+
+    def calculate_beta(self, p_f: float) -> float:
+        ''' Function that calculates the reliability index from the failure probability
+        Args:
+            p_f(float):  failure probability
+        Returns:
+            beta(float):  reliability index, inf for p_f = 0 and -inf for p_f = 1
+        '''
+        if p_f <= 0:
+            return np.inf
+        elif p_f >= 1:
+            return - np.inf
+        return - NormalDist().inv_cdf(p_f)
+
+
+def run_reliability(input, samples: int = 10 ** 6, chunk_size: int = 10 ** 5, workers: int = None, seed: int = None,
+                    confidence: float = 0.95, distributions: dict = None, capacity: str = 'moment') -> Reliability:
+    ''' Function that finds the reliability of the moment capacity for a beam
+    Args:
+        input:  instance of the Input class
+        samples(int):  number of samples
+        chunk_size(int):  number of samples in each chunk
+        workers(int):  number of processes, as default one for each core
+        seed(int):  seed for the random numbers
+        confidence(float):  confidence level for the intervals
+        distributions(dict):  instance of the Distribution class for names in variables, to change the default distributions
+        capacity(str):  'moment' or 'shear'
+    Returns:
+        reliability:  instance of the Reliability class
+    '''
+    return Reliability(Limit_state(input, distributions, capacity), samples, chunk_size, workers, seed, confidence)
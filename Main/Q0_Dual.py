@@ -0,0 +1,251 @@
+# Import module numpy as np
+import numpy as np
+
+''' This script contain the Dual class that apply for all reinforcement cases.
+A dual number carries a value and its derivatives with respect to chosen variables, so the formulas in the other
+scripts give exact gradients (forward mode automatic differentiation) when they are called with dual numbers
+instead of floats or arrays.
+'''
+
+class Dual:
+    ''' Class to contain a value and the derivatives of the value. The value can be a float or an array, and the
+    derivatives have one extra last axis with one derivative for each variable. The arithmetic operators and the
+    NumPy functions sqrt, exp, log, abs, minimum, maximum, where and interp work on dual numbers, and comparisons compare
+    the values, so formulas written with these can be used without changes.
+    '''
+    __array_priority__ = 1000
+
+    def __init__(self, value, derivative):
+        '''Args:
+            value(float or array):  value
+            derivative(array):  derivatives of the value, with the same shape as value and one extra last axis
+        '''
+        self.value = np.asarray(value, dtype=float)
+        self.derivative = np.asarray(derivative, dtype=float)
+
+    def __repr__(self) -> str:
+        return f'Dual({self.value!r}, {self.derivative!r})'
+
+    @property
+    def shape(self) -> tuple:
+        return self.value.shape
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index):
+        index = index if isinstance(index, tuple) else (index,)
+        return Dual(self.value[index], self.derivative[index + (slice(None),)])
+
+    def chain(self, value, *parts) -> 'Dual':
+        ''' Function that makes a new dual number with the chain rule
+        Args:
+            value(array):  value of the result
+            parts:  pairs of (derivative of the result with respect to an argument, derivatives of that argument)
+        Returns:
+            result:  dual number
+        '''
+        derivative = sum(np.asarray(partial)[..., None] * argument_derivative for partial, argument_derivative in parts)
+        return Dual(value, np.broadcast_to(derivative, np.shape(value) + np.shape(derivative)[-1:]))
+
+    def __add__(self, other):
+        b, db = get_parts(other)
+        return self.chain(self.value + b, (1.0, self.derivative), (1.0, db))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        b, db = get_parts(other)
+        return self.chain(self.value - b, (1.0, self.derivative), (-1.0, db))
+
+    def __rsub__(self, other):
+        b, db = get_parts(other)
+        return self.chain(b - self.value, (-1.0, self.derivative), (1.0, db))
+
+    def __mul__(self, other):
+        b, db = get_parts(other)
+        return self.chain(self.value * b, (b, self.derivative), (self.value, db))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        b, db = get_parts(other)
+        return self.chain(self.value / b, (1 / b, self.derivative), (- self.value / b ** 2, db))
+
+    def __rtruediv__(self, other):
+        b, db = get_parts(other)
+        return self.chain(b / self.value, (- b / self.value ** 2, self.derivative), (1 / self.value, db))
+
+    def __pow__(self, other):
+        b, db = get_parts(other)
+        value = self.value ** b
+        if isinstance(other, Dual):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return self.chain(value, (b * self.value ** (b - 1), self.derivative), (value * np.log(self.value), db))
+        return self.chain(value, (b * self.value ** (b - 1), self.derivative))
+
+    def __rpow__(self, other):
+        b, db = get_parts(other)
+        value = b ** self.value
+        return self.chain(value, (value * np.log(b), self.derivative), (self.value * b ** (self.value - 1), db))
+
+    def __neg__(self):
+        return Dual(- self.value, - self.derivative)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self.chain(np.abs(self.value), (np.sign(self.value), self.derivative))
+
+    def __lt__(self, other):
+        return self.value < get_parts(other)[0]
+
+    def __le__(self, other):
+        return self.value <= get_parts(other)[0]
+
+    def __gt__(self, other):
+        return self.value > get_parts(other)[0]
+
+    def __ge__(self, other):
+        return self.value >= get_parts(other)[0]
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __round__(self, digits: int = None):
+        ''' Rounding only changes the value, the derivatives are kept
+        '''
+        return Dual(np.round(self.value, 0 if digits is None else digits), self.derivative)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        ''' Function that lets NumPy functions work on dual numbers, for instance np.sqrt(x) and array * x
+        '''
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        if ufunc in binary_functions:
+            return binary_functions[ufunc](*inputs)
+        if ufunc in unary_functions:
+            return unary_functions[ufunc](inputs[0])
+        return NotImplemented
+
+    def __array_function__(self, function, types, args, kwargs):
+        ''' Function that lets np.where, np.interp and np.searchsorted work on dual numbers. For np.where the
+        derivatives are chosen the same way as the values, np.interp uses the slope of the line segment, and
+        np.searchsorted only looks at the values.
+        '''
+        if function is np.interp:
+            return calculate_interp(*args, **kwargs)
+        if function is np.searchsorted:
+            return np.searchsorted(*(get_parts(arg)[0] for arg in args), **kwargs)
+        if function is not np.where or kwargs or len(args) != 3:
+            return NotImplemented
+        condition = np.asarray(args[0].value if isinstance(args[0], Dual) else args[0], dtype=bool)
+        (a, da), (b, db) = get_parts(args[1]), get_parts(args[2])
+        value = np.where(condition, a, b)
+        shape = value.shape + (self.derivative.shape[-1],)
+        derivative = np.where(condition[..., None], np.broadcast_to(da, shape), np.broadcast_to(db, shape))
+        return Dual(value, derivative)
+
+def get_parts(value) -> tuple:
+    ''' Function that gives value and derivatives of a dual number or a constant
+    Args:
+        value:  dual number, float or array
+    Returns:
+        value(array):  value
+        derivative(array or float):  derivatives, 0 for a constant
+    '''
+    if isinstance(value, Dual):
+        return value.value, value.derivative
+    return np.asarray(value, dtype=float), 0.0
+
+
+def calculate_minimum(a, b):
+    ''' Function that gives the smallest of a and b, with the derivatives of the one that is chosen
+    '''
+    return np.where(get_parts(a)[0] <= get_parts(b)[0], a, b)
+
+
+def calculate_maximum(a, b):
+    ''' Function that gives the biggest of a and b, with the derivatives of the one that is chosen
+    '''
+    return np.where(get_parts(a)[0] >= get_parts(b)[0], a, b)
+
+
+def calculate_sqrt(a: Dual) -> Dual:
+    ''' Function that gives the square root of a dual number
+    '''
+    value = np.sqrt(a.value)
+    return a.chain(value, (0.5 / value, a.derivative))
+
+
+def calculate_exp(a: Dual) -> Dual:
+    ''' Function that gives the exponential function of a dual number
+    '''
+    value = np.exp(a.value)
+    return a.chain(value, (value, a.derivative))
+
+
+def calculate_log(a: Dual) -> Dual:
+    ''' Function that gives the natural logarithm of a dual number
+    '''
+    return a.chain(np.log(a.value), (1 / a.value, a.derivative))
+
+
+def calculate_isnan(a: Dual):
+    ''' Function that checks if the value of a dual number is NaN
+    '''
+    return np.isnan(a.value)
+
+
+def calculate_interp(x: Dual, xp, fp, left=None, right=None) -> Dual:
+    ''' Function that interpolates linearly in a table, with the slope of the line segment as derivative. Outside
+    the table the derivative is 0, or NaN if left or right is NaN.
+    '''
+    xp, fp = np.asarray(xp, dtype=float), np.asarray(fp, dtype=float)
+    value = np.interp(x.value, xp, fp, left=left, right=right)
+    j = np.clip(np.searchsorted(xp, x.value, side='right') - 1, 0, len(xp) - 2)
+    slope = (fp[j + 1] - fp[j]) / (xp[j + 1] - xp[j])
+    slope = np.where((x.value < xp[0]) | (x.value > xp[-1]), value * 0, slope)
+    return x.chain(value, (slope, x.derivative))
+
+
+def call_operator(name: str):
+    ''' Function that makes a NumPy function for two arguments from the operator with the given name
+    '''
+    def function(a, b):
+        if isinstance(a, Dual):
+            return getattr(a, f'__{name}__')(b)
+        return getattr(b, f'__r{name}__')(a)
+    return function
+
+
+def compare(ufunc):
+    ''' Function that makes a NumPy comparison that compares the values of dual numbers
+    '''
+    def function(a, b):
+        return ufunc(get_parts(a)[0], get_parts(b)[0])
+    return function
+
+
+binary_functions = {np.add: call_operator('add'), np.subtract: call_operator('sub'), np.multiply: call_operator('mul'),
+                    np.true_divide: call_operator('truediv'), np.power: call_operator('pow'),
+                    np.minimum: calculate_minimum, np.maximum: calculate_maximum,
+                    np.less: compare(np.less), np.less_equal: compare(np.less_equal),
+                    np.greater: compare(np.greater), np.greater_equal: compare(np.greater_equal)}
+unary_functions = {np.sqrt: calculate_sqrt, np.exp: calculate_exp, np.log: calculate_log,
+                   np.absolute: Dual.__abs__, np.negative: Dual.__neg__,
+                   np.isnan: calculate_isnan}
+
+
+def make_variables(values: list) -> list:
+    ''' Function that makes one dual number for each variable, with derivative 1 with respect to itself and 0 with
+    respect to the others
+    Args:
+        values(list):  value of each variable, floats or arrays with the same shape
+    Returns:
+        variables(list):  one dual number for each variable
+    '''
+    values = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+    identity = np.eye(len(values))
+    return [Dual(value, np.broadcast_to(identity[i], value.shape + (len(values),))) for i, value in enumerate(values)]
@@ -0,0 +1,251 @@
+# Import module numpy as np
+import numpy as np
+import math
+import time
+from statistics import NormalDist
+
+from P0_Reliability import Limit_state, variables # From the Reliability script, import the Limit state class and the names of the variables
+from Q0_Dual import Dual # From the Dual script, import the Dual class (for the gradients of the limit state)
+
+''' This script contain the FORM class that apply for all reinforcement cases.
+The reliability index is found with the first order reliability method (FORM), where the limit state is linearized in
+the design point, the point on the failure surface closest to the origin in standard normal space. The gradients are
+exact, found by evaluating the capacity functions from the ULS scripts with dual numbers. The second order method
+(SORM) corrects the failure probability with the curvatures of the failure surface in the design point.
+'''
+
+# Code for each kind of distribution in the Distribution class
+kind_codes = {'normal': 0, 'lognormal': 1, 'gumbel': 2, 'deterministic': 3}
+
+erfc = np.frompyfunc(math.erfc, 1, 1) # math.erfc for arrays, since NumPy has no error function
+
+
+def calculate_normal_cdf(u) -> np.ndarray:
+    ''' Function that calculates the standard normal cumulative distribution function, accurate also far out in the tails
+    Args:
+        u(array):  values in standard normal space
+    Returns:
+        Phi(array):  probability of a value smaller than u
+    '''
+    return 0.5 * erfc(- np.asarray(u, dtype=float) / np.sqrt(2)).astype(float)
+
+
+def calculate_normal_pdf(u) -> np.ndarray:
+    ''' Function that calculates the standard normal probability density function
+    Args:
+        u(array):  values in standard normal space
+    Returns:
+        phi(array):  probability density
+    '''
+    return np.exp(- np.asarray(u, dtype=float) ** 2 / 2) / np.sqrt(2 * np.pi)
+
+
+def calculate_log_normal_cdf(u) -> np.ndarray:
+    ''' Function that calculates the logarithm of the standard normal cumulative distribution function. For positive u
+    it is found from the probability of a bigger value, so it does not round to 0.
+    Args:
+        u(array):  values in standard normal space
+    Returns:
+        log_Phi(array):  natural logarithm of the probability of a value smaller than u
+    '''
+    u = np.asarray(u, dtype=float)
+    with np.errstate(divide='ignore'):
+        return np.where(u > 0, np.log1p(- calculate_normal_cdf(- u)), np.log(calculate_normal_cdf(u)))
+
+
+def stack_limit_states(limit_states: list) -> Limit_state:
+    ''' Function that makes one Limit state instance for many beams, where every attribute is an array with one value
+    for each beam, so all beams can be evaluated at once
+    Args:
+        limit_states(list):  instances of the Limit state class
+    Returns:
+        limit_state:  instance of the Limit state class with arrays as attributes
+    Raises:
+        ValueError:  if the limit states are for different capacities
+    '''
+    capacities = {limit_state.capacity for limit_state in limit_states}
+    if len(capacities) != 1:
+        raise ValueError(f'The limit states are for the capacities {", ".join(sorted(capacities))}, expected only one')
+    stacked = object.__new__(Limit_state)
+    for name, value in vars(limit_states[0]).items():
+        if name not in ('capacity', 'distributions'):
+            setattr(stacked, name, np.array([getattr(limit_state, name) for limit_state in limit_states]))
+    stacked.capacity = limit_states[0].capacity
+    stacked.distributions = [limit_state.distributions for limit_state in limit_states]
+    return stacked
+
+
+class FORM:
+    ''' Class to contain the reliability index for a batch of limit states, found with the HL-RF iteration
+    (Hasofer-Lind, Rackwitz-Fiessler). All limit states are iterated at once, and a limit state stops changing when
+    it has converged. The variables are transformed from standard normal space with their distributions, so the
+    gradient in standard normal space is found with the chain rule in the dual numbers.
+    '''
+    def __init__(self, limit_states, tolerance: float = 10 ** -6, max_iterations: int = 100, sorm: bool = True):
+        '''Args:
+            limit_states:  instance of the Limit state class, or list of instances
+            tolerance(float):  convergence limit for the change in the design point and for g relative to g in the mean point
+            max_iterations(int):  maximum number of iterations
+            sorm(bool):  if True, also find the curvatures and the SORM failure probability
+        Returns:
+            beta(array):  reliability index, negative if the mean point is in the failure domain
+            p_f(array):  failure probability from FORM
+            u(array):  design point in standard normal space, one row for each limit state
+            alpha(array):  unit vector from the origin towards the design point, the squares are the importance factors
+            design_point(dict):  value of each variable in the design point
+            converged(array):  True for the limit states that converged
+            iterations(int):  number of iterations
+            curvatures(array):  main curvatures of the failure surface in the design point, if sorm is True
+            p_f_sorm(array):  failure probability from SORM with the formula by Breitung, for beta < 0 the complement of
+                              the safe domain, if sorm is True
+            beta_sorm(array):  reliability index from SORM, if sorm is True
+            wall_time(float):  time used [s]
+        '''
+        start = time.perf_counter()
+        self.limit_states = [limit_states] if isinstance(limit_states, Limit_state) else list(limit_states)
+        self.limit_state = stack_limit_states(self.limit_states)
+        self.get_distribution_parameters(self.limit_state.distributions)
+
+        self.u, g, gradient, self.converged, self.iterations = self.calculate_design_point(tolerance, max_iterations)
+        g_mean = self.calculate_g(np.zeros(self.u.shape))[0]
+        self.beta = np.sign(g_mean) * np.linalg.norm(self.u, axis=-1)
+        self.p_f = calculate_normal_cdf(- self.beta)
+        self.alpha = - gradient / np.linalg.norm(gradient, axis=-1, keepdims=True)
+        self.design_point = dict(zip(variables, self.transform(self.u)[0].T))
+        if sorm:
+            self.curvatures = self.calculate_curvatures(self.u, gradient)
+            self.p_f_sorm, self.beta_sorm = self.calculate_p_f_sorm(self.beta, self.curvatures)
+        self.wall_time = time.perf_counter() - start
+
+    def get_distribution_parameters(self, distributions: list):
+        ''' Function that collects the distribution parameters for all limit states and variables in arrays, with one
+        row for each limit state and one column for each variable
+        Args:
+            distributions(list):  dictionary with an instance of the Distribution class for each variable, for each limit state
+        '''
+        parameters = np.array([[(kind_codes[distribution[name].kind], distribution[name].mean, distribution[name].std)
+                                for name in variables] for distribution in distributions])
+        self.kind, self.mean, self.std = parameters[..., 0], parameters[..., 1], parameters[..., 2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.sigma_ln = np.sqrt(np.log(1 + (self.std / self.mean) ** 2))
+            self.mu_ln = np.log(np.abs(self.mean)) - self.sigma_ln ** 2 / 2
+        self.scale = self.std * np.sqrt(6) / np.pi
+        self.location = self.mean - np.euler_gamma * self.scale
+
+    def transform(self, u: np.ndarray) -> tuple:
+        ''' Function that transforms from standard normal space to the variables, with x = F^-1(Phi(u))
+        Args:
+            u(array):  point in standard normal space, one row for each limit state
+        Returns:
+            x(array):  value of each variable
+            dx_du(array):  derivative of each variable with respect to u
+        '''
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            x_lognormal = np.exp(self.mu_ln + self.sigma_ln * u)
+            log_Phi = calculate_log_normal_cdf(u)
+            x_gumbel = self.location - self.scale * np.log(- log_Phi)
+            dx_du_gumbel = - self.scale * calculate_normal_pdf(u) / (np.exp(log_Phi) * log_Phi)
+
+        x = np.select([self.kind == 0, self.kind == 1, self.kind == 2], [self.mean + self.std * u, x_lognormal, x_gumbel], self.mean)
+        dx_du = np.select([self.kind == 0, self.kind == 1, self.kind == 2], [self.std, self.sigma_ln * x_lognormal, dx_du_gumbel], 0)
+        return x, dx_du
+
+    def calculate_g(self, u: np.ndarray) -> tuple:
+        ''' Function that calculates the limit state and its gradient in standard normal space
+        Args:
+            u(array):  point in standard normal space, one row for each limit state
+        Returns:
+            g(array):  limit state for each limit state
+            gradient(array):  derivative of g with respect to u, one row for each limit state
+        '''
+        x, dx_du = self.transform(u)
+        samples = {name: Dual(x[:, i], np.eye(len(variables))[i] * dx_du[:, i:i + 1]) for i, name in enumerate(variables)}
+        g = self.limit_state.calculate_g(samples)
+        return g.value, g.derivative
+
+    def calculate_design_point(self, tolerance: float, max_iterations: int) -> tuple:
+        ''' Function that finds the design point with the HL-RF iteration, starting in the mean point
+        Args:
+            tolerance(float):  convergence limit
+            max_iterations(int):  maximum number of iterations
+        Returns:
+            u(array):  design point in standard normal space
+            g(array):  limit state in the design point
+            gradient(array):  gradient in the design point
+            converged(array):  True for the limit states that converged
+            iterations(int):  number of iterations
+        '''
+        u = np.zeros((len(self.limit_states), len(variables)))
+        converged = np.zeros(len(u), dtype=bool)
+        g, gradient = self.calculate_g(u)
+        g_limit = tolerance * np.maximum(np.abs(g), np.finfo(float).tiny)
+        for iteration in range(1, max_iterations + 1):
+            u_new = ((np.sum(gradient * u, axis=-1) - g) / np.sum(gradient ** 2, axis=-1))[:, None] * gradient
+            step = np.linalg.norm(u_new - u, axis=-1)
+            u = np.where(converged[:, None], u, u_new)
+            g, gradient = self.calculate_g(u)
+            converged |= (step <= tolerance * np.maximum(np.linalg.norm(u, axis=-1), 1)) & (np.abs(g) <= g_limit)
+            if np.all(converged):
+                break
+        return u, g, gradient, converged, iteration
+
+    def calculate_curvatures(self, u: np.ndarray, gradient: np.ndarray, step: float = 10 ** -4) -> np.ndarray:
+        ''' Function that finds the main curvatures of the failure surface in the design point. The second derivatives
+        are found with central differences of the exact gradient, and projected on the plane normal to the gradient.
+        Args:
+            u(array):  design point in standard normal space
+            gradient(array):  gradient in the design point
+            step(float):  step in standard normal space for the differences
+        Returns:
+            curvatures(array):  main curvatures, positive when the failure surface curves away from the origin
+        '''
+        n = len(variables)
+        hessian = np.empty(u.shape + (n,))
+        for i in range(n):
+            du = np.eye(n)[i] * step
+            hessian[:, i] = (self.calculate_g(u + du)[1] - self.calculate_g(u - du)[1]) / (2 * step)
+        hessian = (hessian + np.swapaxes(hessian, -1, -2)) / 2
+
+        # Orthonormal vectors in the plane normal to the gradient, from a QR decomposition with the gradient first
+        norm = np.linalg.norm(gradient, axis=-1)
+        q = np.linalg.qr(np.concatenate([gradient[..., None], np.broadcast_to(np.eye(n), u.shape + (n,))[..., :n - 1]], axis=-1))[0]
+        plane = q[..., 1:]
+        return np.linalg.eigvalsh(np.swapaxes(plane, -1, -2) @ hessian @ plane) / norm[:, None]
+
+    def calculate_p_f_sorm(self, beta: np.ndarray, curvatures: np.ndarray) -> tuple:
+        ''' Function that calculates the failure probability with the formula by Breitung. The formula is only valid
+        for the domain on the other side of the failure surface from the origin. For beta >= 0 this is the failure
+        domain. For beta < 0 the origin is in the failure domain, so the formula is used for the safe domain (with -g,
+        which gives the same factors 1 + beta * curvature) and the failure probability is the complement.
+        Args:
+            beta(array):  reliability index from FORM
+            curvatures(array):  main curvatures in the design point
+        Returns:
+            p_f(array):  failure probability, NaN where 1 + beta * curvature is not positive
+            beta_sorm(array):  reliability index from the probability of the domain away from the origin, so it is
+                               not rounded off when p_f is close to 1, NaN where p_f is NaN
+        '''
+        factor = 1 + beta[:, None] * curvatures
+        valid = np.all(factor > 0, axis=-1)
+        p_far = calculate_normal_cdf(- np.abs(beta)) * np.prod(np.where(valid[:, None], factor, 1), axis=-1) ** -0.5
+        p_far = np.where(valid, p_far, np.nan)
+        p_f = np.where(beta >= 0, p_far, 1 - p_far)
+        beta_far = np.array([- NormalDist().inv_cdf(p) if 0 < p < 1 else (np.inf if p == 0 else np.nan) for p in p_far])
+        return p_f, np.where(beta >= 0, beta_far, - beta_far)
+
+
+def run_form(inputs, distributions: dict = None, capacity: str = 'moment', tolerance: float = 10 ** -6,
+             max_iterations: int = 100, sorm: bool = True) -> FORM:
+    ''' Function that finds the reliability index for one or many beams with FORM and SORM
+    Args:
+        inputs:  instance of the Input class, or list of instances
+        distributions(dict):  instance of the Distribution class for names in variables, to change the default distributions
+        capacity(str):  'moment' or 'shear'
+        tolerance(float):  convergence limit
+        max_iterations(int):  maximum number of iterations
+        sorm(bool):  if True, also find the SORM failure probability
+    Returns:
+        form:  instance of the FORM class, with one value for each input
+    '''
+    inputs = inputs if isinstance(inputs, (list, tuple)) else [inputs]
+    return FORM([Limit_state(input, distributions, capacity) for input in inputs], tolerance, max_iterations, sorm)
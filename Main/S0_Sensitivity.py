@@ -0,0 +1,146 @@
+# Import module numpy as np
+import numpy as np
+import time
+from types import SimpleNamespace
+
+from B0_Material import Material, get_material, material_attributes # From the Material script, import the Material class and the function that gives shared Material records
+from B0_Cross_section import Cross_section # From the Cross section script, import the Cross section class
+from B0_Load import Load_properties # From the Load script, import the Load properties class
+from B0_Creep_number import Creep_number # From the Creep Number script, import the Creep Number class
+from F1_SLS_Deflection import Deflection # From the SLS Deflection script, import the Deflection class
+from C1_ULS import ULS # From the ULS script, import the ULS class
+from D1_Reinforcement import Reinforcement_control # From the Reinforcement script, import the Reinforcement control class
+from E1_SLS_Crack import Crack_control # From the SLS Crack script, import the Crack control class
+from Q0_Dual import Dual, make_variables # From the Dual script, import the Dual class and the function that makes the variables
+
+''' This script contain the Sensitivity class that apply for ordinary reinforced cross section.
+The classes for cross section, load, creep, deflection, ULS, reinforcement and crack control are made with dual numbers
+instead of floats for the inputs, so the derivatives of all utilization degrees with respect to all inputs (the Jacobian)
+are found in one calculation, instead of calculating the Beam class two times for each input with finite differences.
+'''
+
+# Names of the inputs the derivatives are found for, as attributes in the Input class, and fck from the concrete class
+variables = ('width', 'height', 'nr_ordinary_reinforcement_bars', 'ordinary_reinforcement_diameter',
+             'distributed_selfload', 'distributed_liveload', 'fck')
+
+# Names of the utilization degrees, and the instance and attribute they are found in
+utilizations = {'M': ('ULS_instance', 'M_utilization'),
+                'V': ('ULS_instance', 'V_utilization'),
+                'As': ('reinforcement_instance', 'utilization'),
+                'Asw': ('reinforcement_instance', 'utilization_shear'),
+                'crack': ('crack_instance', 'utilization'),
+                'deflection': ('deflection_instance', 'utilization')}
+
+
+def get_dual_material(material, fck: Dual) -> SimpleNamespace:
+    ''' Function that makes a copy of a material record where the properties that depend on fck are dual numbers.
+    The values are the same as in table 3.1 in EC2, and the derivatives are found from the expressions the table is
+    based on, so the values are the same as for the Beam class.
+    Args:
+        material:  record from the Material class that contain all material properties
+        fck(Dual):  cylinder compression strength [N/mm2], with derivatives
+    Returns:
+        dual_material:  object with the same attributes as the Material class
+    '''
+    dual_material = SimpleNamespace(**{name: getattr(material, name) for name in material_attributes})
+
+    fcm = fck + 8 # From EC2 table 3.1
+    fctm = np.where(fck <= 50, 0.3 * fck ** (2/3), 2.12 * np.log(1 + fcm / 10)) # From EC2 table 3.1
+    Ecm = 22000 * (fcm / 10) ** 0.3 # From EC2 table 3.1
+
+    dual_material.fck = fck
+    dual_material.fcm = Dual(material.fcm, fcm.derivative)
+    dual_material.fctm = Dual(material.fctm, fctm.derivative)
+    dual_material.fctk_005 = Dual(material.fctk_005, 0.7 * fctm.derivative) # From EC2 table 3.1
+    dual_material.fctk_095 = Dual(material.fctk_095, 1.3 * fctm.derivative) # From EC2 table 3.1
+    dual_material.Ecm = Dual(material.Ecm, Ecm.derivative)
+    dual_material.lambda_factor = Material.calculate_lambda(dual_material, fck)
+    dual_material.netta_factor = Material.calculate_netta(dual_material, fck)
+    dual_material.fcd = fck * material.alfa_cc / material.gamma_concrete # From EC2 3.1.6(1)
+    dual_material.fctd = dual_material.fctk_005 * material.alfa_ct / material.gamma_concrete # From EC2 3.1.6(2)
+    return dual_material
+
+
+class Sensitivity:
+    ''' Class to contain the utilization degrees of an ordinary reinforced beam and their derivatives with respect to
+    the inputs in variables. The number of bars is treated as a continuous variable. The derivatives are found for the
+    formulas before the utilization degrees are rounded, and a check that changes from True to False (for instance
+    under- to over-reinforced) gives a jump that the derivatives do not show.
+    '''
+    def __init__(self, input):
+        '''Args:
+            input:  instance for Input class with all input defined by the user
+        Returns:
+            values(dict):  value of each variable
+            utilization(dict):  utilization degree for each name in utilizations [%], NaN if it is not found
+            jacobian(array):  derivatives of the utilization degrees, one row for each name in utilizations and one
+                              column for each variable [%/unit of the variable]
+            gradient(dict):  the same derivatives, as a dictionary for each utilization degree
+            wall_time(float):  time for the calculation [s]
+        Raises:
+            ValueError:  if the beam is prestressed
+        '''
+        if input.is_the_beam_prestressed:
+            raise ValueError('is_the_beam_prestressed=True, the sensitivity is only found for ordinary reinforced beams')
+        start = time.perf_counter()
+
+        material = get_material(input.concrete_class, float(input.steel_class[1:4]), input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter)
+        self.values = {name: getattr(input, name) for name in variables[:-1]}
+        self.values['fck'] = material.fck
+        width, height, nr_bars, bar_diameter, selfload, liveload, fck = make_variables(list(self.values.values()))
+
+        self.material_instance = get_dual_material(material, fck)
+        self.cross_section_instance = Cross_section(width, height, nr_bars, bar_diameter, input.stirrup_diameter, input.exposure_class,
+                                                    input.prestressed_reinforcment_diameter, input.nr_prestressed_bars, self.material_instance)
+        self.load_instance = Load_properties(selfload, liveload, input.beam_length, self.material_instance, self.cross_section_instance)
+        self.creep_instance = Creep_number(self.cross_section_instance, self.material_instance, input.selfload_application, input.liveload_application,
+                                           input.relative_humidity, input.cement_class)
+        self.deflection_instance = Deflection(self.cross_section_instance, self.material_instance, self.load_instance, self.creep_instance,
+                                              input.percent_longlasting_liveload, input.beam_length, input.relative_humidity, input.cement_class)
+        self.ULS_instance = ULS(self.cross_section_instance, self.material_instance, self.load_instance, input.shear_reinforcement)
+        self.reinforcement_instance = Reinforcement_control(self.cross_section_instance, self.material_instance, self.load_instance,
+                                                            self.ULS_instance, input.shear_reinforcement)
+        self.crack_instance = Crack_control(self.cross_section_instance, self.load_instance, self.material_instance, input.exposure_class,
+                                            self.creep_instance, bar_diameter)
+
+        self.utilization = {}
+        self.jacobian = np.full((len(utilizations), len(variables)), np.nan)
+        for row, (name, (instance, attribute)) in enumerate(utilizations.items()):
+            utilization = getattr(getattr(self, instance), attribute)
+            if utilization is None: # the crack utilization is None outside table 7.2N
+                self.utilization[name] = np.nan
+                continue
+            if isinstance(utilization, Dual):
+                self.utilization[name] = float(utilization.value)
+                self.jacobian[row] = utilization.derivative
+            else: # the utilization does not depend on any of the variables
+                self.utilization[name] = float(utilization)
+                self.jacobian[row] = 0
+        self.gradient = {name: dict(zip(variables, row)) for name, row in zip(utilizations, self.jacobian)}
+        self.wall_time = time.perf_counter() - start
+
+    def get_derivative(self, utilization: str, variable: str) -> float:
+        ''' Function that gives one derivative from the Jacobian
+        Args:
+            utilization(str):  name of the utilization degree, from utilizations
+            variable(str):  name of the variable, from variables
+        Returns:
+            derivative(float):  derivative of the utilization degree with respect to the variable [%/unit of the variable]
+        Raises:
+            ValueError:  if the utilization degree or the variable is unknown
+        '''
+        if utilization not in utilizations:
+            raise ValueError(f'utilization={utilization}, expected one of {", ".join(utilizations)}')
+        if variable not in variables:
+            raise ValueError(f'variable={variable}, expected one of {", ".join(variables)}')
+        return self.gradient[utilization][variable]
+
+
+def run_sensitivity(input) -> Sensitivity:
+    ''' Function that finds the utilization degrees and their derivatives for a beam
+    Args:
+        input:  instance for Input class with all input defined by the user
+    Returns:
+        sensitivity:  instance for the Sensitivity class
+    '''
+    return Sensitivity(input)
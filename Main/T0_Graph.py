@@ -0,0 +1,233 @@
+import time
+from copy import copy
+
+import A0_Results # From the Results script, import the Beam class and the classes for each reinforcement pattern
+from A0_Results import Beam
+
+''' This script contain the Beam graph class that apply for all reinforcement cases.
+The instances in the Beam class are nodes in a dependency graph, where each node knows the fields in the Input class
+and the other nodes it is made from. When some fields in the Input class are changed, only the nodes that depend on
+them, directly or through other nodes, are made again, in the same order as in the Beam class.
+'''
+
+# Fields in the Input class that decide which reinforcement pattern the beam has, and so which nodes the graph has
+pattern_fields = ('is_the_beam_prestressed', 'prestressed_and_ordinary_in_top')
+
+
+# Functions that make each node from the nodes before it in the beam and the fields in the input, with the same
+# arguments as in the Beam class
+
+def make_material(beam, input):
+    return A0_Results.get_material(input.concrete_class, (float(input.steel_class[1:4])), input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter)
+
+def make_cross_section(beam, input):
+    return A0_Results.Cross_section(input.width, input.height, input.nr_ordinary_reinforcement_bars, input.ordinary_reinforcement_diameter, input.stirrup_diameter,
+                                    input.exposure_class, input.prestressed_reinforcment_diameter, input.nr_prestressed_bars, beam.material_instance)
+
+def make_load(beam, input):
+    return A0_Results.Load_properties(input.distributed_selfload, input.distributed_liveload, input.beam_length, beam.material_instance, beam.cross_section_instance)
+
+def make_creep(beam, input):
+    return A0_Results.Creep_number(beam.cross_section_instance, beam.material_instance, input.selfload_application, input.liveload_application, input.relative_humidity, input.cement_class)
+
+def make_deflection_1(beam, input):
+    return A0_Results.Deflection(beam.cross_section_instance, beam.material_instance, beam.load_instance, beam.creep_instance, input.percent_longlasting_liveload,
+                                 input.beam_length, input.relative_humidity, input.cement_class)
+
+def make_ULS(beam, input):
+    return A0_Results.ULS(beam.cross_section_instance, beam.material_instance, beam.load_instance, input.shear_reinforcement)
+
+def make_reinforcement(beam, input):
+    return A0_Results.Reinforcement_control(beam.cross_section_instance, beam.material_instance, beam.load_instance, beam.ULS_instance, input.shear_reinforcement)
+
+def make_crack(beam, input):
+    return A0_Results.Crack_control(beam.cross_section_instance, beam.load_instance, beam.material_instance, input.exposure_class, beam.creep_instance, input.ordinary_reinforcement_diameter)
+
+def make_deflection(beam, input):
+    return beam.deflection_instance_1
+
+def make_stress_uncracked(beam, input):
+    return A0_Results.Uncracked_stress(beam.material_instance, beam.cross_section_instance, beam.load_instance)
+
+def make_time_effect(beam, input):
+    return A0_Results.time_effects(beam.material_instance, beam.cross_section_instance, beam.creep_instance, beam.stress_uncracked_instance, beam.deflection_instance_1, beam.load_instance)
+
+def make_deflection_prestressed(beam, input):
+    return A0_Results.Deflection_prestressed(beam.cross_section_instance, beam.material_instance, beam.load_instance, beam.creep_instance, input.percent_longlasting_liveload,
+                                             input.beam_length, input.relative_humidity, input.cement_class, beam.time_effect_instance)
+
+def make_stress_cracked(beam, input):
+    return A0_Results.Cracked_Stress(beam.material_instance, beam.cross_section_instance, beam.load_instance, beam.deflection_instance, beam.time_effect_instance, beam.creep_instance)
+
+def make_stress(beam, input):
+    return A0_Results.Stress(beam.material_instance, beam.deflection_instance, beam.stress_uncracked_instance, beam.stress_cracked_instance, beam.load_instance, beam.time_effect_instance)
+
+def make_ULS_prestressed(beam, input):
+    return A0_Results.ULS_prestressed(beam.material_instance, beam.load_instance, beam.cross_section_instance, beam.time_effect_instance, input.shear_reinforcement)
+
+def make_crack_prestressed(beam, input):
+    return A0_Results.Crack_control_prestressed(beam.cross_section_instance, beam.load_instance, beam.material_instance, input.exposure_class, beam.stress_instance, input.ordinary_reinforcement_diameter)
+
+def make_reinforcement_prestressed(beam, input):
+    return A0_Results.Reinforcement_control_prestressed(beam.cross_section_instance, beam.material_instance, beam.load_instance, beam.ULS_instance, input.shear_reinforcement)
+
+def make_stress_uncracked_and_ordinary(beam, input):
+    return A0_Results.Uncracked_stress_prestress_and_ordinary(beam.material_instance, beam.cross_section_instance, beam.load_instance, input.stirrup_diameter, input.ordinary_reinforcement_diameter)
+
+def make_ULS_prestress_and_ordinary(beam, input):
+    return A0_Results.ULS_prestress_and_ordinary(beam.material_instance, beam.load_instance, beam.cross_section_instance, beam.time_effect_instance, input.shear_reinforcement)
+
+
+# The nodes for each reinforcement pattern, in the order they are made in the Beam class. Each node is the name of the
+# attribute in the Beam class, and the function that makes it, the fields in the Input class and the nodes it is made from
+common_nodes = {'material_instance': (make_material, ('concrete_class', 'steel_class', 'prestressed_reinforcment_name', 'prestressed_reinforcment_diameter'), ()),
+                'cross_section_instance': (make_cross_section, ('width', 'height', 'nr_ordinary_reinforcement_bars', 'ordinary_reinforcement_diameter', 'stirrup_diameter',
+                                                                'exposure_class', 'prestressed_reinforcment_diameter', 'nr_prestressed_bars'), ('material_instance',)),
+                'load_instance': (make_load, ('distributed_selfload', 'distributed_liveload', 'beam_length'), ('material_instance', 'cross_section_instance')),
+                'creep_instance': (make_creep, ('selfload_application', 'liveload_application', 'relative_humidity', 'cement_class'), ('cross_section_instance', 'material_instance')),
+                'deflection_instance_1': (make_deflection_1, ('percent_longlasting_liveload', 'beam_length', 'relative_humidity', 'cement_class'),
+                                          ('cross_section_instance', 'material_instance', 'load_instance', 'creep_instance'))}
+
+ordinary_nodes = {'ULS_instance': (make_ULS, ('shear_reinforcement',), ('cross_section_instance', 'material_instance', 'load_instance')),
+                  'reinforcement_instance': (make_reinforcement, ('shear_reinforcement',), ('cross_section_instance', 'material_instance', 'load_instance', 'ULS_instance')),
+                  'crack_instance': (make_crack, ('exposure_class', 'ordinary_reinforcement_diameter'), ('cross_section_instance', 'load_instance', 'material_instance', 'creep_instance')),
+                  'deflection_instance': (make_deflection, (), ('deflection_instance_1',))}
+
+prestressed_nodes = {'stress_uncracked_instance': (make_stress_uncracked, (), ('material_instance', 'cross_section_instance', 'load_instance')),
+                     'time_effect_instance': (make_time_effect, (), ('material_instance', 'cross_section_instance', 'creep_instance', 'stress_uncracked_instance',
+                                                                     'deflection_instance_1', 'load_instance')),
+                     'deflection_instance': (make_deflection_prestressed, ('percent_longlasting_liveload', 'beam_length', 'relative_humidity', 'cement_class'),
+                                             ('cross_section_instance', 'material_instance', 'load_instance', 'creep_instance', 'time_effect_instance')),
+                     'stress_cracked_instance': (make_stress_cracked, (), ('material_instance', 'cross_section_instance', 'load_instance', 'deflection_instance',
+                                                                           'time_effect_instance', 'creep_instance')),
+                     'stress_instance': (make_stress, (), ('material_instance', 'deflection_instance', 'stress_uncracked_instance', 'stress_cracked_instance',
+                                                           'load_instance', 'time_effect_instance')),
+                     'ULS_instance': (make_ULS_prestressed, ('shear_reinforcement',), ('material_instance', 'load_instance', 'cross_section_instance', 'time_effect_instance')),
+                     'crack_instance': (make_crack_prestressed, ('exposure_class', 'ordinary_reinforcement_diameter'), ('cross_section_instance', 'load_instance',
+                                                                                                                    'material_instance', 'stress_instance')),
+                     'reinforcement_instance': (make_reinforcement_prestressed, ('shear_reinforcement',), ('cross_section_instance', 'material_instance',
+                                                                                                          'load_instance', 'ULS_instance'))}
+
+prestress_and_ordinary_nodes = {'stress_uncracked_instance': (make_stress_uncracked_and_ordinary, ('stirrup_diameter', 'ordinary_reinforcement_diameter'),
+                                                              ('material_instance', 'cross_section_instance', 'load_instance')),
+                                'time_effect_instance': prestressed_nodes['time_effect_instance'],
+                                'ULS_instance': (make_ULS_prestress_and_ordinary, ('shear_reinforcement',), ('material_instance', 'load_instance',
+                                                                                                            'cross_section_instance', 'time_effect_instance'))}
+
+# The controls, emissions and costs are made last, from all instances and the fields used for emissions and costs
+result_fields = ('concrete_class', 'width', 'height', 'beam_length', 'ordinary_reinforcement_diameter')
+
+
+def get_nodes(input) -> dict:
+    ''' Function that gives the nodes of the graph for the reinforcement pattern of the beam
+    Args:
+        input:  instance for Input class with all input defined by the user
+    Returns:
+        nodes(dict):  function, Input fields and nodes for each node, in the order they are made
+    '''
+    if input.is_the_beam_prestressed == True and input.prestressed_and_ordinary_in_top == True:
+        pattern_nodes = prestress_and_ordinary_nodes
+    elif input.is_the_beam_prestressed == True:
+        pattern_nodes = prestressed_nodes
+    else:
+        pattern_nodes = ordinary_nodes
+    nodes = {**common_nodes, **pattern_nodes}
+    nodes['results'] = (calculate_results, result_fields, tuple(nodes))
+    return nodes
+
+
+def calculate_results(beam, input):
+    ''' Function that sets the reinforcement pattern of the beam, and makes the controls, emissions and costs
+    Args:
+        beam:  instance for the Beam class, with all instances made
+        input:  instance for Input class with all input defined by the user
+    '''
+    beam.is_the_beam_prestressed = input.is_the_beam_prestressed == True
+    beam.prestressed_and_ordinary_in_top = beam.is_the_beam_prestressed and input.prestressed_and_ordinary_in_top == True
+    beam.calculate_results(input)
+
+
+class Beam_graph:
+    ''' Class to contain a Beam and the dependency graph of its instances, so the beam can be updated when fields in
+    the Input class are changed by only making the instances that depend on the changed fields again. The beam has
+    the same attributes as a Beam made from the same input.
+    '''
+    def __init__(self, input):
+        '''Args:
+            input:  instance for Input class with all input defined by the user, it is copied so it is not changed
+        Returns:
+            input:  copy of the input, with the changes from update
+            beam:  instance for the Beam class
+            nodes(dict):  function, Input fields and nodes for each node
+            recomputed(list):  names of the nodes made in the last calculation
+            timings(dict):  time for each node made in the last calculation [s]
+        '''
+        self.input = copy(input)
+        self.beam = object.__new__(Beam)
+        self.build()
+
+    def build(self):
+        ''' Function that makes the nodes for the reinforcement pattern of the input, and calculates all of them
+        '''
+        self.nodes = get_nodes(self.input)
+        self.dependents = {name: [] for name in self.nodes}
+        for name, (function, fields, dependencies) in self.nodes.items():
+            for dependency in dependencies:
+                self.dependents[dependency].append(name)
+        self.beam.__dict__.clear()
+        self.calculate(self.nodes)
+
+    def calculate(self, names):
+        ''' Function that makes the given nodes again, in the order of the graph
+        Args:
+            names:  names of the nodes to make
+        '''
+        self.recomputed, self.timings = [], {}
+        for name, (function, fields, dependencies) in self.nodes.items():
+            if name in names:
+                start = time.perf_counter()
+                value = function(self.beam, self.input)
+                if value is not None:
+                    setattr(self.beam, name, value)
+                self.timings[name] = time.perf_counter() - start
+                self.recomputed.append(name)
+
+    def get_affected_nodes(self, fields) -> set:
+        ''' Function that finds the nodes that depend on the given fields, directly or through other nodes
+        Args:
+            fields:  names of fields in the Input class
+        Returns:
+            names(set):  names of the nodes that must be made again
+        '''
+        fields = set(fields)
+        names = [name for name, (function, node_fields, dependencies) in self.nodes.items() if fields & set(node_fields)]
+        affected = set()
+        while names:
+            name = names.pop()
+            if name not in affected:
+                affected.add(name)
+                names.extend(self.dependents[name])
+        return affected
+
+    def update(self, **changes) -> list:
+        ''' Function that changes fields in the input and makes the nodes that depend on them again. If the reinforcement
+        pattern is changed, all nodes are made again.
+        Args:
+            changes:  new value for each field in the Input class that is changed
+        Returns:
+            recomputed(list):  names of the nodes that were made again, in the order they were made
+        Raises:
+            ValueError:  if a field is not in the Input class
+        '''
+        for field in changes:
+            if not hasattr(self.input, field):
+                raise ValueError(f'field={field}, the Input class has no field with this name')
+        changed = [field for field, value in changes.items() if getattr(self.input, field) != value]
+        for field in changed:
+            setattr(self.input, field, changes[field])
+
+        if set(changed) & set(pattern_fields):
+            self.build()
+        else:
+            self.calculate(self.get_affected_nodes(changed))
+        return self.recomputed
@@ -0,0 +1,189 @@
+# Import module numpy as np
+import numpy as np
+import time
+
+from K0_Batch import Beam_batch, input_fields, text_fields, bool_fields, result_fields # From the Beam batch script, import the Beam batch class and the names of all columns
+
+''' This script contain the Results store class that apply for all reinforcement cases.
+The inputs and results from the Beam batch class are written row by row to a file with a fixed structured NumPy dtype,
+one field for each input field, control, utilization, capacity, emission and cost. The file is a .npy file that is
+opened with np.memmap, so a sweep with many millions of beams can be written in batches and queried later in chunks,
+without having the whole file in memory.
+'''
+
+# Maximum number of characters in the text fields of the Input class
+text_length = 16
+
+# Results from the Beam batch class that are True or False, the other results are floats
+bool_results = ('is_the_beam_prestressed', 'prestressed_and_ordinary_in_top', 'M_control', 'V_control', 'As_control', 'Asw_control',
+                'crack_control', 'deflection_control', 'stress_control', 'alpha_found', 'passed')
+
+
+def get_field_type(name: str) -> str:
+    ''' Function that gives the type of one field in the store
+    Args:
+        name(str):  name of an input field or a result
+    Returns:
+        type(str):  NumPy type, text with fixed length, bool or float
+    '''
+    if name in text_fields:
+        return f'S{text_length}'
+    if name in bool_fields or name in bool_results:
+        return '?'
+    return '<f8'
+
+
+# The fixed structure of one row: all input fields, all results that are not input fields, and if the row is calculated
+store_fields = input_fields + tuple(name for name in result_fields if name not in input_fields) + ('calculated',)
+result_dtype = np.dtype([(name, get_field_type(name)) for name in store_fields[:-1]] + [('calculated', '?')])
+
+
+def encode_text(values: np.ndarray) -> np.ndarray:
+    ''' Function that makes a text column with fixed length, where None is written as empty text
+    Args:
+        values(array):  text column from the Beam batch class
+    Returns:
+        text(array):  column with fixed length text
+    Raises:
+        ValueError:  if a text is longer than text_length
+    '''
+    values = values.copy()
+    values[values == None] = ''
+    text = values.astype(f'U{text_length + 1}')
+    if np.any(np.char.str_len(text) > text_length):
+        raise ValueError(f'text={text[np.char.str_len(text) > text_length][0]}, texts can not be longer than {text_length} characters')
+    return text.astype(f'S{text_length}')
+
+
+class Results_store:
+    ''' Class to contain the rows of a results file, opened with np.memmap. A new file is made when the number of rows
+    is given, and an existing file is opened when it is not. Rows are written in batches with write_batch, and rows
+    that are not written yet have calculated=False. The rows are read in chunks, so the file can be bigger than the
+    memory.
+    '''
+    def __init__(self, path: str, size: int = None, mode: str = 'r'):
+        '''Args:
+            path(str):  path to the .npy file
+            size(int):  number of rows in a new file, or None to open an existing file
+            mode(str):  'r' to only read an existing file, or 'r+' to also write to it
+        Returns:
+            rows(memmap):  all rows, with the dtype result_dtype
+            size(int):  number of rows
+            position(int):  row where the next batch is written
+        Raises:
+            ValueError:  if the size is negative, the mode is unknown, or an existing file has another dtype
+        '''
+        if size is not None:
+            if size < 0:
+                raise ValueError(f'size={size}, expected a number of rows of at least 0')
+            self.rows = np.lib.format.open_memmap(path, mode='w+', dtype=result_dtype, shape=(int(size),))
+        else:
+            if mode not in ('r', 'r+'):
+                raise ValueError(f'mode={mode}, expected r or r+')
+            self.rows = np.load(path, mmap_mode=mode)
+            if self.rows.dtype != result_dtype:
+                raise ValueError(f'The file {path} does not have the fields of the Results store')
+        self.path = path
+        self.size = len(self.rows)
+        self.position = 0
+
+    def write(self, start: int, input, results: dict) -> int:
+        ''' Function that writes inputs and results to the rows from start
+        Args:
+            start(int):  first row to write
+            input:  namespace with one array for each field in the Input class, from the Beam batch class
+            results(dict):  one array for each name in result_fields
+        Returns:
+            stop(int):  the row after the last row that is written
+        Raises:
+            ValueError:  if the rows do not fit in the file
+        '''
+        stop = start + len(input.width)
+        if start < 0 or stop > self.size:
+            raise ValueError(f'rows {start} to {stop} do not fit in a store with {self.size} rows')
+        rows = self.rows[start:stop]
+        for name in input_fields:
+            rows[name] = encode_text(getattr(input, name)) if name in text_fields else getattr(input, name)
+        for name in store_fields[len(input_fields):-1]:
+            rows[name] = results[name]
+        rows['calculated'] = True
+        return stop
+
+    def write_batch(self, columns: dict, start: int = None, controls: bool = True) -> int:
+        ''' Function that calculates a batch of beams with the Beam batch class and writes the rows
+        Args:
+            columns(dict):  array or single value for each field in the Input class, as for the Beam batch class
+            start(int):  first row to write, as default the row after the last batch
+            controls(boolean):  if False, only emission and cost are calculated, as for the Beam batch class
+        Returns:
+            stop(int):  the row after the last row that is written
+        '''
+        batch = Beam_batch(columns, controls)
+        input = batch.get_columns(columns)
+        self.position = self.write(self.position if start is None else start, input, batch.get_results())
+        return self.position
+
+    def flush(self):
+        ''' Function that writes the changed rows to the file
+        '''
+        self.rows.flush()
+
+    def iterate_chunks(self, chunk_size: int = 10 ** 6):
+        ''' Function that gives the rows in chunks, so only one chunk at a time is read into memory
+        Args:
+            chunk_size(int):  number of rows in each chunk
+        Returns:
+            start(int):  first row of the chunk
+            chunk(array):  rows in the chunk
+        '''
+        for start in range(0, self.size, chunk_size):
+            yield start, np.asarray(self.rows[start:start + chunk_size])
+
+    def select(self, condition, fields: list = None, chunk_size: int = 10 ** 6) -> tuple:
+        ''' Function that finds the calculated rows where a condition is True
+        Args:
+            condition:  function that takes a chunk of rows and gives True or False for each row, for instance
+                        lambda rows: rows['M_utilization'] > 90
+            fields(list):  names of the fields to give back, as default all fields
+            chunk_size(int):  number of rows read at once
+        Returns:
+            index(array):  row numbers where the condition is True
+            rows(array):  the chosen fields for these rows
+        '''
+        empty = np.zeros(0, dtype=result_dtype)
+        indexes, selected = [np.zeros(0, dtype=np.int64)], [empty[fields] if fields else empty]
+        for start, chunk in self.iterate_chunks(chunk_size):
+            found = np.flatnonzero(chunk['calculated'] & np.asarray(condition(chunk), dtype=bool))
+            indexes.append(start + found)
+            selected.append(chunk[found][fields] if fields else chunk[found])
+        return np.concatenate(indexes), np.concatenate(selected)
+
+    def count(self, condition, chunk_size: int = 10 ** 6) -> int:
+        ''' Function that counts the calculated rows where a condition is True
+        Args:
+            condition:  function that takes a chunk of rows and gives True or False for each row
+            chunk_size(int):  number of rows read at once
+        Returns:
+            count(int):  number of rows
+        '''
+        return sum(int(np.count_nonzero(chunk['calculated'] & np.asarray(condition(chunk), dtype=bool)))
+                   for start, chunk in self.iterate_chunks(chunk_size))
+
+
+def write_sweep(path: str, batches, size: int, controls: bool = True) -> Results_store:
+    ''' Function that writes a sweep to a new results file, one batch at a time
+    Args:
+        path(str):  path to the .npy file
+        batches:  list or generator with columns for the Beam batch class, one dictionary for each batch
+        size(int):  total number of beams in all batches
+        controls(boolean):  if False, only emission and cost are calculated
+    Returns:
+        store:  instance for the Results store class, with wall_time(float) for the sweep [s]
+    '''
+    start = time.perf_counter()
+    store = Results_store(path, size)
+    for columns in batches:
+        store.write_batch(columns, controls=controls)
+    store.flush()
+    store.wall_time = time.perf_counter() - start
+    return store
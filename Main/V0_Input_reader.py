@@ -0,0 +1,304 @@
+# Import module numpy as np
+import numpy as np
+import csv
+import json
+import math
+import os
+import time
+from copy import copy
+from itertools import islice
+
+from A0_Input import Input # From the Input script, import the Input class (for the default values of all fields)
+from B0_Material import concrete_index, strand_index # From the Material script, import the rows of table 3.1 in EC2 and table 2 in EN10138-3
+from K0_Batch import Beam_batch, columns_from_inputs, input_fields, text_fields, bool_fields, result_fields # From the Beam batch script, import the Beam batch class and the names of all columns
+
+''' This script contain the Input reader and the Results writer classes that apply for all reinforcement cases.
+Beams are read from a CSV file or a JSON lines file (one JSON object on each line) with one beam on each row, where
+the columns are fields in the Input class. Fields that are not given get the value from the Input class. The file is
+read lazily, a chunk of rows at a time, and each chunk is evaluated with the Beam batch class and written to the
+results file before the next chunk is read, so files of any length are evaluated with constant memory.
+'''
+
+# File extensions for each file format
+file_formats = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# Names of the columns in the results file: all input fields, and all results that are not input fields
+output_fields = input_fields + tuple(name for name in result_fields if name not in input_fields)
+
+# Text that is read as True or False for the fields that are True or False
+true_texts = ('true', '1', 'yes')
+false_texts = ('false', '0', 'no')
+
+# Exposure classes and cement classes the calculation classes have values for
+exposure_classes = ('X0', 'XC1', 'XC2', 'XC3', 'XC4', 'XD1', 'XD2', 'XD3', 'XS1', 'XS2', 'XS3')
+cement_classes = ('R', 'N', 'S')
+
+
+def get_file_format(path: str) -> str:
+    ''' Function that finds the file format from the file extension
+    Args:
+        path(str):  path to the file
+    Returns:
+        file_format(str):  'csv' or 'jsonl'
+    Raises:
+        ValueError:  if the extension is not .csv, .jsonl or .ndjson
+    '''
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in file_formats:
+        raise ValueError(f'path={path}, expected a file ending with {", ".join(file_formats)}')
+    return file_formats[extension]
+
+
+def convert_value(field: str, value, line: int):
+    ''' Function that checks and converts one value to the type of the field in the Input class
+    Args:
+        field(str):  name of the field in the Input class
+        value:  value from the file, text from a CSV file or a JSON value
+        line(int):  line number in the file, for the error message
+    Returns:
+        value:  text, None, True/False or float
+    Raises:
+        ValueError:  if the value can not be converted to the type of the field
+    '''
+    if field in text_fields:
+        if value == 'None':
+            return None
+        if not isinstance(value, str):
+            raise ValueError(f'line {line}: {field}={value!r}, expected text')
+        return value
+    if field in bool_fields:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.strip().lower() in true_texts + false_texts:
+            return value.strip().lower() in true_texts
+        raise ValueError(f'line {line}: {field}={value!r}, expected True or False')
+    if isinstance(value, bool):
+        raise ValueError(f'line {line}: {field}={value!r}, expected a number')
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'line {line}: {field}={value!r}, expected a number') from None
+    if not math.isfinite(value):
+        raise ValueError(f'line {line}: {field}={value!r}, expected a finite number')
+    return value
+
+
+def make_input(row: dict, line: int = 1, default: Input = None) -> Input:
+    ''' Function that makes an Input instance from one row, with the default values for fields that are not given
+    Args:
+        row(dict):  value for each field in the row
+        line(int):  line number in the file, for the error messages
+        default:  instance for the Input class with the default values, as default Input()
+    Returns:
+        input:  instance for the Input class
+    Raises:
+        ValueError:  if a field is not in the Input class, a value has the wrong type, or a text field has a value
+                     that do not exist
+    '''
+    unknown = [field for field in row if field not in input_fields]
+    if unknown:
+        raise ValueError(f'line {line}: there is no input field called {unknown[0]}')
+    input = copy(Input() if default is None else default)
+    for field, value in row.items():
+        if value is None or value == '': # an empty value gives the default value
+            continue
+        setattr(input, field, convert_value(field, value, line))
+    check_input(input, line)
+    return input
+
+
+def check_input(input: Input, line: int = 1):
+    ''' Function that checks that the text fields of an input have values the calculation classes have tables for,
+    so a wrong row is found when the file is read, and not when the chunk it is in is evaluated
+    Args:
+        input:  instance for the Input class
+        line(int):  line number in the file, for the error message
+    Raises:
+        ValueError:  if the concrete class, exposure class, cement class, steel class or the strand of a prestressed
+                     beam do not exist
+    '''
+    if input.concrete_class not in concrete_index:
+        raise ValueError(f'line {line}: concrete_class={input.concrete_class!r}, expected a concrete class in table 3.1 in EC2')
+    if input.exposure_class not in exposure_classes:
+        raise ValueError(f'line {line}: exposure_class={input.exposure_class!r}, expected one of {", ".join(exposure_classes)}')
+    if input.cement_class not in cement_classes:
+        raise ValueError(f'line {line}: cement_class={input.cement_class!r}, expected one of {", ".join(cement_classes)}')
+    if not (isinstance(input.steel_class, str) and input.steel_class[1:4].isdigit()):
+        raise ValueError(f'line {line}: steel_class={input.steel_class!r}, expected a steel class on the form B500NC')
+    if input.is_the_beam_prestressed and strand_index.get((input.prestressed_reinforcment_name, input.prestressed_reinforcment_diameter),
+                                                          strand_index.get(input.prestressed_reinforcment_name)) is None:
+        raise ValueError(f'line {line}: prestressed_reinforcment_name={input.prestressed_reinforcment_name!r} with '
+                         f'prestressed_reinforcment_diameter={input.prestressed_reinforcment_diameter}, expected a strand in table 2 in EN10138-3')
+
+
+class Input_reader:
+    ''' Class to read beams from a CSV or JSON lines file, one row at a time. Iterating over the reader gives one
+    instance of the Input class for each row, and read_chunks gives columns for the Beam batch class.
+    '''
+    def __init__(self, path: str, file_format: str = None):
+        '''Args:
+            path(str):  path to the file
+            file_format(str):  'csv' or 'jsonl', as default found from the file extension
+        Returns:
+            rows_read(int):  number of rows read so far
+        Raises:
+            ValueError:  if the file format is unknown
+        '''
+        if file_format is None:
+            file_format = get_file_format(path)
+        if file_format not in ('csv', 'jsonl'):
+            raise ValueError(f'file_format={file_format}, expected csv or jsonl')
+        self.path = path
+        self.file_format = file_format
+        self.rows_read = 0
+        self.default = Input()
+
+    def read_rows(self):
+        ''' Function that reads the rows of the file lazily
+        Returns:
+            line(int):  line number in the file
+            row(dict):  value for each column in the row
+        Raises:
+            ValueError:  if a row in a JSON lines file is not a JSON object
+        '''
+        with open(self.path, newline='', encoding='utf-8') as file:
+            if self.file_format == 'csv':
+                reader = csv.DictReader(file)
+                for row in reader:
+                    yield reader.line_num, row
+            else:
+                for line, text in enumerate(file, start=1):
+                    if not text.strip():
+                        continue
+                    try:
+                        row = json.loads(text)
+                    except json.JSONDecodeError as error:
+                        raise ValueError(f'line {line}: {error.msg}') from None
+                    if not isinstance(row, dict):
+                        raise ValueError(f'line {line}: expected a JSON object with fields of the Input class')
+                    yield line, row
+
+    def make_input(self, line: int, row: dict) -> Input:
+        ''' Function that makes an Input instance from one row, with the default values for fields that are not given
+        Args:
+            line(int):  line number in the file
+            row(dict):  value for each column in the row
+        Returns:
+            input:  instance for the Input class
+        '''
+        return make_input(row, line, self.default)
+
+    def __iter__(self):
+        for line, row in self.read_rows():
+            self.rows_read += 1
+            yield self.make_input(line, row)
+
+    def read_chunks(self, chunk_size: int = 10 ** 4):
+        ''' Function that reads the file in chunks of rows
+        Args:
+            chunk_size(int):  number of rows in each chunk
+        Returns:
+            inputs(list):  instances of the Input class for the rows in the chunk
+            columns(dict):  one array for each field in the Input class, for the Beam batch class
+        '''
+        rows = iter(self)
+        while True:
+            inputs = list(islice(rows, chunk_size))
+            if not inputs:
+                return
+            yield inputs, columns_from_inputs(inputs)
+
+
+class Results_writer:
+    ''' Class to write the inputs and results to a CSV or JSON lines file, one chunk at a time. The file is written
+    to after each chunk, so rows that are written are not kept in memory.
+    '''
+    def __init__(self, path: str, file_format: str = None, fields: tuple = output_fields):
+        '''Args:
+            path(str):  path to the file
+            file_format(str):  'csv' or 'jsonl', as default found from the file extension
+            fields(tuple):  names of the input fields and results that are written
+        Returns:
+            rows_written(int):  number of rows written so far
+        Raises:
+            ValueError:  if the file format is unknown
+        '''
+        self.file_format = get_file_format(path) if file_format is None else file_format
+        if self.file_format not in ('csv', 'jsonl'):
+            raise ValueError(f'file_format={self.file_format}, expected csv or jsonl')
+        self.path = path
+        self.fields = fields
+        self.rows_written = 0
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        if self.file_format == 'csv':
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(fields)
+
+    def get_column(self, column: np.ndarray) -> list:
+        ''' Function that makes a list of the values in a column, where NaN and None are written as an empty value
+        in a CSV file and as null in a JSON lines file
+        Args:
+            column(array):  column with inputs or results
+        Returns:
+            values(list):  values in the column
+        '''
+        column = np.asarray(column)
+        empty = '' if self.file_format == 'csv' else None
+        if column.dtype.kind == 'f':
+            return np.where(np.isnan(column), empty, column.astype(object)).tolist()
+        if column.dtype.kind == 'O':
+            return np.where(column == None, empty, column).tolist()
+        return column.tolist()
+
+    def write_chunk(self, columns: dict):
+        ''' Function that writes one row for each beam in a chunk
+        Args:
+            columns(dict):  one array for each name in fields
+        '''
+        values = [self.get_column(columns[name]) for name in self.fields]
+        if self.file_format == 'csv':
+            self.writer.writerows(zip(*values))
+        else:
+            self.file.writelines(json.dumps(dict(zip(self.fields, row))) + '\n' for row in zip(*values))
+        self.rows_written += len(values[0]) if values else 0
+        self.file.flush()
+
+    def close(self):
+        ''' Function that closes the file
+        '''
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+
+def evaluate_file(input_path: str, output_path: str, chunk_size: int = 10 ** 4, controls: bool = True) -> dict:
+    ''' Function that reads beams from a file, evaluates them with the Beam batch class one chunk at a time, and
+    writes the inputs and results to another file
+    Args:
+        input_path(str):  path to the CSV or JSON lines file with beams
+        output_path(str):  path to the CSV or JSON lines file for the results
+        chunk_size(int):  number of beams read and evaluated at once
+        controls(boolean):  if False, only emission and cost are calculated, as for the Beam batch class
+    Returns:
+        summary(dict):  number of beams, number of beams that passed all checks, and time used [s]
+    Raises:
+        ValueError:  if a row in the file is wrong, with the line number. The results file is then removed.
+    '''
+    start = time.perf_counter()
+    reader = Input_reader(input_path)
+    passed = 0
+    try:
+        with Results_writer(output_path) as writer:
+            for inputs, columns in reader.read_chunks(chunk_size):
+                results = Beam_batch(columns, controls).get_results()
+                writer.write_chunk({**columns, **results})
+                passed += int(np.count_nonzero(results['passed']))
+    except Exception:
+        if os.path.exists(output_path): # a results file with only some of the beams is removed
+            os.remove(output_path)
+        raise
+    return {'beams': writer.rows_written, 'passed': passed, 'wall_time': time.perf_counter() - start}
@@ -0,0 +1,217 @@
+import time
+import tracemalloc
+from functools import wraps
+from importlib import import_module
+
+''' This script contain the Profiler and Profile classes that apply for all reinforcement cases.
+While a Profiler is active, the classes that Beam.__init__ makes instances of are replaced with functions that
+measure the wall time, the number of calls and, if chosen, the memory allocated for each instance, and the original
+classes are put back when the Profiler stops. The Beam class itself is not changed, so when no Profiler is active
+there is no extra work at all. The measurements are collected in a Profile, that can be added together for a sweep.
+'''
+
+# Each stage is the attribute in the Beam class, and the script and name of the class or function that makes it.
+# The Beam class reads the classes for all reinforcement patterns from the Results script, and imports the rest
+# from their own script when the beam needs them.
+stages = (('material_instance', 'A0_Results', 'get_material'),
+          ('cross_section_instance', 'A0_Results', 'Cross_section'),
+          ('load_instance', 'A0_Results', 'Load_properties'),
+          ('creep_instance', 'A0_Results', 'Creep_number'),
+          ('deflection_instance_1', 'A0_Results', 'Deflection'),
+          ('stress_uncracked_instance', 'H2_SLS_Uncracked', 'Uncracked_stress'),
+          ('stress_uncracked_instance', 'H3_SLS_Uncracked', 'Uncracked_stress_prestress_and_ordinary'),
+          ('time_effect_instance', 'J2_Time_effects', 'time_effects'),
+          ('deflection_instance', 'F2_SLS_Deflection', 'Deflection_prestressed'),
+          ('stress_cracked_instance', 'G2_SLS_Cracked', 'Cracked_Stress'),
+          ('stress_instance', 'I2_SLS_Stress', 'Stress'),
+          ('ULS_instance', 'C1_ULS', 'ULS'),
+          ('ULS_instance', 'C2_ULS', 'ULS_prestressed'),
+          ('ULS_instance', 'C3_ULS', 'ULS_prestress_and_ordinary'),
+          ('reinforcement_instance', 'D1_Reinforcement', 'Reinforcement_control'),
+          ('reinforcement_instance', 'D2_Reinforcement', 'Reinforcement_control_prestressed'),
+          ('crack_instance', 'E1_SLS_Crack', 'Crack_control'),
+          ('crack_instance', 'E2_SLS_Crack', 'Crack_control_prestressed'))
+
+# Names of the measurements for each stage in a Profile
+measurements = ('calls', 'time', 'self_time', 'max_time', 'allocated', 'peak')
+
+# The Profiler that is active, only one can be active at a time
+active_profiler = None
+
+
+class Profile:
+    ''' Class to contain the measurements for each stage, added together over all beams that are measured
+    '''
+    def __init__(self, report: dict = None):
+        '''Args:
+            report(dict):  measurements from get_report to start from, as default no measurements
+        Returns:
+            stages(dict):  for each stage, the number of calls, the total time [s], the time without the stages it
+                           calls itself [s], the longest call [s], the net allocated memory [bytes] and the largest
+                           peak memory of one call [bytes]. Memory is 0 if it is not measured.
+        '''
+        self.stages = {}
+        if report:
+            self.add_report(report)
+
+    def add_call(self, stage: str, elapsed: float, self_time: float, allocated: int = 0, peak: int = 0):
+        ''' Function that adds the measurements of one call of a stage
+        Args:
+            stage(str):  name of the stage
+            elapsed(float):  time for the call [s]
+            self_time(float):  time for the call without the stages it calls [s]
+            allocated(int):  net allocated memory after the call [bytes]
+            peak(int):  peak memory during the call, above the memory when it started [bytes]
+        '''
+        values = self.stages.setdefault(stage, dict.fromkeys(measurements, 0))
+        values['calls'] += 1
+        values['time'] += elapsed
+        values['self_time'] += self_time
+        values['max_time'] = max(values['max_time'], elapsed)
+        values['allocated'] += allocated
+        values['peak'] = max(values['peak'], peak)
+
+    def add_report(self, report: dict):
+        ''' Function that adds the measurements from another profile, for instance from another process in a sweep
+        Args:
+            report(dict):  measurements from get_report
+        '''
+        for stage, other in report.items():
+            values = self.stages.setdefault(stage, dict.fromkeys(measurements, 0))
+            for name in ('calls', 'time', 'self_time', 'allocated'):
+                values[name] += other[name]
+            for name in ('max_time', 'peak'):
+                values[name] = max(values[name], other[name])
+
+    def get_report(self) -> dict:
+        ''' Function that gives the measurements, sorted with the stage that used the most time without the stages
+        it calls first, with the mean time for each call and the share of the total time
+        Returns:
+            report(dict):  measurements for each stage
+        '''
+        total = sum(values['self_time'] for values in self.stages.values())
+        report = {}
+        for stage, values in sorted(self.stages.items(), key=lambda item: - item[1]['self_time']):
+            report[stage] = {**values, 'mean_time': values['time'] / values['calls'],
+                             'share': values['self_time'] / total if total > 0 else 0.0}
+        return report
+
+    def print_report(self):
+        ''' Function that prints the measurements as a table
+        '''
+        print(f'{"stage":<28}{"calls":>10}{"total [ms]":>14}{"self [ms]":>14}{"mean [us]":>12}{"share":>8}{"allocated [kB]":>16}{"peak [kB]":>12}')
+        for stage, values in self.get_report().items():
+            print(f'{stage:<28}{values["calls"]:>10}{values["time"] * 10 ** 3:>14.2f}{values["self_time"] * 10 ** 3:>14.2f}'
+                  f'{values["mean_time"] * 10 ** 6:>12.2f}{values["share"]:>8.1%}{values["allocated"] / 1024:>16.1f}{values["peak"] / 1024:>12.1f}')
+
+
+class Profiler:
+    ''' Class to measure the stages of the Beam class while it is active, used as a context manager:
+        with Profiler() as profiler:
+            beam = Beam(input)
+        profiler.profile.print_report()
+    The stage "Beam" is the whole Beam.__init__, and "results" is the controls, emissions and costs at the end.
+    '''
+    def __init__(self, memory: bool = False, profile: Profile = None):
+        '''Args:
+            memory(boolean):  if True, the allocated memory is measured with tracemalloc, which makes the beams slower
+            profile:  instance for the Profile class the measurements are added to, as default a new Profile
+        Returns:
+            profile:  instance for the Profile class with the measurements
+        '''
+        self.memory = memory
+        self.profile = Profile() if profile is None else profile
+        self.originals = []
+        self.stack = []
+
+    def measure(self, stage: str, function):
+        ''' Function that makes a function that measures each call of a class or function as one stage
+        Args:
+            stage(str):  name of the stage
+            function:  class or function to measure
+        Returns:
+            measured_function:  function with the same arguments, that gives the same result
+        '''
+        @wraps(function)
+        def measured_function(*args, **kwargs):
+            if self.memory:
+                if self.stack:
+                    self.stack[-1][3] = max(self.stack[-1][3], tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+            # Start time, memory at the start, time used by the stages it calls, and highest peak memory seen
+            frame = [time.perf_counter(), tracemalloc.get_traced_memory()[0] if self.memory else 0, 0.0, 0]
+            self.stack.append(frame)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - frame[0]
+                self.stack.pop()
+                allocated = peak = 0
+                if self.memory:
+                    current, peak = tracemalloc.get_traced_memory()
+                    peak = max(frame[3], peak)
+                    allocated, peak = current - frame[1], peak - frame[1]
+                    if self.stack:
+                        self.stack[-1][3] = max(self.stack[-1][3], frame[1] + peak)
+                if self.stack:
+                    self.stack[-1][2] += elapsed
+                self.profile.add_call(stage, elapsed, elapsed - frame[2], allocated, peak)
+        return measured_function
+
+    def replace(self, owner, name: str, stage: str):
+        ''' Function that replaces an attribute with a measured version, and remembers the original
+        Args:
+            owner:  script or class with the attribute
+            name(str):  name of the attribute
+            stage(str):  name of the stage
+        '''
+        original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+        self.originals.append((owner, name, original))
+        setattr(owner, name, self.measure(stage, original))
+
+    def __enter__(self) -> 'Profiler':
+        ''' Function that starts the measurements
+        Raises:
+            ValueError:  if another Profiler is active
+        '''
+        global active_profiler
+        if active_profiler is not None:
+            raise ValueError('Another Profiler is active, only one Profiler can measure the Beam class at a time')
+        from A0_Results import Beam
+        active_profiler = self
+        if self.memory:
+            self.started_tracemalloc = not tracemalloc.is_tracing()
+            if self.started_tracemalloc:
+                tracemalloc.start()
+        for stage, module, name in stages:
+            self.replace(import_module(module), name, stage)
+        self.replace(Beam, '__init__', 'Beam')
+        self.replace(Beam, 'calculate_results', 'results')
+        return self
+
+    def __exit__(self, *exception):
+        ''' Function that stops the measurements, and puts the original classes and functions back
+        '''
+        global active_profiler
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+        self.originals = []
+        if self.memory and self.started_tracemalloc:
+            tracemalloc.stop()
+        active_profiler = None
+
+
+def profile_beams(inputs, memory: bool = False) -> Profile:
+    ''' Function that makes the Beam class for each input while a Profiler is active
+    Args:
+        inputs:  list, generator or other iterable with instances of the Input class
+        memory(boolean):  if True, the allocated memory is measured
+    Returns:
+        profile:  instance for the Profile class with the measurements
+    '''
+    from A0_Results import Beam
+
+    with Profiler(memory) as profiler:
+        for input in inputs:
+            Beam(input)
+    return profiler.profile
@@ -0,0 +1,302 @@
+# Import module numpy as np
+import numpy as np
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+from V0_Input_reader import make_input # From the Input reader script, import the function that checks a beam and makes an Input instance
+
+''' This script contain the Service class that apply for all reinforcement cases.
+The service is a small HTTP server on localhost that takes beams as JSON and answers with the results as JSON, so other
+programs can use the beam checks without importing the scripts. Requests that arrive within a few milliseconds of each
+other are collected to one batch, evaluated with the Beam batch class in a pool of workers, and answered one by one.
+Only the Python standard library and NumPy are used, so the service works without internet.
+
+    POST /beam    a JSON object with fields of the Input class, answered with the results for the beam
+    POST /beams   a JSON list of such objects, answered with a list of results
+    GET  /stats   number of requests, beams and batches, latency (p50 and p99) and throughput
+    GET  /health  answers {"status": "ok"}
+'''
+
+# Largest request body that is read [bytes]
+max_body_size = 10 ** 7
+
+
+def evaluate_inputs(inputs: list) -> list:
+    ''' Function that evaluates a batch of beams with the Beam batch class. Runs in the worker. If the batch can not
+    be evaluated, for instance because one beam has a concrete class that does not exist, each beam is evaluated alone
+    so only the wrong beams get an error.
+    Args:
+        inputs(list):  instances of the Input class
+    Returns:
+        results(list):  for each beam, a dictionary with the results, or with the key "error" and the error message
+    '''
+    from K0_Batch import Beam_batch, columns_from_inputs # Imported in the worker, so the worker only needs the scripts when a batch is evaluated
+
+    try:
+        with np.errstate(all='ignore'):
+            results = Beam_batch(columns_from_inputs(inputs)).get_results()
+    except (ValueError, KeyError, ZeroDivisionError, TypeError) as error:
+        if len(inputs) == 1:
+            return [{'error': str(error)}]
+        return [result for input in inputs for result in evaluate_inputs([input])]
+    columns = {name: [None if isinstance(value, float) and math.isnan(value) else value for value in column.tolist()]
+               for name, column in results.items()}
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+class Batcher:
+    ''' Class to collect beams from requests that arrive close in time into one batch. A batch is evaluated when the
+    first beam in it has waited max_delay, or when it has max_batch_size beams.
+    '''
+    def __init__(self, executor, max_delay: float = 0.005, max_batch_size: int = 1024):
+        '''Args:
+            executor:  pool of workers the batches are evaluated in
+            max_delay(float):  longest time a beam waits for more beams before the batch is evaluated [s]
+            max_batch_size(int):  largest number of beams in one batch
+        Returns:
+            batches(int):  number of batches evaluated
+            beams(int):  number of beams evaluated
+        Raises:
+            ValueError:  if max_delay is negative or max_batch_size is less than 1
+        '''
+        if max_delay < 0:
+            raise ValueError(f'max_delay={max_delay}, expected a time of at least 0')
+        if max_batch_size < 1:
+            raise ValueError(f'max_batch_size={max_batch_size}, expected at least 1')
+        self.executor = executor
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.queue = []
+        self.timer = None
+        self.tasks = set()
+        self.batches = 0
+        self.beams = 0
+
+    async def evaluate(self, input) -> dict:
+        ''' Function that adds a beam to the next batch, and waits for its results
+        Args:
+            input:  instance for the Input class
+        Returns:
+            result(dict):  results for the beam, or the key "error" with the error message
+        '''
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.queue.append((input, future))
+        if len(self.queue) >= self.max_batch_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    def flush(self):
+        ''' Function that sends the beams that are waiting to the workers as one batch
+        '''
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.queue = self.queue, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self.run_batch(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def run_batch(self, batch: list):
+        ''' Function that evaluates one batch in a worker, and gives each request its results
+        Args:
+            batch(list):  input and future for each beam
+        '''
+        self.batches += 1
+        self.beams += len(batch)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, evaluate_inputs, [input for input, future in batch])
+        except Exception as error:
+            for input, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (input, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class Service:
+    ''' Class to contain the HTTP service, the batcher and the statistics
+    '''
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, workers: int = 1, max_delay: float = 0.005,
+                 max_batch_size: int = 1024, processes: bool = True, history: int = 10 ** 5):
+        '''Args:
+            host(str):  address the service listens on, as default only this machine
+            port(int):  port the service listens on, 0 gives a free port
+            workers(int):  number of workers the batches are evaluated in
+            max_delay(float):  longest time a beam waits for more beams before the batch is evaluated [s]
+            max_batch_size(int):  largest number of beams in one batch
+            processes(boolean):  if True the workers are processes, if False threads
+            history(int):  number of the latest requests used for the latency percentiles
+        Returns:
+            latencies(deque):  time from a request is read until it is answered, for the latest requests [s]
+            requests(int):  number of requests answered
+            errors(int):  number of requests answered with an error
+        '''
+        self.host = host
+        self.port = port
+        self.executor = ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+        self.batcher = Batcher(self.executor, max_delay, max_batch_size)
+        self.latencies = deque(maxlen=history)
+        self.requests = 0
+        self.errors = 0
+        self.start_time = time.perf_counter()
+        self.server = None
+
+    def get_stats(self) -> dict:
+        ''' Function that gives the counters, latency and throughput of the service
+        Returns:
+            stats(dict):  requests, errors, beams and batches so far, mean batch size, latency p50 and p99 for the
+                          latest requests [ms], and requests and beams per second since the service started
+        '''
+        uptime = time.perf_counter() - self.start_time
+        latencies = np.array(self.latencies) * 10 ** 3
+        p50, p99 = np.percentile(latencies, [50, 99]).tolist() if len(latencies) else (None, None)
+        return {'requests': self.requests, 'errors': self.errors, 'beams': self.batcher.beams, 'batches': self.batcher.batches,
+                'mean_batch_size': self.batcher.beams / self.batcher.batches if self.batcher.batches else None,
+                'latency_p50_ms': p50, 'latency_p99_ms': p99, 'uptime_s': uptime,
+                'requests_per_s': self.requests / uptime, 'beams_per_s': self.batcher.beams / uptime}
+
+    async def evaluate_beam(self, row) -> tuple:
+        ''' Function that checks one beam from a request and evaluates it
+        Args:
+            row:  JSON object with fields of the Input class
+        Returns:
+            status(HTTPStatus):  OK, or BAD_REQUEST if the beam is wrong
+            result(dict):  results for the beam, or the key "error" with the error message
+        '''
+        if not isinstance(row, dict):
+            return HTTPStatus.BAD_REQUEST, {'error': 'expected a JSON object with fields of the Input class'}
+        try:
+            input = make_input(row)
+        except ValueError as error:
+            return HTTPStatus.BAD_REQUEST, {'error': str(error).removeprefix('line 1: ')}
+        result = await self.batcher.evaluate(input)
+        return (HTTPStatus.BAD_REQUEST if 'error' in result else HTTPStatus.OK), result
+
+    async def route(self, method: str, path: str, body: bytes) -> tuple:
+        ''' Function that answers one request
+        Args:
+            method(str):  HTTP method
+            path(str):  path in the request
+            body(bytes):  body of the request
+        Returns:
+            status(HTTPStatus):  status of the answer
+            payload:  JSON value of the answer
+        '''
+        path = path.split('?')[0]
+        if method == 'GET' and path == '/health':
+            return HTTPStatus.OK, {'status': 'ok'}
+        if method == 'GET' and path == '/stats':
+            return HTTPStatus.OK, self.get_stats()
+        if path not in ('/beam', '/beams'):
+            return HTTPStatus.NOT_FOUND, {'error': f'{path} is not found, use /beam, /beams, /stats or /health'}
+        if method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'error': f'{method} is not allowed for {path}, use POST'}
+        try:
+            request = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            return HTTPStatus.BAD_REQUEST, {'error': f'the body is not JSON: {error}'}
+        if path == '/beam':
+            return await self.evaluate_beam(request)
+        if not isinstance(request, list):
+            return HTTPStatus.BAD_REQUEST, {'error': 'expected a JSON list of objects with fields of the Input class'}
+        answers = await asyncio.gather(*(self.evaluate_beam(row) for row in request))
+        status = HTTPStatus.OK if all(status == HTTPStatus.OK for status, result in answers) else HTTPStatus.BAD_REQUEST
+        return status, [result for status, result in answers]
+
+    async def handle_connection(self, reader, writer):
+        ''' Function that reads the requests on one connection and writes the answers. The connection is kept open
+        for more requests, as in HTTP/1.1, until the client closes it or asks to close it.
+        Args:
+            reader:  asyncio stream the requests are read from
+            writer:  asyncio stream the answers are written to
+        '''
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                start = time.perf_counter()
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, separator, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > max_body_size:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': f'the body can not be longer than {max_body_size} bytes'}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self.route(method, path, body)
+                    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+                content = json.dumps(payload).encode()
+                writer.write(f'{version} {status.value} {status.phrase}\r\nContent-Type: application/json\r\n'
+                             f'Content-Length: {len(content)}\r\nConnection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode() + content)
+                await writer.drain()
+                self.requests += 1
+                self.errors += status != HTTPStatus.OK
+                self.latencies.append(time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        ''' Function that starts the workers, and then starts listening for requests. The workers are started first
+        so they do not get a copy of the open connections when the processes are forked.
+        '''
+        await asyncio.get_running_loop().run_in_executor(self.executor, evaluate_inputs, [])
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.start_time = time.perf_counter()
+
+    async def stop(self):
+        ''' Function that stops listening, and stops the workers
+        '''
+        self.server.close()
+        await self.server.wait_closed()
+        self.executor.shutdown()
+
+    async def serve_forever(self):
+        ''' Function that starts the service and answers requests until it is stopped
+        '''
+        await self.start()
+        print(f'Listening on http://{self.host}:{self.port}')
+        try:
+            await self.server.serve_forever()
+        finally:
+            self.executor.shutdown()
+
+
+def run_service(host: str = '127.0.0.1', port: int = 8765, workers: int = 1, max_delay: float = 0.005, max_batch_size: int = 1024):
+    ''' Function that runs the service until it is stopped with Ctrl+C
+    Args:
+        host(str):  address the service listens on, as default only this machine
+        port(int):  port the service listens on
+        workers(int):  number of worker processes
+        max_delay(float):  longest time a beam waits for more beams before the batch is evaluated [s]
+        max_batch_size(int):  largest number of beams in one batch
+    '''
+    service = Service(host, port, workers, max_delay, max_batch_size)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,216 @@
+import glob
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+
+from K0_Batch import input_fields # From the Beam batch script, import the names of all fields in the Input class
+
+''' This script contain the Beam cache class that apply for all reinforcement cases.
+Optimizers and user interfaces often ask for the same beam again. The cache finds a key from the values of all fields
+in the Input class, so two inputs with the same values get the same key no matter how they were made, and keeps the
+Beam for each key. Beams are first kept in memory, where the least recently used are removed when there are too many
+or they are too old, and can also be kept in an SQLite file, so other processes and later runs get the same beams
+without calculating them again. The key also contains a hash of all scripts in this folder, so beams in the file are
+not used when the formulas, or the scripts that collect the results, are changed.
+'''
+
+# Scripts the cached values may depend on. All scripts are included, since the Beam class and the Beam record also
+# use the Beam batch and other scripts. If one of them is changed, the beams in a cache file are not used.
+calculation_scripts = '*.py'
+
+
+def get_code_version() -> str:
+    ''' Function that finds a hash of all scripts in this folder
+    Returns:
+        version(str):  hash of the names and text of the scripts
+    '''
+    version = hashlib.blake2b(digest_size=8)
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), calculation_scripts))):
+        version.update(os.path.basename(path).encode())
+        with open(path, 'rb') as file:
+            version.update(file.read())
+    return version.hexdigest()
+
+
+def get_canonical_value(value):
+    ''' Function that gives one value on the same form no matter how it was given, so 4, 4.0 and np.float64(4) get
+    the same key. True/False, text and None are kept as they are, all other values are made to floats.
+    Args:
+        value:  value of a field in the Input class
+    Returns:
+        value:  True/False, text, None or float
+    '''
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    value = float(value)
+    return 0.0 if value == 0 else value # -0.0 and 0.0 give the same key
+
+
+def get_input_key(input, version: str = '') -> str:
+    ''' Function that finds the key of an input, from the values of all fields in the Input class
+    Args:
+        input:  instance for the Input class
+        version(str):  text that is added to the key, for instance the code version and what is calculated
+    Returns:
+        key(str):  hash of the values
+    '''
+    values = tuple(get_canonical_value(getattr(input, field)) for field in input_fields)
+    return hashlib.blake2b(repr((version, values)).encode(), digest_size=16).hexdigest() # repr gives each float exactly
+
+
+class Beam_cache:
+    ''' Class to keep the beams that are calculated, with the key of their input. Beams that are found in the cache
+    are the same instances each time they are asked for, so they must not be changed.
+        cache = Beam_cache('beams.sqlite')
+        beam = cache.evaluate(input)
+    '''
+    def __init__(self, path: str = None, max_size: int = 10 ** 4, ttl: float = None, calculate=None):
+        '''Args:
+            path(str):  path to an SQLite file that keeps the beams between processes and runs, as default only memory
+            max_size(int):  largest number of beams kept in memory
+            ttl(float):  time a beam is kept before it is calculated again [s], as default until it is removed
+            calculate:  class or function that makes the value from an input, as default the Beam class
+        Returns:
+            memory(OrderedDict):  value and time it was kept for each key, with the least recently used first
+            version(str):  code version and name of calculate, added to each key
+            memory_hits(int):  number of values found in memory
+            disk_hits(int):  number of values found in the file
+            misses(int):  number of values calculated
+            evictions(int):  number of values removed from memory because there were too many
+            expirations(int):  number of values removed because they were too old
+        Raises:
+            ValueError:  if max_size is less than 0 or ttl is not more than 0
+        '''
+        if max_size < 0:
+            raise ValueError(f'max_size={max_size}, expected a number of beams of at least 0')
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f'ttl={ttl}, expected a time of more than 0 or None')
+        if calculate is None:
+            from A0_Results import Beam
+            calculate = Beam
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.calculate = calculate
+        self.version = f'{get_code_version()}:{calculate.__module__}.{calculate.__qualname__}'
+        self.memory = OrderedDict()
+        self.memory_hits = self.disk_hits = self.misses = self.evictions = self.expirations = 0
+        self.connection = None
+        if path is not None:
+            self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+            self.connection.execute('PRAGMA journal_mode=WAL') # so many processes can read while one writes
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS beams (key TEXT PRIMARY KEY, value BLOB NOT NULL, created REAL NOT NULL)')
+
+    def get_key(self, input) -> str:
+        ''' Function that finds the key of an input in this cache
+        Args:
+            input:  instance for the Input class
+        Returns:
+            key(str):  hash of the values of the input and the version
+        '''
+        return get_input_key(input, self.version)
+
+    def add_to_memory(self, key: str, value, created: float):
+        ''' Function that keeps a value in memory, and removes the least recently used values if there are too many
+        Args:
+            key(str):  key of the input
+            value:  value to keep
+            created(float):  time the value was calculated, from time.time() [s]
+        '''
+        self.memory[key] = (value, created)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+            self.evictions += 1
+
+    def lookup(self, key: str):
+        ''' Function that finds a value in memory or in the file
+        Args:
+            key(str):  key of the input
+        Returns:
+            value:  the value that is kept, or None if it is not found or too old
+        '''
+        now = time.time()
+        if key in self.memory:
+            value, created = self.memory[key]
+            if self.ttl is None or now - created < self.ttl:
+                self.memory.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            del self.memory[key]
+            self.expirations += 1
+
+        if self.connection is not None:
+            row = self.connection.execute('SELECT value, created FROM beams WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                if self.ttl is None or now - row[1] < self.ttl:
+                    value = pickle.loads(row[0])
+                    self.add_to_memory(key, value, row[1])
+                    self.disk_hits += 1
+                    return value
+                self.connection.execute('DELETE FROM beams WHERE key = ?', (key,))
+                self.expirations += 1
+        return None
+
+    def store(self, key: str, value):
+        ''' Function that keeps a value in memory and in the file
+        Args:
+            key(str):  key of the input
+            value:  value to keep
+        '''
+        created = time.time()
+        self.add_to_memory(key, value, created)
+        if self.connection is not None:
+            self.connection.execute('INSERT OR REPLACE INTO beams (key, value, created) VALUES (?, ?, ?)',
+                                    (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), created))
+
+    def evaluate(self, input):
+        ''' Function that gives the beam for an input from the cache, or calculates and keeps it if it is not found
+        Args:
+            input:  instance for the Input class
+        Returns:
+            value:  instance for the Beam class, or what calculate gives
+        '''
+        key = self.get_key(input)
+        value = self.lookup(key)
+        if value is None:
+            self.misses += 1
+            value = self.calculate(input)
+            self.store(key, value)
+        return value
+
+    def get_stats(self) -> dict:
+        ''' Function that gives the number of hits and misses
+        Returns:
+            stats(dict):  hits in memory and in the file, misses, share of hits, evictions, expirations, and number
+                          of values in memory and in the file
+        '''
+        hits = self.memory_hits + self.disk_hits
+        return {'memory_hits': self.memory_hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'hit_rate': hits / (hits + self.misses) if hits + self.misses else None,
+                'evictions': self.evictions, 'expirations': self.expirations, 'memory_size': len(self.memory),
+                'disk_size': self.connection.execute('SELECT COUNT(*) FROM beams').fetchone()[0] if self.connection is not None else None}
+
+    def clear(self):
+        ''' Function that removes all values from memory and from the file
+        '''
+        self.memory.clear()
+        if self.connection is not None:
+            self.connection.execute('DELETE FROM beams')
+
+    def close(self):
+        ''' Function that closes the file
+        '''
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
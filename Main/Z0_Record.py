@@ -0,0 +1,138 @@
+# Import module numpy as np
+import numpy as np
+
+from K0_Batch import result_fields # From the Beam batch script, import the names of all result columns
+from U0_Results_store import bool_results # From the Results store script, import the names of the results that are True or False
+
+''' This script contain the Beam record class that apply for all reinforcement cases.
+A Beam keeps all the instances it makes (material, cross section, load, creep number, deflection, ULS, ...), each
+with its own attributes, so a few thousand beams use megabytes of memory. A Beam record keeps only the results: the
+controls, utilization degrees, capacities, emissions and costs, with the same names and values as the result columns
+of the Beam batch class. The record can not be changed, and has no __dict__, so it uses a small part of the memory.
+For millions of beams, the records can be collected in a structured NumPy array with one row for each beam.
+'''
+
+# Names of the results in a Beam record, the same as the result columns of the Beam batch class
+record_fields = result_fields
+
+# Structure of one row with the results of one beam
+record_dtype = np.dtype([(name, '?' if name in bool_results else '<f8') for name in record_fields])
+
+
+class Beam_record:
+    ''' Class to contain the results of one beam. Controls that do not apply for the reinforcement case are False
+    and results that are not calculated are NaN, as in the Beam batch class.
+    '''
+    __slots__ = record_fields
+
+    def __init__(self, *values):
+        '''Args:
+            values:  one value for each name in record_fields, in the same order
+        Returns:
+            One attribute for each name in record_fields
+        Raises:
+            ValueError:  if the number of values is not the number of fields
+        '''
+        if len(values) != len(record_fields):
+            raise ValueError(f'{len(values)} values, expected one value for each of the {len(record_fields)} fields in record_fields')
+        for name, value in zip(record_fields, values):
+            object.__setattr__(self, name, np.nan if value != value else value) # all NaN are the same object, so equal records are equal
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f'The Beam record can not be changed, {name} is read only')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'The Beam record can not be changed, {name} is read only')
+
+    def __reduce__(self):
+        return (Beam_record, self.get_values())
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Beam_record) and self.get_values() == other.get_values()
+
+    def __hash__(self) -> int:
+        return hash(self.get_values())
+
+    def __repr__(self) -> str:
+        return f'Beam_record({", ".join(f"{name}={getattr(self, name)!r}" for name in record_fields)})'
+
+    def get_values(self) -> tuple:
+        ''' Function that gives the values of all fields
+        Returns:
+            values(tuple):  one value for each name in record_fields
+        '''
+        return tuple(getattr(self, name) for name in record_fields)
+
+    def as_dict(self) -> dict:
+        ''' Function that gives the values of all fields with their names
+        Returns:
+            results(dict):  value for each name in record_fields
+        '''
+        return dict(zip(record_fields, self.get_values()))
+
+
+def get_value(name: str, value):
+    ''' Function that gives a result as a Python bool or float, so the record do not keep NumPy scalars. Where the
+    Beam class gives None or a message instead of a result, for instance when the stress is outside table 7.2N in EC2,
+    a control is False and a number is NaN, as in the Beam batch class.
+    Args:
+        name(str):  name of the result
+        value:  result from the Beam class
+    Returns:
+        value:  True/False for controls, float for the other results
+    '''
+    if name in bool_results:
+        return isinstance(value, (bool, np.bool_)) and bool(value)
+    if value is None or isinstance(value, str):
+        return np.nan
+    return float(value)
+
+
+def make_record(beam) -> Beam_record:
+    ''' Function that collects the results of a Beam in a Beam record
+    Args:
+        beam:  instance for the Beam class
+    Returns:
+        record:  instance for the Beam record class
+    '''
+    uls, load = beam.ULS_instance, beam.load_instance
+    results = dict.fromkeys(record_fields, np.nan) # controls that are not calculated are made False by get_value
+    results.update({'is_the_beam_prestressed': beam.is_the_beam_prestressed, 'prestressed_and_ordinary_in_top': beam.prestressed_and_ordinary_in_top,
+                    'M_Rd': uls.M_Rd, 'M_Ed': getattr(uls, 'M_Ed', load.M_Ed), 'M_control': uls.M_control, 'M_utilization': uls.M_utilization,
+                    'V_Rd': uls.V_Rd, 'V_Ed': load.V_Ed, 'V_control': uls.V_control, 'V_utilization': uls.V_utilization,
+                    'concrete_emission': beam.concrete_emission, 'ordinary_reinforcement_emission': beam.ordinary_reinforcement_emission,
+                    'prestressed_reinforcement_emission': getattr(beam, 'prestressed_reinforcement_emission', 0.0),
+                    'total_emission': beam.total_emission, 'cost_concrete': beam.cost_concrete,
+                    'cost_reinforcement': getattr(beam, 'cost_reinforcement', np.nan), 'total_cost': getattr(beam, 'total_cost', np.nan)})
+
+    # Prestressed beams with ordinary reinforcement in top only have the ULS checks
+    if not (beam.is_the_beam_prestressed and beam.prestressed_and_ordinary_in_top):
+        reinforcement, crack, deflection = beam.reinforcement_instance, beam.crack_instance, beam.deflection_instance
+        results.update({'As_control': reinforcement.control, 'As_utilization': reinforcement.utilization,
+                        'Asw_control': reinforcement.Asw_control, 'Asw_utilization': reinforcement.utilization_shear,
+                        'crack_control': crack.control_bar_diameter, 'crack_utilization': crack.utilization,
+                        'max_bar_diameter': crack.max_bar_diameter, 'bar_diameter_flag': crack.table_flag,
+                        'deflection_control': deflection.control, 'deflection_utilization': deflection.utilization,
+                        'total_deflection': deflection.total_deflection})
+    if beam.is_the_beam_prestressed and not beam.prestressed_and_ordinary_in_top:
+        results.update({'stress_control': beam.stress_instance.control, 'alpha_found': beam.stress_cracked_instance.alpha_found})
+
+    results = {name: get_value(name, value) for name, value in results.items()}
+    if beam.prestressed_and_ordinary_in_top:
+        checks = ('M_control', 'V_control')
+    elif beam.is_the_beam_prestressed:
+        checks = ('M_control', 'V_control', 'As_control', 'Asw_control', 'crack_control', 'deflection_control', 'stress_control')
+    else:
+        checks = ('M_control', 'V_control', 'As_control', 'Asw_control', 'crack_control', 'deflection_control')
+    results['passed'] = all(results[name] for name in checks)
+    return Beam_record(*(results[name] for name in record_fields))
+
+
+def records_to_array(records) -> np.ndarray:
+    ''' Function that collects Beam records in a structured array, with one row for each beam
+    Args:
+        records:  list, generator or other iterable with instances of the Beam record class
+    Returns:
+        rows(array):  one row for each record, with the dtype record_dtype
+    '''
+    return np.array([record.get_values() for record in records], dtype=record_dtype)